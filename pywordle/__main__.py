@@ -0,0 +1,12 @@
+"""Allow running the game with ``python -m pywordle``"""
+
+import os
+import sys
+
+# The game modules import each other as top level packages (models, gui, ...),
+# as they do when pywordle/main.py is run directly
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from main import run  # noqa: E402
+
+run()
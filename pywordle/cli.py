@@ -1,23 +1,76 @@
+import json
 import sys
-from typing import Optional
+from typing import Any, Iterable, Optional, TextIO
+from models.board import KEY_ABSENT, KEY_CORRECT, KEY_PRESENT
 from models.game import Game
 from models.letter import Letter
+from models.modes import mode_name, new_game
+
+KEYBOARD_ROWS = ["qwertyuiop", "asdfghjkl", "zxcvbnm"]
+# Result lines collected before each write in batch mode
+BATCH_WRITE_LINES = 4096
 
 
 class WordleCLI:
-    def __init__(self):
-        self.game = Game()
+    def __init__(
+        self,
+        boards: int = 1,
+        hard_mode: bool = False,
+        absurdle: bool = False,
+        stats: Any = None,
+    ):
+        self.game = new_game(boards, hard_mode, absurdle)
+        self.mode = mode_name(boards, hard_mode, absurdle)
+        # A stats.StatsStore recording finished games, if any
+        self.stats = stats
         self.attempts = 0
-        self.max_attempts = 6
+        self.max_attempts = self.game.max_attempts
+
+    @property
+    def multi_board(self) -> bool:
+        return len(self.game.boards) > 1
+
+    def board_label(self, index: int) -> str:
+        return f"{index + 1:>2}: " if self.multi_board else ""
 
     def display_board(self) -> None:
         """Display the current state of the game board"""
         print("\n" + "=" * 30)
         # print the status of each guess
-        for guess in self.game.board.guesses:
-            self.display_guess_result(guess.letters)
+        for index, board in enumerate(self.game.boards):
+            if self.multi_board and index:
+                print()
+            for guess in board.guesses:
+                self.display_guess_result(guess.letters, self.board_label(index))
         print("=" * 30 + "\n")
 
+    def display_changed_boards(self) -> None:
+        """Display the latest guess on just the boards it was played on"""
+        changed = self.game.changed if self.multi_board else [0]
+        for index in changed:
+            board = self.game.boards[index]
+            label = self.board_label(index)
+            self.display_guess_result(board.guesses[-1].letters, label)
+            if board.won and self.multi_board:
+                print(f"{label}solved!")
+
+    def display_keyboard(self) -> None:
+        """Display the letters coloured by what the guesses so far revealed"""
+        key_status = self.game.key_status
+        for indent, row in enumerate(KEYBOARD_ROWS):
+            keys = []
+            for letter in row:
+                status = key_status[ord(letter) - 97]
+                if status == KEY_CORRECT:
+                    keys.append(self.display_letter_status(letter, True, False))
+                elif status == KEY_PRESENT:
+                    keys.append(self.display_letter_status(letter, False, True))
+                elif status == KEY_ABSENT:
+                    keys.append(self.display_letter_status(letter, False, False))
+                else:
+                    keys.append(letter.upper())
+            print(" " * indent + " ".join(keys))
+
     def get_valid_guess(self) -> Optional[str]:
         """Get a valid guess from the user"""
         while True:
@@ -30,10 +83,19 @@ class WordleCLI:
                 print("Guess must be 5 letters long!")
                 continue
 
-            if not guess.isalpha():
+            if not (guess.isascii() and guess.isalpha()):
                 print("Guess must contain only letters!")
                 continue
 
+            if not self.game.is_allowed(guess):
+                print("Not in word list!")
+                continue
+
+            reason = self.game.hard_mode_violation(guess)
+            if reason is not None:
+                print(f"{reason}!")
+                continue
+
             return guess
 
     def display_letter_status(
@@ -47,46 +109,155 @@ class WordleCLI:
         else:
             return f"\033[90m{letter.upper()}\033[0m"  # Gray
 
-    def display_guess_result(self, guess: list[Letter]) -> None:
+    def display_guess_result(self, guess: list[Letter], label: str = "") -> None:
         """Display the result of a guess with colored output"""
         result = []
         for letter in guess:
             result.append(self.display_letter_status(str(letter), letter.is_correct, letter.is_present))
-        print(" ".join(result))
+        print(label + " ".join(result))
 
     def play(self) -> None:
         """Main game loop"""
         print("\nWelcome to Wordle!")
         print("Type 'quit' to exit the game")
-        print(f"You have {self.game.max_attempts} attempts to guess the 5-letter word\n")
+        if self.multi_board:
+            print(
+                f"You have {self.game.max_attempts} attempts to guess "
+                f"{len(self.game.boards)} 5-letter words at once\n"
+            )
+            self.display_board()
+        else:
+            print(f"You have {self.game.max_attempts} attempts to guess the 5-letter word\n")
 
         while not self.game.game_over:
-            self.display_board()
+            # Every board is shown in full once; after that only the boards a
+            # guess changed are printed
+            if not self.multi_board:
+                self.display_board()
+            self.display_keyboard()
 
             guess = self.get_valid_guess()
             if guess is None:
-                print(f"\nYou quit! The word was: {self.game.answer.upper()}")
+                print(f"\nYou quit! {self.answer_text()}")
                 break
 
             try:
                 self.game.make_guess(guess)
-                self.display_guess_result(self.game.board.guesses[-1].letters)
+                self.display_changed_boards()
 
                 if self.game.won:
-                    print(f"\nCongratulations! You won in {len(self.game.board.guesses)} attempts!")
+                    print(f"\nCongratulations! You won in {self.game.attempts} attempts!")
                     break
 
             except ValueError as e:
                 print(f"Error: {e}")
                 continue
 
-        print(f"\nGame Over! The word was: {self.game.answer.upper()}")
+        print(f"\nGame Over! {self.answer_text()}")
+        if self.stats is not None and self.game.game_over:
+            self.stats.record(self.game, self.mode)
+            self.display_stats()
+
+    def display_stats(self) -> None:
+        """Display the headline stats and guess distribution for this mode"""
+        from stats import format_summary
+
+        summary = self.stats.summary(self.mode)
+        print(f"\n{format_summary(summary)}")
+        distribution = summary["distribution"]
+        most = max(distribution, default=0)
+        for attempts, count in enumerate(distribution, 1):
+            bar = "#" * (count * 20 // most) if most else ""
+            print(f"{attempts:>2}: {bar} {count}")
+
+    def answer_text(self) -> str:
+        answers = ", ".join(self.game.answers).upper()
+        return f"The words were: {answers}" if self.multi_board else f"The word was: {answers}"
+
+
+def batch_word(value: object, kind: str) -> str:
+    """A word from a batch request, lowercased, or ValueError if it isn't one"""
+    word = str(value).strip().lower()
+    if len(word) != 5 or not (word.isascii() and word.isalpha()):
+        raise ValueError(f"Invalid {kind} {word!r}")
+    return word
+
+
+def play_batch_game(request: dict, reveal_answer: bool = False) -> dict:
+    """Play one scripted game from a batch request.
+
+    The request holds ``guesses`` and optionally the ``answer`` (random if
+    left out), ``hard`` for hard mode, an ``id`` echoed back and ``reveal`` to
+    include the answer.
+    """
+    answer = request.get("answer")
+    if answer is not None:
+        answer = batch_word(answer, "answer")
+    game = Game(answer, track_candidates=False, hard_mode=bool(request.get("hard")))
+    guesses = request.get("guesses", [])
+    if not isinstance(guesses, list):
+        raise ValueError("guesses must be a list")
+    for word in guesses:
+        word = batch_word(word, "guess")
+        if not game.is_allowed(word):
+            raise ValueError(f"Not in word list: {word}")
+        game.make_guess(word)
+    result = {
+        "ok": True,
+        "patterns": [guess.pattern for guess in game.board.guesses],
+        "won": game.won,
+        "game_over": game.game_over,
+    }
+    if reveal_answer or request.get("reveal"):
+        result["answer"] = game.answer
+    return result
+
+
+def play_batch(lines: Iterable[str], output: TextIO, reveal_answer: bool = False) -> int:
+    """Play a game per JSON line, writing a JSON result line for each.
+
+    Results are written in blocks rather than line by line, and a bad line
+    gets an error result instead of stopping the batch. Returns the number of
+    games played.
+    """
+    games = 0
+    pending = []
+    for line in lines:
+        if not line.strip():
+            continue
+        request = {}
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("Request must be a JSON object")
+            result = play_batch_game(request, reveal_answer)
+        except ValueError as e:
+            result = {"ok": False, "error": str(e)}
+        if isinstance(request, dict) and "id" in request:
+            result["id"] = request["id"]
+        pending.append(json.dumps(result) + "\n")
+        games += 1
+        if len(pending) >= BATCH_WRITE_LINES:
+            output.writelines(pending)
+            pending.clear()
+    output.writelines(pending)
+    output.flush()
+    return games
+
+
+def batch_main(path: str = "-", reveal_answer: bool = False) -> None:
+    """Entry point for ``--batch``, reading from a file or ``-`` for stdin"""
+    if path == "-":
+        play_batch(sys.stdin, sys.stdout, reveal_answer)
+        return
+    with open(path) as lines:
+        play_batch(lines, sys.stdout, reveal_answer)
 
 
-def main():
+def main(boards: int = 1, hard_mode: bool = False, absurdle: bool = False, stats: Any = None):
     """Entry point for the CLI game"""
     try:
-        cli = WordleCLI()
+        cli = WordleCLI(boards, hard_mode, absurdle, stats)
         cli.play()
     except KeyboardInterrupt:
         print("\nGame interrupted by user")
@@ -94,4 +265,7 @@ def main():
     except Exception as e:
         print(f"\nAn error occurred: {e}")
         sys.exit(1)
+    finally:
+        if stats is not None:
+            stats.close()
         
@@ -0,0 +1,227 @@
+"""Precomputed decision tree of best guesses.
+
+The tree is expanded once over the answer list: every node holds a guess and
+one edge per feedback pattern that guess can get, leading to the node for the
+answers left. It is stored as flat arrays in a single file:
+
+    header   magic, version, node count, edge count
+    guesses  uint32[nodes]      packed guess word (see models.lexicon)
+    starts   uint32[nodes + 1]  first edge of each node
+    children uint32[edges]      node each edge leads to
+    patterns uint8[edges]       pattern code of each edge, sorted per node
+
+Loading maps the file and views the arrays in place, so nothing is parsed or
+copied however large the tree is.
+"""
+
+import argparse
+import mmap
+import os
+import shutil
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Sequence
+
+import numpy as np
+
+from models.board import Board
+from models.game import WORD_LIST, allowed_words
+from models.lexicon import pack_letters, pack_word, unpack_word
+from models.pattern_matrix import word_lists_key
+from models.patterns import encode_words
+from simulate import ALL_CORRECT, SimulationContext, best_entropy_row
+
+MAGIC = b"PWDT"
+VERSION = 1
+HEADER = struct.Struct("<4sIII")
+
+
+class FlatTree:
+    """A decision tree as flat arrays, nodes numbered in depth first order"""
+
+    def __init__(self, guesses: np.ndarray, starts: np.ndarray, children: np.ndarray, patterns: np.ndarray):
+        self.guesses = guesses
+        self.starts = starts
+        self.children = children
+        self.patterns = patterns
+
+    @classmethod
+    def from_nodes(cls, nodes: list[tuple[int, list[tuple[int, int]]]]) -> "FlatTree":
+        """Build from (guess code, [(pattern, child)]) tuples"""
+        starts = np.zeros(len(nodes) + 1, dtype=np.uint32)
+        np.cumsum([len(edges) for _, edges in nodes], out=starts[1:])
+        edges = [edge for _, node_edges in nodes for edge in node_edges]
+        return cls(
+            np.array([guess for guess, _ in nodes], dtype=np.uint32),
+            starts,
+            np.array([child for _, child in edges], dtype=np.uint32),
+            np.array([pattern for pattern, _ in edges], dtype=np.uint8),
+        )
+
+    @classmethod
+    def join(cls, root_guess: int, subtrees: dict[int, "FlatTree"]) -> "FlatTree":
+        """Hang subtrees, keyed by pattern, off a new root node"""
+        patterns = sorted(subtrees)
+        guesses = [np.array([root_guess], dtype=np.uint32)]
+        starts = [np.array([0, len(patterns)], dtype=np.uint32)]
+        children = [np.zeros(len(patterns), dtype=np.uint32)]
+        edge_patterns = [np.array(patterns, dtype=np.uint8)]
+        node_offset, edge_offset = 1, len(patterns)
+        for i, pattern in enumerate(patterns):
+            subtree = subtrees[pattern]
+            children[0][i] = node_offset
+            guesses.append(subtree.guesses)
+            starts.append(subtree.starts[1:] + edge_offset)
+            children.append(subtree.children + node_offset)
+            edge_patterns.append(subtree.patterns)
+            node_offset += len(subtree.guesses)
+            edge_offset += len(subtree.patterns)
+        return cls(*(np.concatenate(parts) for parts in (guesses, starts, children, edge_patterns)))
+
+    def save(self, path: str | Path) -> None:
+        """Write the tree file, replacing any existing one atomically"""
+        path = Path(path)
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, len(self.guesses), len(self.patterns)))
+            for array in (self.guesses, self.starts, self.children, self.patterns):
+                f.write(array.tobytes())
+        os.replace(tmp, path)
+
+    def save_npz(self, path: Path) -> None:
+        tmp = path.with_name(path.name + ".tmp.npz")
+        np.savez(tmp, guesses=self.guesses, starts=self.starts, children=self.children, patterns=self.patterns)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load_npz(cls, path: Path) -> "FlatTree":
+        with np.load(path) as data:
+            return cls(data["guesses"], data["starts"], data["children"], data["patterns"])
+
+
+def expand(context: SimulationContext, packed: np.ndarray, candidates: np.ndarray) -> FlatTree:
+    """Expand the subtree for a set of candidate answer columns"""
+    nodes: list[tuple[int, list[tuple[int, int]]]] = []
+    stack = [(candidates, None)]
+    while stack:
+        candidates, parent = stack.pop()
+        row = best_entropy_row(context, candidates)
+        index = len(nodes)
+        nodes.append((int(packed[row]), []))
+        if parent is not None:
+            nodes[parent[0]][1].append((parent[1], index))
+        codes = context.matrix[row, candidates]
+        groups = [(int(code), candidates[codes == code]) for code in np.unique(codes) if code != ALL_CORRECT]
+        # Pushed in reverse so children are numbered in pattern order
+        for code, group in reversed(groups):
+            stack.append((group, (index, code)))
+    return FlatTree.from_nodes(nodes)
+
+
+_worker_context: tuple[SimulationContext, np.ndarray] | None = None
+
+
+def _init_worker(guesses: list[str], answers: list[str]) -> None:
+    global _worker_context
+    context = SimulationContext.load(guesses, answers)
+    _worker_context = (context, pack_letters(encode_words(context.guesses)))
+
+
+def _build_part(candidates: np.ndarray, part: Path) -> None:
+    context, packed = _worker_context
+    expand(context, packed, candidates).save_npz(part)
+
+
+def build_tree(
+    path: str | Path,
+    guesses: Sequence[str] | None = None,
+    answers: Sequence[str] | None = None,
+    workers: int = 1,
+) -> FlatTree:
+    """Build the tree for the word lists and save it to ``path``.
+
+    Below the first guess every feedback group is expanded as its own job in
+    a process pool and checkpointed to ``<path>.parts``. Rerunning an
+    interrupted build only expands the groups without a checkpoint.
+    """
+    guesses = allowed_words() if guesses is None else list(guesses)
+    answers = WORD_LIST if answers is None else list(answers)
+    path = Path(path)
+    parts_dir = path.with_name(path.name + ".parts")
+    parts_dir.mkdir(parents=True, exist_ok=True)
+
+    _init_worker(guesses, answers)
+    context, packed = _worker_context
+    candidates = np.arange(len(answers))
+    root = best_entropy_row(context, candidates)
+    codes = context.matrix[root, candidates]
+    groups = {int(code): candidates[codes == code] for code in np.unique(codes) if code != ALL_CORRECT}
+    key = word_lists_key(guesses, answers)
+    parts = {code: parts_dir / f"{key}-{code}.npz" for code in groups}
+    todo = [code for code in groups if not parts[code].exists()]
+
+    if workers <= 1:
+        for code in todo:
+            _build_part(groups[code], parts[code])
+    else:
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(guesses, answers)) as executor:
+            for future in [executor.submit(_build_part, groups[code], parts[code]) for code in todo]:
+                future.result()
+
+    tree = FlatTree.join(int(packed[root]), {code: FlatTree.load_npz(part) for code, part in parts.items()})
+    tree.save(path)
+    shutil.rmtree(parts_dir)
+    return tree
+
+
+class DecisionTree:
+    """A saved decision tree, memory-mapped for lookups"""
+
+    def __init__(self, path: str | Path):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, nodes, edges = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} decision tree")
+        offset = HEADER.size
+        arrays = []
+        for dtype, count in ((np.uint32, nodes), (np.uint32, nodes + 1), (np.uint32, edges), (np.uint8, edges)):
+            arrays.append(np.frombuffer(self._mmap, dtype=dtype, count=count, offset=offset))
+            offset += arrays[-1].nbytes
+        self.tree = FlatTree(*arrays)
+
+    def __len__(self) -> int:
+        return len(self.tree.guesses)
+
+    def node_for(self, board: Board) -> int | None:
+        """Node reached by the board's guesses, or None if they left the tree"""
+        tree = self.tree
+        node = 0
+        for guess in board.guesses:
+            if tree.guesses[node] != pack_word(str(guess)):
+                return None
+            start, stop = tree.starts[node], tree.starts[node + 1]
+            i = start + np.searchsorted(tree.patterns[start:stop], guess.pattern)
+            if i == stop or tree.patterns[i] != guess.pattern:
+                return None
+            node = int(tree.children[i])
+        return node
+
+    def next_guess(self, board: Board) -> str | None:
+        """The tree's next guess for a board, or None if it has no answer"""
+        node = self.node_for(board)
+        if node is None or board.won:
+            return None
+        return unpack_word(int(self.tree.guesses[node]))
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("output", help="file to write the tree to")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+
+
+def main(args: argparse.Namespace) -> None:
+    """Entry point for ``python -m pywordle build-tree``"""
+    tree = build_tree(args.output, workers=args.workers)
+    print(f"Wrote {len(tree.guesses)} nodes to {args.output}")
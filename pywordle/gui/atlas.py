@@ -0,0 +1,85 @@
+"""Pre-rendered tile surfaces for the Wordle GUI"""
+
+import string
+from typing import Optional, Tuple
+
+import pygame
+from gui.constants import (
+    BLACK,
+    WHITE,
+    GRAY,
+    YELLOW,
+    GREEN,
+    DARK_GRAY,
+    CELL_SIZE,
+    CELL_MARGIN,
+)
+
+TILE_COLORS = (GRAY, DARK_GRAY, YELLOW, GREEN)
+BUTTON_LABELS = {"ENTER": "ENTER", "BACKSPACE": "BACK"}
+
+
+class TileAtlas:
+    """Every letter in every tile colour, plus the blank tiles and the
+    ENTER/BACK buttons, composited once so drawing a frame is only blits"""
+
+    def __init__(
+        self,
+        font: pygame.font.Font,
+        cell_size: int = CELL_SIZE,
+        button_width: int = CELL_SIZE * 2 + CELL_MARGIN,
+    ):
+        self.font = font
+        self.cell_size = cell_size
+        self.button_width = button_width
+        self.tiles: dict[Tuple[Optional[str], Tuple[int, int, int]], pygame.Surface] = {}
+        self.build()
+
+    def build(self) -> None:
+        """Render all tiles for the current font and size"""
+        self.tiles.clear()
+        for color in TILE_COLORS:
+            for letter in [None, *string.ascii_uppercase]:
+                self.tiles[(letter, color)] = self.render_tile(
+                    letter, color, self.cell_size
+                )
+            for key, label in BUTTON_LABELS.items():
+                self.tiles[(key, color)] = self.render_tile(
+                    label, color, self.button_width
+                )
+
+    def resize(
+        self,
+        cell_size: int,
+        button_width: int,
+        font: Optional[pygame.font.Font] = None,
+    ) -> None:
+        """Rebuild the tiles for a new size or font"""
+        self.cell_size = cell_size
+        self.button_width = button_width
+        if font is not None:
+            self.font = font
+        self.build()
+
+    def render_tile(
+        self, label: Optional[str], color: Tuple[int, int, int], width: int
+    ) -> pygame.Surface:
+        """Composite one tile: background, rounded cell and centred label"""
+        tile = pygame.Surface((width, self.cell_size))
+        if pygame.display.get_surface() is not None:
+            tile = tile.convert()
+        tile.fill(BLACK)
+        rect = tile.get_rect()
+        pygame.draw.rect(tile, color, rect, border_radius=5)
+        if label:
+            text = self.font.render(label, True, WHITE)
+            tile.blit(text, text.get_rect(center=rect.center))
+        return tile
+
+    def tile(
+        self, label: Optional[str], color: Tuple[int, int, int]
+    ) -> pygame.Surface:
+        """Look up a tile; letters are shown in upper case"""
+        if label is not None and len(label) == 1:
+            label = label.upper()
+        return self.tiles[(label, color)]
@@ -0,0 +1,212 @@
+"""Headless rendering benchmark for the Wordle GUI.
+
+A WordleGUI is driven offscreen with the SDL dummy video driver through
+scripted games, one input event per frame, including the timed reveal at
+the end of every game. Every frame is split into phases (event handling,
+GameState.update, draw_board, draw_keyboard, draw_message, draw_hint and the
+display flip) and each is timed. A second, untimed pass under tracemalloc measures
+memory allocated per frame.
+
+Results are printed as JSON and can be checked against a stored baseline,
+failing when a phase got slower or the frame rate dropped by more than a
+tolerance.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Iterator
+
+# Keep pygame's banner out of the JSON on stdout
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import pygame  # noqa: E402
+
+PHASES = ("events", "update", "draw_board", "draw_keyboard", "draw_message", "draw_hint", "flip")
+# (answer, guesses) played in order, every game ending in a win or a loss
+SCRIPT = [
+    ("hello", ["world", "there", "hello"]),
+    ("about", ["apple", "other", "would", "which", "their", "these"]),
+    ("their", ["there", "their"]),
+]
+# Simulated time passing per frame, as at 60 fps
+FRAME_MS = 16
+DEFAULT_BASELINE = Path(__file__).resolve().parents[2] / "benchmarks" / "gui_render.json"
+DEFAULT_TOLERANCE = 0.25
+# Phases this fast are mostly timer noise, so they get extra room
+SLACK_US = 5.0
+
+
+def script_events(guesses: list[str]) -> Iterator[pygame.event.Event]:
+    """Key presses typing and entering every guess"""
+    for word in guesses:
+        for letter in word:
+            yield pygame.event.Event(pygame.KEYDOWN, {"key": ord(letter), "unicode": letter})
+        yield pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_RETURN, "unicode": "\r"})
+
+
+class FrameBenchmark:
+    """Plays the script through a GUI, measuring each frame"""
+
+    def __init__(self, gui):
+        self.gui = gui
+        self.ticks = 0
+        self.current = dict.fromkeys(PHASES, 0)
+        self.samples: dict[str, list[int]] = {phase: [] for phase in PHASES}
+        self.frame_times: list[int] = []
+        self.frame_bytes: list[int] = []
+        self.frame_blocks: list[int] = []
+        self.trace = False
+
+        event_manager, game_state, renderer = gui.event_manager, gui.game_state, gui.renderer
+        event_manager.handle_events = self.timed("events", event_manager.handle_events)
+        game_state.update = self.timed("update", game_state.update)
+        for phase in ("draw_board", "draw_keyboard", "draw_message", "draw_hint"):
+            setattr(renderer, phase, self.timed(phase, getattr(renderer, phase)))
+
+    def timed(self, phase: str, func: Callable) -> Callable:
+        def timed_call(*args, **kwargs):
+            start = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.current[phase] += time.perf_counter_ns() - start
+
+        return timed_call
+
+    def frame(self, events: list[pygame.event.Event]) -> None:
+        """Run one iteration of the GUI loop"""
+        self.ticks += FRAME_MS
+        self.current = dict.fromkeys(PHASES, 0)
+        if self.trace:
+            tracemalloc.reset_peak()
+            before_bytes = tracemalloc.get_traced_memory()[0]
+            before_blocks = sys.getallocatedblocks()
+        start = time.perf_counter_ns()
+        self.gui.event_manager.handle_events(events)
+        self.gui.game_state.update()
+        self.gui.renderer.draw()
+        elapsed = time.perf_counter_ns() - start
+        if self.trace:
+            self.frame_bytes.append(tracemalloc.get_traced_memory()[1] - before_bytes)
+            self.frame_blocks.append(sys.getallocatedblocks() - before_blocks)
+            return
+        self.frame_times.append(elapsed)
+        for phase in PHASES:
+            self.samples[phase].append(self.current[phase])
+
+    def play(self, rounds: int) -> None:
+        """Play the script ``rounds`` times"""
+        game_state = self.gui.game_state
+        for _ in range(rounds):
+            for answer, guesses in SCRIPT:
+                game_state.game.answer = answer
+                for event in script_events(guesses):
+                    self.frame([event])
+                while game_state.animating:
+                    self.frame([])
+                # Result screen, then ENTER for the next game
+                self.frame([])
+                self.frame([pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_RETURN, "unicode": "\r"})])
+
+    def run(self, rounds: int) -> dict:
+        """Warm up, time ``rounds`` of the script, then measure allocations"""
+        display = pygame.display
+        flip, update = display.flip, display.update
+        get_ticks = pygame.time.get_ticks
+        display.flip = self.timed("flip", flip)
+        display.update = self.timed("flip", update)
+        pygame.time.get_ticks = lambda: self.ticks
+        try:
+            self.play(1)
+            self.frame_times.clear()
+            for samples in self.samples.values():
+                samples.clear()
+            self.play(rounds)
+
+            self.trace = True
+            tracemalloc.start()
+            try:
+                self.play(1)
+            finally:
+                tracemalloc.stop()
+                self.trace = False
+        finally:
+            display.flip, display.update = flip, update
+            pygame.time.get_ticks = get_ticks
+        return self.results()
+
+    def results(self) -> dict:
+        total = sum(self.frame_times)
+        return {
+            "frames": len(self.frame_times),
+            "fps": len(self.frame_times) / (total / 1e9) if total else 0.0,
+            "frame": summarize_ns(self.frame_times),
+            "phases": {phase: summarize_ns(self.samples[phase]) for phase in PHASES},
+            "alloc_bytes_per_frame": statistics.fmean(self.frame_bytes),
+            "alloc_blocks_per_frame": statistics.fmean(self.frame_blocks),
+        }
+
+
+def summarize_ns(samples: list[int]) -> dict:
+    """Mean, median and 95th percentile in microseconds"""
+    ordered = sorted(samples)
+    return {
+        "mean_us": statistics.fmean(ordered) / 1000,
+        "p50_us": ordered[len(ordered) // 2] / 1000,
+        "p95_us": ordered[min(len(ordered) - 1, len(ordered) * 95 // 100)] / 1000,
+    }
+
+
+def run_benchmark(rounds: int = 20) -> dict:
+    """Benchmark a fresh offscreen GUI"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    from gui.main import WordleGUI
+
+    gui = WordleGUI()
+    try:
+        return FrameBenchmark(gui).run(rounds)
+    finally:
+        gui.hints.close()
+        pygame.quit()
+
+
+def find_regressions(results: dict, baseline: dict, tolerance: float = DEFAULT_TOLERANCE) -> list[str]:
+    """Describe every way the results are worse than the baseline"""
+    regressions = []
+    for phase, stats in baseline["phases"].items():
+        limit = stats["mean_us"] * (1 + tolerance) + SLACK_US
+        mean = results["phases"][phase]["mean_us"]
+        if mean > limit:
+            regressions.append(f"{phase}: {mean:.1f}us per frame, baseline {stats['mean_us']:.1f}us")
+    if results["fps"] < baseline["fps"] / (1 + tolerance):
+        regressions.append(f"fps: {results['fps']:.0f}, baseline {baseline['fps']:.0f}")
+    return regressions
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--rounds", type=int, default=20, help="times to play the scripted games")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="allowed slowdown, 0.25 = 25%%")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the new baseline")
+
+
+def main(args: argparse.Namespace) -> None:
+    """Entry point for ``python -m pywordle bench-gui``"""
+    results = run_benchmark(args.rounds)
+    print(json.dumps(results, indent=2))
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(results, indent=2) + "\n")
+        return
+    if not args.baseline.exists():
+        return
+    regressions = find_regressions(results, json.loads(args.baseline.read_text()), args.tolerance)
+    for regression in regressions:
+        print(f"Regression: {regression}", file=sys.stderr)
+    if regressions:
+        sys.exit(1)
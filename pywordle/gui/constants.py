@@ -13,4 +13,8 @@ CELL_SIZE = 60
 CELL_MARGIN = 5
 BOARD_MARGIN = 20
 FONT_SIZE = 36
+HINT_FONT_SIZE = 24
 KEYBOARD_MARGIN = 40  # Space between board and keyboard
+# Largest window opened, for multi-board games too big at the natural size
+MAX_WINDOW_WIDTH = 1280
+MAX_WINDOW_HEIGHT = 900
@@ -1,20 +1,31 @@
 """Event handling for the Wordle GUI"""
 
 import pygame
-from typing import Optional, Tuple, Any
-from gui.constants import CELL_SIZE, CELL_MARGIN, BOARD_MARGIN, KEYBOARD_MARGIN
+from typing import Optional, Tuple, Any, Iterable, Callable
+from gui.hints import HINT_EVENT
+from gui.layout import Layout
 
 
 class EventManager:
     """Handles all input events for the Wordle GUI"""
 
-    def __init__(self, game_state: Any, window_width: int, board_height: int):
+    def __init__(
+        self,
+        game_state: Any,
+        window_width: int,
+        board_height: int,
+        layout: Optional[Layout] = None,
+    ):
         self.game_state = game_state
         self.window_width = window_width
         self.board_height = board_height
         self.keyboard = self.create_keyboard()
+        self.layout = layout or Layout(self.keyboard, window_width)
+        # Called with the new size when the window is resized
+        self.on_resize: Optional[Callable[[int, int], None]] = None
 
-    def create_keyboard(self) -> list[list[str]]:
+    @staticmethod
+    def create_keyboard() -> list[list[str]]:
         """Create the on-screen keyboard layout"""
         return [
             ["Q", "W", "E", "R", "T", "Y", "U", "I", "O", "P"],
@@ -22,11 +33,28 @@ class EventManager:
             ["Z", "X", "C", "V", "B", "N", "M"],
         ]
 
-    def handle_events(self) -> bool:
-        """Handle pygame events. Returns False if game should quit."""
-        for event in pygame.event.get():
+    def wait_events(self, timeout: Optional[int]) -> list[pygame.event.Event]:
+        """Block until there is input or the timeout (ms) passes, then return
+        everything queued. With no timeout this waits for input forever."""
+        # pygame treats a timeout of 0 as no timeout
+        event = pygame.event.wait(0 if timeout is None else max(1, timeout))
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event, *pygame.event.get()]
+
+    def handle_events(self, events: Optional[Iterable[pygame.event.Event]] = None) -> bool:
+        """Handle pygame events, polling the queue unless given a list.
+        Returns False if game should quit."""
+        if events is None:
+            events = pygame.event.get()
+        for event in events:
             if event.type == pygame.QUIT:
                 return False
+            elif event.type == pygame.VIDEORESIZE:
+                if self.on_resize:
+                    self.on_resize(event.w, event.h)
+            elif event.type == HINT_EVENT:
+                self.game_state.receive_hint(event)
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 key = self.handle_keyboard_click(event.pos)
                 if key:
@@ -36,48 +64,13 @@ class EventManager:
                     self.handle_key_press("BACKSPACE")
                 elif event.key == pygame.K_RETURN:
                     self.handle_key_press("ENTER")
-                elif event.unicode.isalpha():
+                elif event.unicode.isascii() and event.unicode.isalpha():
                     self.handle_key_press(event.unicode.upper())
         return True
 
     def handle_keyboard_click(self, pos: Tuple[int, int]) -> Optional[str]:
         """Handle clicks on the on-screen keyboard"""
-        keyboard_y = self.board_height + BOARD_MARGIN + KEYBOARD_MARGIN
-
-        # Check main keyboard
-        for row_idx, row in enumerate(self.keyboard):
-            row_width = len(row) * (CELL_SIZE + CELL_MARGIN) - CELL_MARGIN
-            start_x = (self.window_width - row_width) // 2
-
-            for col_idx, key in enumerate(row):
-                x = start_x + col_idx * (CELL_SIZE + CELL_MARGIN)
-                y = keyboard_y + row_idx * (CELL_SIZE + CELL_MARGIN)
-
-                key_rect = pygame.Rect(x, y, CELL_SIZE, CELL_SIZE)
-                if key_rect.collidepoint(pos):
-                    return key
-
-        # Check ENTER and BACKSPACE buttons
-        bottom_y = (
-            keyboard_y
-            + len(self.keyboard) * (CELL_SIZE + CELL_MARGIN)
-            + KEYBOARD_MARGIN
-        )
-        button_width = CELL_SIZE * 2 + CELL_MARGIN
-
-        # Check ENTER button
-        enter_x = (self.window_width - (button_width + CELL_SIZE + button_width)) // 2
-        enter_rect = pygame.Rect(enter_x, bottom_y, button_width, CELL_SIZE)
-        if enter_rect.collidepoint(pos):
-            return "ENTER"
-
-        # Check BACKSPACE button
-        backspace_x = enter_x + button_width + CELL_SIZE + CELL_MARGIN
-        backspace_rect = pygame.Rect(backspace_x, bottom_y, button_width, CELL_SIZE)
-        if backspace_rect.collidepoint(pos):
-            return "BACKSPACE"
-
-        return None
+        return self.layout.key_at(pos)
 
     def handle_key_press(self, key: str) -> None:
         """Handle keyboard input"""
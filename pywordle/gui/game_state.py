@@ -1,47 +1,156 @@
 """Game state management for the Wordle GUI"""
 
 import pygame
-from typing import Any
-from models.game import Game
+from typing import Any, Optional
+from models.modes import mode_name, new_game
+from models.patterns import WORD_LENGTH
+
+
+MESSAGE_DURATION = 3000
+# Shown under the result, on its own line so the result keeps the full width
+PLAY_AGAIN = "Press ENTER to play again"
+# Milliseconds between the tiles of the final guess turning over
+REVEAL_STEP = 300
+
+# Phases of a game: PLAYING -> REVEALING -> RESULT -> (new game) PLAYING
+PLAYING = "playing"
+REVEALING = "revealing"
+RESULT = "result"
 
 
 class GameState:
     """Manages the game state including current guess, messages, and timing"""
 
-    def __init__(self):
-        self.game = Game()
+    def __init__(
+        self,
+        boards: int = 1,
+        hard_mode: bool = False,
+        absurdle: bool = False,
+        stats: Any = None,
+    ):
+        self.event_manager: Any = None  # Will be set by WordleGUI
+        self.hints: Any = None  # HintWorker, set by WordleGUI when hints are shown
+        self.stats = stats  # A stats.StatsStore recording finished games, if any
+        self.boards = boards
+        self.hard_mode = hard_mode
+        self.absurdle = absurdle
+        self.mode = mode_name(boards, hard_mode, absurdle)
+        self.new_game()
+
+    def new_game(self) -> None:
+        """Start a fresh game in the same window"""
+        self.game = new_game(self.boards, self.hard_mode, self.absurdle)
         self.current_guess = ""
         self.message = ""
         self.message_time = 0
-        self.event_manager: Any = None  # Will be set by WordleGUI
+        self.prompt = ""
+        self.phase = PLAYING
+        self.phase_time = 0
+        self.hint = ""
+        self.hint_generation = 0
+        self.request_hint()
 
     def update(self) -> None:
         """Update game state"""
         current_time = pygame.time.get_ticks()
-        if self.message and current_time - self.message_time > 3000:
-            self.message = ""
+        if self.phase == REVEALING:
+            if current_time - self.phase_time >= self.reveal_duration:
+                self.show_result()
+        elif self.phase == PLAYING:
+            if self.message and current_time - self.message_time > MESSAGE_DURATION:
+                self.message = ""
+
+    @property
+    def reveal_duration(self) -> int:
+        return REVEAL_STEP * WORD_LENGTH
+
+    def revealed_tiles(self) -> int:
+        """How many tiles of the final guess are turned over so far"""
+        if self.phase != REVEALING:
+            return WORD_LENGTH
+        return (pygame.time.get_ticks() - self.phase_time) // REVEAL_STEP
+
+    def show_result(self) -> None:
+        """Finish the reveal and show the outcome until the player starts again"""
+        self.phase = RESULT
+        if self.game.won:
+            self.message = f"Congratulations! You won in {self.game.attempts} attempts!"
+        elif self.boards == 1:
+            self.message = f"Game Over! The word was: {self.game.answer.upper()}"
+        else:
+            self.message = f"Game Over! The words were: {', '.join(self.game.answers).upper()}"
+        self.prompt = PLAY_AGAIN
+        self.message_time = pygame.time.get_ticks()
+        if self.stats is not None:
+            from stats import format_summary
+
+            self.hint = format_summary(self.stats.summary(self.mode))
+
+    @property
+    def guess_legal(self) -> bool:
+        """Whether the letters typed so far can still make a hard mode guess"""
+        return self.game.hard_mode is None or self.game.allows_prefix(self.current_guess.lower())
+
+    @property
+    def animating(self) -> bool:
+        """Whether the screen changes without input, needing a full frame rate"""
+        return self.phase == REVEALING
+
+    def time_until_update(self) -> Optional[int]:
+        """Milliseconds until update() has something to do, None if never"""
+        if not self.message or self.phase != PLAYING:
+            return None
+        elapsed = pygame.time.get_ticks() - self.message_time
+        return max(0, MESSAGE_DURATION - elapsed + 1)
 
     def handle_backspace(self) -> None:
         """Handle backspace key press"""
+        if self.phase != PLAYING:
+            return
         self.current_guess = self.current_guess[:-1]
 
     def handle_enter(self) -> None:
         """Handle enter key press"""
-        if len(self.current_guess) == 5:
+        if self.phase == REVEALING:
+            self.show_result()
+        elif self.phase == RESULT:
+            self.new_game()
+        elif len(self.current_guess) == 5:
             try:
                 self.game.make_guess(self.current_guess.lower())
-                if self.game.won:
-                    self.message = f"Congratulations! You won in {len(self.game.board.guesses)} attempts!"
-                elif self.game.game_over:
-                    self.message = (
-                        f"Game Over! The word was: {self.game.answer.upper()}"
-                    )
+                self.message = ""
                 self.current_guess = ""
+                if self.game.game_over:
+                    self.phase = REVEALING
+                    self.phase_time = pygame.time.get_ticks()
+                    self.hint = ""
+                    if self.stats is not None:
+                        self.stats.record(self.game, self.mode)
+                else:
+                    self.request_hint()
             except ValueError as e:
                 self.message = str(e)
                 self.message_time = pygame.time.get_ticks()
 
+    def request_hint(self) -> None:
+        """Have the hint worker start on the board as it now stands"""
+        if self.hints is None or self.boards != 1 or self.game.board.candidates is None:
+            return
+        legal_codes = None if self.game.hard_mode is None else self.game.legal_codes()
+        self.hint_generation = self.hints.request(self.game.board, legal_codes)
+
+    def receive_hint(self, event: pygame.event.Event) -> None:
+        """Show a hint posted by the worker, unless a newer one was asked for"""
+        if event.generation != self.hint_generation or self.game.game_over:
+            return
+        if event.remaining == 1:
+            self.hint = "1 word remains"
+        else:
+            self.hint = f"{event.remaining} words remain"
+        if event.suggestion:
+            self.hint += f" - try {event.suggestion.upper()}"
+
     def handle_letter(self, key: str) -> None:
         """Handle letter key press"""
-        if len(self.current_guess) < 5:
+        if self.phase == PLAYING and len(self.current_guess) < 5:
             self.current_guess += key
@@ -0,0 +1,109 @@
+"""Hints worked out off the render thread.
+
+After every guess the GUI asks a HintWorker for how many answers remain and,
+if suggestions are on, the best next guess. The worker runs on its own
+thread and posts each result to the pygame event queue as a HINT_EVENT, so
+the main loop picks it up like any other input (waking from event.wait) and
+never blocks on the solver. A newer request cancels the one in flight: its
+cancel Event is set, which stops best_guesses between chunks, and results
+carry the generation they were asked for so stale ones are dropped.
+"""
+
+import threading
+from queue import SimpleQueue
+from typing import Callable, Optional
+
+import numpy as np
+import pygame
+
+from models.lexicon import unpack_words
+
+HINT_EVENT = pygame.event.custom_type()
+# Seconds the solver may spend on a suggestion before settling for the best so far
+SUGGEST_TIME_BUDGET = 5.0
+
+
+class HintWorker:
+    """Background thread answering hint requests, newest first"""
+
+    def __init__(
+        self,
+        suggest: bool = False,
+        time_budget: float = SUGGEST_TIME_BUDGET,
+        post: Callable[[pygame.event.Event], object] = pygame.event.post,
+    ):
+        self.suggest = suggest
+        self.time_budget = time_budget
+        self.post = post
+        self.generation = 0
+        self.cancel = threading.Event()
+        self.jobs: SimpleQueue = SimpleQueue()
+        self.thread = threading.Thread(target=self.work, name="hints", daemon=True)
+        self.thread.start()
+
+    def request(self, board, legal_codes: Optional[np.ndarray] = None) -> int:
+        """Ask for hints on a board as it stands, returning the request's generation.
+
+        Only the board's candidate set (an immutable int) and, in hard mode,
+        the packed codes of the legal guesses (see Game.legal_codes) are
+        handed over, so the main thread is free to keep changing the board.
+        """
+        self.cancel.set()
+        self.cancel = threading.Event()
+        self.generation += 1
+        self.jobs.put((self.generation, self.cancel, board, board.candidates, legal_codes))
+        return self.generation
+
+    def close(self, finish: bool = False) -> None:
+        """Stop the thread, cancelling outstanding work unless told to finish it"""
+        if not finish:
+            self.cancel.set()
+        self.jobs.put(None)
+        self.thread.join()
+
+    def work(self) -> None:
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                return
+            generation, cancel, board, candidates, legal_codes = job
+            if cancel.is_set():
+                continue  # Superseded before it started
+            words = board.candidate_index.words_in(candidates)
+            self.post_hint(generation, len(words))
+            if self.suggest and len(words) > 1:
+                suggestion = self.best_guess(board, words, cancel, legal_codes)
+                if suggestion is not None and not cancel.is_set():
+                    self.post_hint(generation, len(words), suggestion)
+
+    def best_guess(
+        self,
+        board,
+        words: list[str],
+        cancel: threading.Event,
+        legal_codes: Optional[np.ndarray] = None,
+    ) -> Optional[str]:
+        # Imported here so windows without suggestions never load the solver
+        from solver import best_guesses
+
+        # In hard mode only suggest what make_guess would accept
+        guesses = None if legal_codes is None else unpack_words(legal_codes) or words
+        suggestions = best_guesses(
+            board,
+            k=1,
+            guesses=guesses,
+            candidates=words,
+            workers=1,
+            time_budget=self.time_budget,
+            cancel=cancel,
+        )
+        return suggestions[0].word if suggestions else None
+
+    def post_hint(self, generation: int, remaining: int, suggestion: Optional[str] = None) -> None:
+        event = pygame.event.Event(
+            HINT_EVENT, generation=generation, remaining=remaining, suggestion=suggestion
+        )
+        try:
+            self.post(event)
+        except pygame.error:
+            pass  # The window closed while the hint was being worked out
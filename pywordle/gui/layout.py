@@ -0,0 +1,153 @@
+"""Screen geometry for the Wordle GUI"""
+
+from typing import Optional, Tuple
+
+import pygame
+from gui.constants import (
+    CELL_SIZE,
+    CELL_MARGIN,
+    BOARD_MARGIN,
+    KEYBOARD_MARGIN,
+)
+
+BOARD_ROWS = 6
+BOARD_COLS = 5
+# Room for the message and, under it, the prompt to play again
+MESSAGE_HEIGHT = 64
+# Boards side by side before a multi-board game wraps onto another row
+BOARDS_PER_ROW = 4
+
+
+class Layout:
+    """Rects of every board cell, keyboard key and button, plus the message
+    area, computed once and again only when the window is resized.
+
+    Everything is laid out at its natural size and then scaled uniformly to
+    fit the window, centred horizontally. Multi-board games put their boards
+    in a grid of up to BOARDS_PER_ROW columns.
+    """
+
+    def __init__(
+        self,
+        keyboard: list[list[str]],
+        window_width: Optional[int] = None,
+        window_height: Optional[int] = None,
+        boards: int = 1,
+        rows: int = BOARD_ROWS,
+    ):
+        self.keyboard = keyboard
+        self.boards = boards
+        self.rows = rows
+        self.grid_columns = min(boards, BOARDS_PER_ROW)
+        self.grid_rows = -(-boards // self.grid_columns)
+
+        # Natural size of each part, before any scaling
+        pitch = CELL_SIZE + CELL_MARGIN
+        self.board_width = BOARD_COLS * pitch + CELL_MARGIN
+        self.board_height = rows * pitch + CELL_MARGIN
+        self.boards_width = (
+            self.grid_columns * self.board_width + (self.grid_columns - 1) * BOARD_MARGIN
+        )
+        self.boards_height = (
+            self.grid_rows * self.board_height + (self.grid_rows - 1) * BOARD_MARGIN
+        )
+        self.keyboard_width = max(len(row) for row in keyboard) * pitch + CELL_MARGIN
+        self.keyboard_height = len(keyboard) * pitch + CELL_MARGIN
+        self.button_width = CELL_SIZE * 2 + CELL_MARGIN
+        self.control_buttons_width = (self.button_width * 2) + CELL_SIZE + CELL_MARGIN
+        self.natural_width = (
+            max(self.boards_width, self.keyboard_width, self.control_buttons_width)
+            + 2 * BOARD_MARGIN
+        )
+        self.natural_height = (
+            self.boards_height
+            + self.keyboard_height
+            + KEYBOARD_MARGIN  # Space between board and keyboard
+            + KEYBOARD_MARGIN  # Space between keyboard and control buttons
+            + CELL_SIZE
+            + CELL_MARGIN  # Space for control buttons
+            + 2 * BOARD_MARGIN
+            + MESSAGE_HEIGHT
+        )
+        self.resize(window_width or self.natural_width, window_height or self.natural_height)
+
+    def resize(self, window_width: int, window_height: int) -> None:
+        """Recompute every rect for a new window size"""
+        self.window_width = window_width
+        self.window_height = window_height
+        self.scale = min(
+            window_width / self.natural_width, window_height / self.natural_height
+        )
+        s = self.scale
+        self.cell_size = cell = max(1, round(CELL_SIZE * s))
+        self.pitch = pitch = max(1, round((CELL_SIZE + CELL_MARGIN) * s))
+        margin = pitch - cell
+        offset_x = (window_width - round(self.natural_width * s)) // 2
+        left = offset_x + round(BOARD_MARGIN * s)
+        top = round(BOARD_MARGIN * s)
+        gap = round(BOARD_MARGIN * s)
+
+        self.board_cell_rects = []
+        for board in range(self.boards):
+            grid_row, grid_col = divmod(board, self.grid_columns)
+            board_left = left + grid_col * (BOARD_COLS * pitch + gap)
+            board_top = top + grid_row * (self.rows * pitch + gap)
+            self.board_cell_rects.append(
+                [
+                    [
+                        pygame.Rect(board_left + col * pitch, board_top + row * pitch, cell, cell)
+                        for col in range(BOARD_COLS)
+                    ]
+                    for row in range(self.rows)
+                ]
+            )
+        self.cell_rects = self.board_cell_rects[0]
+
+        boards_bottom = top + self.grid_rows * (self.rows * pitch + gap) - gap
+        self.keyboard_top = boards_bottom + round(KEYBOARD_MARGIN * s)
+        # Hints share the margin between the boards and the keyboard
+        self.hint_rect = pygame.Rect(0, boards_bottom, window_width, self.keyboard_top - boards_bottom)
+        self.key_rects: dict[str, pygame.Rect] = {}
+        self.row_starts = []
+        for row_idx, row in enumerate(self.keyboard):
+            row_width = len(row) * pitch - margin
+            start_x = (window_width - row_width) // 2
+            self.row_starts.append(start_x)
+            for col_idx, key in enumerate(row):
+                self.key_rects[key] = pygame.Rect(
+                    start_x + col_idx * pitch,
+                    self.keyboard_top + row_idx * pitch,
+                    cell,
+                    cell,
+                )
+
+        # ENTER and BACKSPACE buttons below the keyboard, a key's width apart
+        bottom_y = self.keyboard_top + len(self.keyboard) * pitch + round(KEYBOARD_MARGIN * s)
+        button_width = cell * 2 + margin
+        enter_x = (window_width - (button_width + cell + button_width)) // 2
+        self.key_rects["ENTER"] = pygame.Rect(enter_x, bottom_y, button_width, cell)
+        self.key_rects["BACKSPACE"] = pygame.Rect(
+            enter_x + button_width + cell + margin, bottom_y, button_width, cell
+        )
+
+        message_height = round(MESSAGE_HEIGHT * s)
+        self.message_rect = pygame.Rect(
+            0, window_height - message_height, window_width, message_height
+        )
+
+    def key_at(self, pos: Tuple[int, int]) -> Optional[str]:
+        """The key or button under a point, found without scanning the keys"""
+        x, y = pos
+        row_idx, dy = divmod(y - self.keyboard_top, self.pitch)
+        if 0 <= row_idx < len(self.keyboard):
+            if dy >= self.cell_size:
+                return None
+            row = self.keyboard[row_idx]
+            col_idx, dx = divmod(x - self.row_starts[row_idx], self.pitch)
+            if 0 <= col_idx < len(row) and dx < self.cell_size:
+                return row[col_idx]
+            return None
+        for key in ("ENTER", "BACKSPACE"):
+            if self.key_rects[key].collidepoint(pos):
+                return key
+        return None
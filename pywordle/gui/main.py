@@ -2,90 +2,129 @@
 
 import pygame
 import sys
-from gui.constants import (
-    CELL_SIZE,
-    CELL_MARGIN,
-    BOARD_MARGIN,
-    KEYBOARD_MARGIN,
-)
+from typing import Any
+from gui.constants import MAX_WINDOW_WIDTH, MAX_WINDOW_HEIGHT
 from gui.game_state import GameState
 from gui.event_manager import EventManager
+from gui.hints import HintWorker
+from gui.layout import Layout
 from gui.renderer import Renderer
 
 
 class WordleGUI:
     """Main GUI class for the Wordle game"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        boards: int = 1,
+        hard_mode: bool = False,
+        absurdle: bool = False,
+        suggest: bool = False,
+        stats: Any = None,
+    ):
         pygame.init()
-        self.game_state = GameState()
-
-        # Calculate board dimensions
-        self.board_width = 5 * (CELL_SIZE + CELL_MARGIN) + CELL_MARGIN
-        self.board_height = 6 * (CELL_SIZE + CELL_MARGIN) + CELL_MARGIN
-
-        # Calculate keyboard dimensions
-        self.keyboard_height = 3 * (CELL_SIZE + CELL_MARGIN) + CELL_MARGIN
-        self.keyboard_width = 10 * (CELL_SIZE + CELL_MARGIN) + CELL_MARGIN
-
-        # Calculate control buttons dimensions
-        self.button_width = CELL_SIZE * 2 + CELL_MARGIN
-        self.control_buttons_width = (self.button_width * 2) + CELL_SIZE + CELL_MARGIN
-
-        # Calculate window dimensions
-        self.window_width = (
-            max(self.board_width, self.keyboard_width, self.control_buttons_width)
-            + 2 * BOARD_MARGIN
+        self.game_state = GameState(boards, hard_mode, absurdle, stats)
+        # Remaining answers are always shown, the best next guess on request
+        self.hints = HintWorker(suggest)
+        self.game_state.hints = self.hints
+        self.game_state.request_hint()
+        self.layout = Layout(
+            EventManager.create_keyboard(),
+            boards=boards,
+            rows=self.game_state.game.max_attempts,
         )
-        self.window_height = (
-            self.board_height
-            + self.keyboard_height
-            + KEYBOARD_MARGIN  # Space between board and keyboard
-            + CELL_SIZE
-            + CELL_MARGIN  # Space for control buttons
-            + 2 * BOARD_MARGIN
-            + 40  # Extra space for message
+        scale = min(
+            1,
+            MAX_WINDOW_WIDTH / self.layout.natural_width,
+            MAX_WINDOW_HEIGHT / self.layout.natural_height,
         )
+        if scale < 1:
+            self.layout.resize(
+                int(self.layout.natural_width * scale),
+                int(self.layout.natural_height * scale),
+            )
+
+        # Window dimensions, as laid out at the natural cell size
+        self.board_width = self.layout.board_width
+        self.board_height = self.layout.board_height
+        self.keyboard_height = self.layout.keyboard_height
+        self.keyboard_width = self.layout.keyboard_width
+        self.button_width = self.layout.button_width
+        self.control_buttons_width = self.layout.control_buttons_width
+        self.window_width = self.layout.window_width
+        self.window_height = self.layout.window_height
 
         # Create window
-        self.screen = pygame.display.set_mode((self.window_width, self.window_height))
+        self.screen = pygame.display.set_mode(
+            (self.window_width, self.window_height), pygame.RESIZABLE
+        )
         pygame.display.set_caption("Wordle")
 
-        # Initialize components
+        # Initialize components, sharing the one layout
         self.event_manager = EventManager(
-            self.game_state, self.window_width, self.board_height
+            self.game_state, self.window_width, self.board_height, self.layout
+        )
+        self.renderer = Renderer(
+            self.screen, self.game_state, self.window_width, self.layout
         )
-        self.renderer = Renderer(self.screen, self.game_state, self.window_width)
         self.game_state.event_manager = (
             self.event_manager
         )  # Add reference to event manager
+        self.event_manager.on_resize = self.resize
+
+    def resize(self, width: int, height: int) -> None:
+        """Lay everything out again for a resized window"""
+        self.layout.resize(width, height)
+        self.window_width, self.window_height = width, height
+        self.event_manager.window_width = width
+        self.renderer.resize()
 
     def run(self) -> None:
-        """Main game loop"""
+        """Main game loop.
+
+        While nothing is animating the loop sleeps in pygame.event.wait until
+        input arrives or the next timed change (such as a message expiring) is
+        due, so an idle window uses no CPU. Frames are only paced at 60 fps
+        while something animates. The end of a game runs on GameState timers
+        too, so the window keeps responding and ENTER starts the next game
+        without setting pygame up again. Hints arrive as events from the
+        HintWorker thread, so solver work never holds up a frame.
+        """
         clock = pygame.time.Clock()
         running = True
 
         while running:
-            running = self.event_manager.handle_events()
+            if self.game_state.animating:
+                clock.tick(60)
+                events = None
+            else:
+                events = self.event_manager.wait_events(
+                    self.game_state.time_until_update()
+                )
+            running = self.event_manager.handle_events(events)
             self.game_state.update()
             self.renderer.draw()
 
-            if self.game_state.game.game_over:
-                pygame.time.wait(3000)
-                running = False
-
-            clock.tick(60)
-
+        self.hints.close()
         pygame.quit()
         sys.exit()
 
 
-def main():
+def main(
+    boards: int = 1,
+    hard_mode: bool = False,
+    absurdle: bool = False,
+    suggest: bool = False,
+    stats: Any = None,
+):
     """Entry point for the GUI game"""
     try:
-        gui = WordleGUI()
+        gui = WordleGUI(boards, hard_mode, absurdle, suggest, stats)
         gui.run()
     except Exception as e:
         print(f"\nAn error occurred: {e}")
         sys.exit(1)
+    finally:
+        if stats is not None:
+            stats.close()
 
@@ -9,33 +9,100 @@ from gui.constants import (
     YELLOW,
     GREEN,
     DARK_GRAY,
-    CELL_SIZE,
-    CELL_MARGIN,
-    BOARD_MARGIN,
-    KEYBOARD_MARGIN,
+    FONT_SIZE,
+    HINT_FONT_SIZE,
 )
+from gui.atlas import TileAtlas
 from gui.game_state import GameState
+from gui.layout import Layout
 from models.letter import Letter
 
+# Key colour for each KEY_* status in models.board
+KEY_COLORS = (GRAY, DARK_GRAY, YELLOW, GREEN)
+
 
 class Renderer:
-    """Handles all rendering for the Wordle GUI"""
+    """Handles all rendering for the Wordle GUI.
+
+    The renderer remembers what it last drew in every cell, key and the
+    message line, redraws only what changed and pushes just those rects to
+    the display. The first frame, or one after invalidate(), is drawn in full.
+    """
 
     def __init__(
-        self, screen: pygame.Surface, game_state: GameState, window_width: int
+        self,
+        screen: pygame.Surface,
+        game_state: GameState,
+        window_width: int,
+        layout: Optional[Layout] = None,
     ):
         self.screen = screen
         self.game_state = game_state
         self.window_width = window_width
-        self.font = pygame.font.Font(None, 36)
+        self._layout = layout
+        scale = layout.scale if layout is not None else 1
+        self.font = pygame.font.Font(None, max(1, round(FONT_SIZE * scale)))
+        self.hint_font = pygame.font.Font(None, max(1, round(HINT_FONT_SIZE * scale)))
+        self.atlas: Optional[TileAtlas] = None
+        self.invalidate()
+
+    @property
+    def layout(self) -> Layout:
+        """The layout given, or else the one the event manager hit-tests with"""
+        if self._layout is not None:
+            return self._layout
+        if not self.game_state.event_manager:
+            raise ValueError("EventManager is not passed to GameState when this is run")
+        return self.game_state.event_manager.layout
+
+    def resize(self) -> None:
+        """Pick up a new window size after the layout has been resized"""
+        self.screen = pygame.display.get_surface() or self.screen
+        self.window_width = self.layout.window_width
+        self.font = pygame.font.Font(None, max(1, round(FONT_SIZE * self.layout.scale)))
+        self.hint_font = pygame.font.Font(None, max(1, round(HINT_FONT_SIZE * self.layout.scale)))
+        if self.atlas is not None:
+            self.atlas.resize(
+                self.layout.cell_size, self.layout.key_rects["ENTER"].width, self.font
+            )
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Forget what is on screen so the next frame is drawn in full"""
+        self.full_redraw = True
+        self.drawn: dict[object, object] = {}
+        self.dirty: list[pygame.Rect] = []
 
     def draw(self) -> None:
-        """Draw game state"""
-        self.screen.fill(BLACK)
+        """Draw whatever changed since the last frame"""
+        if self.atlas is None:
+            # Built on the first frame rather than in __init__ so that a
+            # renderer can be created before the display is up
+            self.atlas = TileAtlas(
+                self.font, self.layout.cell_size, self.layout.key_rects["ENTER"].width
+            )
+        if self.full_redraw:
+            self.screen.fill(BLACK)
         self.draw_board()
         self.draw_keyboard()
         self.draw_message()
-        pygame.display.flip()
+        self.draw_hint()
+        if self.full_redraw:
+            pygame.display.flip()
+        elif self.dirty:
+            pygame.display.update(self.dirty)
+        self.full_redraw = False
+        self.dirty = []
+
+    def changed(self, key: object, value: object, rect: Optional[pygame.Rect]) -> bool:
+        """Record what an area should show, returning True if it needs redrawing.
+        With no rect nothing is marked dirty, for keys grouping other areas."""
+        if self.drawn.get(key) == value and not self.full_redraw:
+            return False
+        self.drawn[key] = value
+        if rect is not None:
+            self.dirty.append(rect)
+        return True
 
     def get_letter_color(self, letter: Letter) -> Tuple[int, int, int]:
         """Get the color for a letter based on its state"""
@@ -48,92 +115,91 @@ class Renderer:
         return GRAY
 
     def draw_cell(
-        self, letter: Optional[str], x: int, y: int, color: Tuple[int, int, int]
+        self, letter: Optional[str], cell_rect: pygame.Rect, color: Tuple[int, int, int]
     ) -> None:
-        """Draw a single cell with a letter"""
-        cell_rect = pygame.Rect(x, y, CELL_SIZE, CELL_SIZE)
-        pygame.draw.rect(self.screen, color, cell_rect, border_radius=5)
-
-        if letter:
-            text = self.font.render(letter, True, WHITE)
-            text_rect = text.get_rect(center=cell_rect.center)
-            self.screen.blit(text, text_rect)
+        """Draw a single cell with a letter, if it changed"""
+        if not self.changed(cell_rect.topleft, (letter, color), cell_rect):
+            return
+        self.screen.blit(self.atlas.tile(letter, color), cell_rect)
 
     def draw_board(self) -> None:
-        """Draw the game board"""
-        for row in range(6):
-            for col in range(5):
-                x = BOARD_MARGIN + col * (CELL_SIZE + CELL_MARGIN)
-                y = BOARD_MARGIN + row * (CELL_SIZE + CELL_MARGIN)
-
-                if row < len(self.game_state.game.board.guesses):
-                    letter = self.game_state.game.board.guesses[row].letters[col]
-                    color = self.get_letter_color(letter)
-                    self.draw_cell(str(letter), x, y, color)
-                elif row == len(self.game_state.game.board.guesses):
+        """Draw the game board, or every board of a multi-board game.
+
+        A board whose guesses, typed letters and reveal are the same as last
+        frame is skipped without looking at its cells.
+        """
+        game = self.game_state.game
+        current_guess = self.game_state.current_guess
+        # Tiles of the final guess stay face down until the reveal reaches them
+        revealed = self.game_state.revealed_tiles()
+        for index, (board, board_rects) in enumerate(zip(game.boards, self.layout.board_cell_rects)):
+            guesses = board.guesses
+            # Solved boards take no more guesses, so show no typing
+            typing = None if board.won else current_guess
+            # Only a board the final guess went to is part of a reveal
+            hidden = revealed < len(board_rects[0]) and len(guesses) == game.attempts
+            reveal = revealed if hidden else None
+            if not self.changed(("board", index), (board, len(guesses), typing, reveal), None):
+                continue
+            # Letters that can't lead to a legal hard mode guess are greyed out
+            typing_color = GRAY if typing is None or self.game_state.guess_legal else DARK_GRAY
+            self.draw_board_cells(guesses, typing, typing_color, reveal, board_rects)
+
+    def draw_board_cells(
+        self,
+        guesses: list,
+        typing: Optional[str],
+        typing_color: Tuple[int, int, int],
+        revealed: Optional[int],
+        board_rects: list[list[pygame.Rect]],
+    ) -> None:
+        """Draw the cells of one board that changed"""
+        for row, cell_rects in enumerate(board_rects):
+            for col, cell_rect in enumerate(cell_rects):
+                if row < len(guesses):
+                    letter = guesses[row].letters[col]
+                    if row == len(guesses) - 1 and revealed is not None and col >= revealed:
+                        color = GRAY
+                    else:
+                        color = self.get_letter_color(letter)
+                    self.draw_cell(str(letter), cell_rect, color)
+                elif row == len(guesses) and typing is not None:
                     # Draw current guess
-                    letter = (
-                        self.game_state.current_guess[col]
-                        if col < len(self.game_state.current_guess)
-                        else None
-                    )
-                    self.draw_cell(letter, x, y, GRAY)
+                    letter = typing[col] if col < len(typing) else None
+                    self.draw_cell(letter, cell_rect, typing_color if letter else GRAY)
                 else:
-                    self.draw_cell(None, x, y, GRAY)
+                    self.draw_cell(None, cell_rect, GRAY)
 
     def draw_keyboard(self) -> None:
-        """Draw the on-screen keyboard"""
-        keyboard_y = 6 * (CELL_SIZE + CELL_MARGIN) + BOARD_MARGIN + KEYBOARD_MARGIN
-
-        # Draw main keyboard
-        if not self.game_state.event_manager:
-            raise ValueError("EventManager is not passed to GameState when this is run")
-        for row_idx, row in enumerate(self.game_state.event_manager.keyboard):
-            row_width = len(row) * (CELL_SIZE + CELL_MARGIN) - CELL_MARGIN
-            start_x = (self.window_width - row_width) // 2
-
-            for col_idx, key in enumerate(row):
-                x = start_x + col_idx * (CELL_SIZE + CELL_MARGIN)
-                y = keyboard_y + row_idx * (CELL_SIZE + CELL_MARGIN)
-
-                # Draw key
-                key_rect = pygame.Rect(x, y, CELL_SIZE, CELL_SIZE)
-                pygame.draw.rect(self.screen, GRAY, key_rect, border_radius=5)
-
-                # Draw key text
-                text = self.font.render(key, True, WHITE)
-                text_rect = text.get_rect(center=key_rect.center)
-                self.screen.blit(text, text_rect)
-
-        # Draw ENTER and BACKSPACE buttons below the keyboard
-        bottom_y = (
-            keyboard_y
-            + len(self.game_state.event_manager.keyboard) * (CELL_SIZE + CELL_MARGIN)
-            + KEYBOARD_MARGIN
-        )
-        button_width = CELL_SIZE * 2 + CELL_MARGIN  # Make buttons wider
-
-        # Draw ENTER button
-        enter_x = (self.window_width - (button_width + CELL_SIZE + button_width)) // 2
-        enter_rect = pygame.Rect(enter_x, bottom_y, button_width, CELL_SIZE)
-        pygame.draw.rect(self.screen, GRAY, enter_rect, border_radius=5)
-        text = self.font.render("ENTER", True, WHITE)
-        text_rect = text.get_rect(center=enter_rect.center)
-        self.screen.blit(text, text_rect)
-
-        # Draw BACKSPACE button
-        backspace_x = enter_x + button_width + CELL_SIZE + CELL_MARGIN
-        backspace_rect = pygame.Rect(backspace_x, bottom_y, button_width, CELL_SIZE)
-        pygame.draw.rect(self.screen, GRAY, backspace_rect, border_radius=5)
-        text = self.font.render("BACK", True, WHITE)
-        text_rect = text.get_rect(center=backspace_rect.center)
-        self.screen.blit(text, text_rect)
+        """Draw the on-screen keyboard, including the ENTER and BACKSPACE buttons"""
+        key_status = self.game_state.game.key_status
+        for key, key_rect in self.layout.key_rects.items():
+            color = KEY_COLORS[key_status[ord(key) - 65]] if len(key) == 1 else GRAY
+            if self.changed(key, color, key_rect):
+                self.screen.blit(self.atlas.tile(key, color), key_rect)
 
     def draw_message(self) -> None:
-        """Draw the message at the bottom of the screen"""
-        if self.game_state.message:
-            text = self.font.render(self.game_state.message, True, WHITE)
-            text_rect = text.get_rect(
-                center=(self.window_width // 2, self.screen.get_height() - 20)
-            )
-            self.screen.blit(text, text_rect)
+        """Draw the message at the bottom of the screen, and any prompt under it"""
+        area = self.layout.message_rect
+        message, prompt = self.game_state.message, self.game_state.prompt
+        if not self.changed("message", (message, prompt), area):
+            return
+        self.screen.fill(BLACK, area)
+        # Only reached when the message changes, not every frame
+        if message:
+            text = self.font.render(message, True, WHITE)
+            center_y = area.top + area.height * 3 // 8 if prompt else area.centery
+            self.screen.blit(text, text.get_rect(center=(area.centerx, center_y)))
+        if prompt:
+            text = self.hint_font.render(prompt, True, WHITE)
+            self.screen.blit(text, text.get_rect(center=(area.centerx, area.top + area.height * 13 // 16)))
+
+    def draw_hint(self) -> None:
+        """Draw the hint line between the board and the keyboard"""
+        area = self.layout.hint_rect
+        if not self.changed("hint", self.game_state.hint, area):
+            return
+        self.screen.fill(BLACK, area)
+        if self.game_state.hint:
+            text = self.hint_font.render(self.game_state.hint, True, GRAY)
+            self.screen.blit(text, text.get_rect(center=area.center))
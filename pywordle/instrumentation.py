@@ -0,0 +1,149 @@
+"""Opt-in timing counters for the game's hot paths.
+
+Turned on with ``--profile FILE`` or the PYWORDLE_PROFILE environment
+variable (set to the output file). Nothing is patched unless it is on, so
+the game runs exactly as before when it is off.
+
+When on, each hot path is wrapped in place on its class:
+
+    Game.make_guess, MultiGame.make_guess, Board.add_guess, Guess.check_guess
+    EventManager.handle_events and every Renderer.draw* method
+
+Only modules already imported are patched, so a text game never pulls in
+pygame for its GUI targets. Each wrapped function counts calls and keeps a
+histogram of its call times in power of two buckets, the total and slowest
+time, and the net change in allocated memory blocks
+(sys.getallocatedblocks). Times include any wrapped functions called inside.
+
+The counters are written as JSON when the process exits and whenever it
+gets SIGUSR1, so a running game can be sampled without stopping it.
+"""
+
+import atexit
+import functools
+import json
+import os
+import signal
+import sys
+import time
+from typing import Callable
+
+# module: (class, method names); a name ending in * matches every method with that prefix
+TARGETS = {
+    "models.game": ("Game", ["make_guess"]),
+    "models.multi_game": ("MultiGame", ["make_guess"]),
+    "models.board": ("Board", ["add_guess"]),
+    "models.guess": ("Guess", ["check_guess"]),
+    "gui.event_manager": ("EventManager", ["handle_events"]),
+    "gui.renderer": ("Renderer", ["draw*"]),
+}
+
+
+class Counter:
+    """Calls, times and allocations of one function"""
+
+    __slots__ = ("calls", "total_ns", "max_ns", "blocks", "buckets")
+
+    def __init__(self):
+        self.calls = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.blocks = 0
+        # buckets[k] counts calls taking under 2**k ns
+        self.buckets = [0] * 64
+
+    def add(self, elapsed_ns: int, blocks: int) -> None:
+        self.calls += 1
+        self.total_ns += elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+        self.blocks += blocks
+        self.buckets[elapsed_ns.bit_length()] += 1
+
+    def as_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "total_ms": self.total_ns / 1e6,
+            "mean_us": self.total_ns / self.calls / 1000 if self.calls else 0.0,
+            "max_us": self.max_ns / 1000,
+            "alloc_blocks": self.blocks,
+            # [upper bound in us, calls], for the buckets in use
+            "histogram": [
+                [(1 << k) / 1000, count] for k, count in enumerate(self.buckets) if count
+            ],
+        }
+
+
+class Profiler:
+    """Wraps the hot paths and collects their counters"""
+
+    def __init__(self):
+        self.counters: dict[str, Counter] = {}
+        self.patched: list[tuple[type, str, Callable]] = []
+        self.started = time.perf_counter()
+
+    def wrap(self, cls: type, name: str) -> None:
+        original = cls.__dict__[name]
+        counter = self.counters.setdefault(f"{cls.__name__}.{name}", Counter())
+        clock = time.perf_counter_ns
+        allocated = sys.getallocatedblocks
+
+        @functools.wraps(original)
+        def timed(*args, **kwargs):
+            blocks = allocated()
+            start = clock()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                counter.add(clock() - start, allocated() - blocks)
+
+        setattr(cls, name, timed)
+        self.patched.append((cls, name, original))
+
+    def install(self, targets: dict = TARGETS, prefix: str = "") -> None:
+        """Wrap the targets in every module imported so far"""
+        for module_name, (class_name, names) in targets.items():
+            module = sys.modules.get(prefix + module_name)
+            if module is None:
+                continue
+            cls = getattr(module, class_name)
+            for pattern in names:
+                if pattern.endswith("*"):
+                    matches = [
+                        name
+                        for name, value in vars(cls).items()
+                        if name.startswith(pattern[:-1]) and callable(value)
+                    ]
+                else:
+                    matches = [pattern]
+                for name in matches:
+                    self.wrap(cls, name)
+
+    def uninstall(self) -> None:
+        """Put back the original functions"""
+        for cls, name, original in reversed(self.patched):
+            setattr(cls, name, original)
+        self.patched = []
+
+    def report(self) -> dict:
+        return {
+            "pid": os.getpid(),
+            "elapsed_s": time.perf_counter() - self.started,
+            "functions": {
+                name: counter.as_dict() for name, counter in sorted(self.counters.items()) if counter.calls
+            },
+        }
+
+    def dump(self, path: str) -> None:
+        with open(path, "w") as file:
+            json.dump(self.report(), file, indent=2)
+
+
+def enable(path: str) -> Profiler:
+    """Start profiling, writing the counters to path at exit and on SIGUSR1"""
+    profiler = Profiler()
+    profiler.install()
+    atexit.register(profiler.dump, path)
+    if hasattr(signal, "SIGUSR1"):
+        signal.signal(signal.SIGUSR1, lambda signum, frame: profiler.dump(path))
+    return profiler
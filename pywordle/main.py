@@ -1,19 +1,108 @@
 import argparse
+import importlib
+import os
+import sys
+from typing import Callable
 
-from gui.main import main as gui_main
-from cli import main as cli_main
+# Subcommand name -> (module, help). A module is only imported when its
+# subcommand is used, so the plain game never pays for the others.
+COMMANDS = {
+    "simulate": ("simulate", "play every answer headless with a strategy"),
+    "build-tree": ("decision_tree", "precompute the decision tree of best guesses"),
+    "serve": ("server", "host games over JSON lines"),
+    "bench-gui": ("gui.benchmark", "time headless rendering of scripted games"),
+    "bench-startup": ("startup", "time imports for each way of starting the game"),
+}
+# Set to a file path to profile the hot paths, like --profile
+PROFILE_ENV = "PYWORDLE_PROFILE"
 
-def main(cli_mode: bool = False):
+
+def main(cli_mode: bool = False, boards: int = 1, hard_mode: bool = False, absurdle: bool = False):
     if cli_mode:
-        cli_main()
+        from cli import main as cli_main
+
+        cli_main(boards, hard_mode, absurdle)
     else:
-        gui_main()
+        # Only the GUI needs pygame
+        from gui.main import main as gui_main
 
+        gui_main(boards, hard_mode, absurdle)
 
-if __name__ == "__main__":
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    argv = sys.argv[1:] if argv is None else argv
     parser = argparse.ArgumentParser()
     parser.add_argument("--cli", action="store_true")
-    args = parser.parse_args()
-    
-    main(args.cli)
+    parser.add_argument(
+        "--batch",
+        nargs="?",
+        const="-",
+        metavar="FILE",
+        help="play games from JSON lines in FILE (default: stdin) and print results",
+    )
+    parser.add_argument("--reveal-answer", action="store_true", help="include answers in --batch results")
+    parser.add_argument(
+        "--boards", type=int, default=1, help="boards played at once: 2 for Dordle, 4 for Quordle, ..."
+    )
+    parser.add_argument("--hard", action="store_true", help="every guess must use the letters revealed so far")
+    parser.add_argument("--absurdle", action="store_true", help="the answer dodges your guesses for as long as it can")
+    parser.add_argument("--hints", action="store_true", help="suggest the best next guess under the board (GUI only)")
+    parser.add_argument("--stats", metavar="FILE", help="where finished games are recorded (default: ~/.pywordle/stats.sqlite3)")
+    parser.add_argument("--no-stats", action="store_true", help="don't record finished games")
+    parser.add_argument(
+        "--profile",
+        metavar="FILE",
+        default=os.environ.get(PROFILE_ENV),
+        help=f"time the hot paths, writing JSON to FILE at exit and on SIGUSR1 (or set {PROFILE_ENV})",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+    for name, (module, help) in COMMANDS.items():
+        subparser = subparsers.add_parser(name, help=help)
+        if name in argv:
+            importlib.import_module(module).add_arguments(subparser)
+    args = parser.parse_args(argv)
+    if (args.hard or args.absurdle) and args.boards != 1:
+        parser.error("--hard and --absurdle are only available with one board")
+    return args
+
+
+def open_stats(args: argparse.Namespace):
+    """The stats store for an interactive game, or None with --no-stats"""
+    if args.no_stats:
+        return None
+    from stats import DEFAULT_PATH, StatsStore
+
+    return StatsStore(args.stats or DEFAULT_PATH)
+
+
+def entry_point(args: argparse.Namespace) -> Callable[[], None]:
+    """Import what the chosen mode needs and return the function running it"""
+    if args.command is not None:
+        module = importlib.import_module(COMMANDS[args.command][0])
+        return lambda: module.main(args)
+    if args.batch is not None:
+        from cli import batch_main
 
+        return lambda: batch_main(args.batch, args.reveal_answer)
+    if args.cli:
+        from cli import main as cli_main
+
+        return lambda: cli_main(args.boards, args.hard, args.absurdle, open_stats(args))
+    from gui.main import main as gui_main
+
+    return lambda: gui_main(args.boards, args.hard, args.absurdle, args.hints, open_stats(args))
+
+
+def run(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    entry = entry_point(args)
+    if args.profile:
+        # After entry_point, so the modules the mode uses are loaded to patch
+        from instrumentation import enable
+
+        enable(args.profile)
+    entry()
+
+
+if __name__ == "__main__":
+    run()
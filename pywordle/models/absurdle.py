@@ -0,0 +1,48 @@
+"""Adversarial "Absurdle" games, where the answer is never fixed.
+
+After each guess the answers still possible are split by the feedback they
+would give, with one bincount over the pattern codes, and the game keeps the
+largest group. The board is handed that group's pattern and one of its words
+as the stand-in answer, so everything downstream sees a normal game.
+"""
+
+from typing import Sequence
+
+import numpy as np
+
+from models.game import WORD_LIST, Game
+from models.patterns import NUM_PATTERNS, encode_words, score_against
+
+
+class AbsurdleGame(Game):
+    def __init__(self, answers: Sequence[str] | None = None, **kwargs):
+        self.answer_pool = WORD_LIST if answers is None else list(answers)
+        if not self.answer_pool:
+            raise ValueError("Absurdle needs at least one answer")
+        super().__init__(self.answer_pool[0], **kwargs)
+        self.answer_letters = encode_words(self.answer_pool)
+        # Indexes into answer_pool of the answers consistent with every guess
+        self.remaining = np.arange(len(self.answer_pool))
+
+    def partition(self, guess: str) -> tuple[int, np.ndarray]:
+        """The pattern keeping the most answers alive, and those answers.
+
+        Ties go to the lowest pattern code, the least revealing one, so the
+        all correct pattern is only chosen when it is the sole group left.
+        """
+        patterns = score_against(guess, self.answer_letters[self.remaining])
+        pattern = int(np.argmax(np.bincount(patterns, minlength=NUM_PATTERNS)))
+        return pattern, self.remaining[patterns == pattern]
+
+    def make_guess(self, guess: str, pattern: int | None = None) -> None:
+        if pattern is not None or self.game_over:
+            super().make_guess(guess, pattern)
+            return
+        pattern, keep = self.partition(guess)
+        # Any answer left gives the same feedback, so the first stands in
+        self.board.answer = self.answer_pool[keep[0]]
+        super().make_guess(guess, pattern)
+        self.remaining = keep
+
+    def remaining_answers(self) -> list[str]:
+        return [self.answer_pool[i] for i in self.remaining]
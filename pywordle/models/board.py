@@ -1,20 +1,68 @@
+from models.candidates import CandidateIndex
 from models.guess import Guess
+from models.guess_index import GuessIndex
+from models.patterns import pattern_states
+
+# Best known status of each letter, ordered so a later guess can only raise it
+KEY_UNKNOWN = 0
+KEY_ABSENT = 1
+KEY_PRESENT = 2
+KEY_CORRECT = 3
 
 class Board:
     """A class for handling the answer and guesses of the game.
     """
-    def __init__(self, answer: str):
+    def __init__(
+        self,
+        answer: str,
+        allowed: GuessIndex | None = None,
+        candidate_index: CandidateIndex | None = None,
+    ):
         self.answer = answer
+        self.allowed = allowed
         self.guesses = []
         self.won = False
+        # Bitset of the answers still consistent with every guess so far
+        self.candidate_index = candidate_index
+        self.candidates = candidate_index.all if candidate_index else None
+        # One KEY_* entry per letter a-z, for keyboard colouring
+        self.key_status = bytearray(26)
+
+    def is_allowed(self, guess_word: str) -> bool:
+        """Check a word against the allowed guesses, if the board has any"""
+        return self.allowed is None or guess_word in self.allowed
 
-    def add_guess(self, guess_word: str) -> None:
+    def add_guess(self, guess_word: str, pattern: int | None = None) -> None:
+        """Add a guess, scoring it against the answer unless a pattern code is given"""
         if self.won:
             raise ValueError("Game already won")
-        
-        self.guesses.append(Guess(guess_word, self.answer))
+        if not self.is_allowed(guess_word):
+            raise ValueError("Not in word list")
+
+        guess = Guess(guess_word, self.answer, pattern)
+        if self.candidate_index is not None:
+            self.candidates = self.candidate_index.narrow(self.candidates, guess_word, guess.pattern)
+        self.guesses.append(guess)
+        self.update_key_status(guess_word, guess.pattern)
         if self.guesses[-1].all_correct:
             self.won = True
 
+    def update_key_status(self, guess_word: str, pattern: int) -> None:
+        for char, state in zip(guess_word, pattern_states(pattern, len(guess_word))):
+            index = ord(char) - 97
+            # Feedback states are one below the matching KEY_* value
+            if 0 <= index < 26 and state + 1 > self.key_status[index]:
+                self.key_status[index] = state + 1
+
+    @property
+    def remaining(self) -> int | None:
+        """Number of answers still possible, if the board tracks candidates"""
+        return None if self.candidates is None else self.candidates.bit_count()
+
+    def remaining_words(self) -> list[str]:
+        if self.candidate_index is None:
+            raise ValueError("Board does not track candidates")
+        return self.candidate_index.words_in(self.candidates)
+
     def __str__(self) -> str:
         return "\n".join(str(guess) for guess in self.guesses)
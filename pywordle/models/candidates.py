@@ -0,0 +1,73 @@
+"""Bitset indexes for narrowing down the possible answers.
+
+A set of candidate answers is a Python int used as a bitset, bit ``i`` standing
+for ``words[i]``. The index precomputes one bitset per (position, letter) and
+per (letter, minimum count), so applying the feedback of a guess is a handful
+of big-int ANDs rather than a scan over the words.
+"""
+
+from typing import Sequence
+
+import numpy as np
+
+from models.patterns import ABSENT, CORRECT, WORD_LENGTH, encode_words, pattern_states
+
+
+def _to_bitset(mask: np.ndarray) -> int:
+    """Turn a boolean array into an int with bit i set where mask[i] is"""
+    return int.from_bytes(np.packbits(mask, bitorder="little").tobytes(), "little")
+
+
+class CandidateIndex:
+    """Precomputed bitsets over a list of possible answers"""
+
+    def __init__(self, words: Sequence[str]):
+        self.words = list(words)
+        self.all = (1 << len(self.words)) - 1
+        letters = encode_words(self.words)
+        # at_position[p][l]: words with letter l at position p
+        self.at_position = [
+            [_to_bitset(letters[:, p] == l) for l in range(26)] for p in range(WORD_LENGTH)
+        ]
+        # at_least[l][k]: words with at least k copies of letter l
+        self.at_least = []
+        for l in range(26):
+            counts = (letters == l).sum(axis=1)
+            self.at_least.append([_to_bitset(counts >= k) for k in range(WORD_LENGTH + 2)])
+
+    def narrow(self, candidates: int, word: str, pattern: int) -> int:
+        """Keep only the candidates that would give this pattern for this guess"""
+        if len(word) != WORD_LENGTH:
+            raise ValueError(f"Guess must be {WORD_LENGTH} letters long")
+        hits = {}
+        capped = set()
+        for p, (char, state) in enumerate(zip(word, pattern_states(pattern))):
+            l = ord(char) - 97
+            if not 0 <= l < 26:
+                # No answer contains it, so it can only ever be absent
+                if state != ABSENT:
+                    return 0
+                continue
+            if state == CORRECT:
+                candidates &= self.at_position[p][l]
+            else:
+                candidates &= ~self.at_position[p][l]
+            if state == ABSENT:
+                capped.add(l)
+                hits.setdefault(l, 0)
+            else:
+                hits[l] = hits.get(l, 0) + 1
+        for l, count in hits.items():
+            candidates &= self.at_least[l][count]
+            if l in capped:
+                # An absent copy means the answer has exactly this many
+                candidates &= ~self.at_least[l][count + 1]
+        return candidates
+
+    def indices(self, candidates: int) -> np.ndarray:
+        """Positions in the word list of the words in a bitset"""
+        data = np.frombuffer(candidates.to_bytes((len(self.words) + 7) // 8, "little"), np.uint8)
+        return np.flatnonzero(np.unpackbits(data, bitorder="little")[: len(self.words)])
+
+    def words_in(self, candidates: int) -> list[str]:
+        return [self.words[i] for i in self.indices(candidates)]
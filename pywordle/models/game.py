@@ -1,6 +1,17 @@
+import os
 import random
+import struct
+from functools import cache
+
+import numpy as np
 
 from models.board import Board
+from models.candidates import CandidateIndex
+from models.guess_index import GuessIndex
+from models.hard_mode import HardMode
+from models.lexicon import BITS_PER_LETTER, Lexicon, pack_letters, pack_word, unpack_word
+from models.pattern_matrix import PatternMatrix
+from models.patterns import WORD_LENGTH, encode_words
 
 WORD_LIST = [
     "apple",
@@ -15,17 +26,109 @@ WORD_LIST = [
     "would",
 ]
 MAX_GUESSES = 6
+SNAPSHOT_HEADER = struct.Struct("<IB")
+SNAPSHOT_OVER = 0x80
+SNAPSHOT_HARD = 0x40
+DICTIONARY_ENV = "PYWORDLE_DICTIONARY"
+
+
+@cache
+def get_lexicon() -> Lexicon:
+    """Dictionary of allowed guesses, loaded on first use.
+
+    Read from the file named by PYWORDLE_DICTIONARY if set, otherwise made up
+    of the answer word list alone.
+    """
+    if os.environ.get(DICTIONARY_ENV):
+        return Lexicon.from_file(os.environ[DICTIONARY_ENV], lengths=[5])
+    return Lexicon.from_words(WORD_LIST)
+
+
+@cache
+def allowed_words() -> list[str]:
+    """Sorted five letter words that may be guessed, always including the answers"""
+    return sorted(set(get_lexicon().words()) | set(WORD_LIST))
+
+
+@cache
+def allowed_codes() -> np.ndarray:
+    """allowed_words() as sorted packed codes"""
+    return pack_letters(encode_words(allowed_words()))
+
+
+@cache
+def get_guess_index() -> GuessIndex | None:
+    """Index of allowed guesses, or None to accept any word when no dictionary is set"""
+    if not os.environ.get(DICTIONARY_ENV):
+        return None
+    return GuessIndex.from_words(allowed_words())
+
+
+@cache
+def get_candidate_index() -> CandidateIndex:
+    """Bitset index over the answers, shared by every game"""
+    return CandidateIndex(WORD_LIST)
+
+
+@cache
+def pattern_matrix() -> PatternMatrix:
+    """Shared guess x answer pattern matrix for the word lists, opened on first use"""
+    return PatternMatrix(allowed_words(), WORD_LIST)
+
 
 class Game:
-    def __init__(self):
-        answer = random.choice(WORD_LIST)
-        self.board = Board(answer)
+    def __init__(self, answer: str | None = None, track_candidates: bool = True, hard_mode: bool = False):
+        if answer is None:
+            answer = random.choice(WORD_LIST)
+        # Games that never ask for the remaining answers can skip narrowing them
+        candidate_index = get_candidate_index() if track_candidates else None
+        self.board = Board(answer, allowed=get_guess_index(), candidate_index=candidate_index)
         self.game_over = False
         self.won = False
         self.max_attempts = MAX_GUESSES
+        self.hard_mode = HardMode() if hard_mode else None
+        # (guess count, codes) of the allowed words meeting hard mode
+        self._legal_codes: tuple[int, np.ndarray] | None = None
 
-    def make_guess(self, guess: str) -> None:
-        self.board.add_guess(guess)
+    def is_allowed(self, guess: str) -> bool:
+        return self.board.is_allowed(guess)
+
+    def hard_mode_violation(self, guess: str) -> str | None:
+        """Why a guess breaks hard mode, or None if it does not (or hard mode is off)"""
+        return None if self.hard_mode is None else self.hard_mode.violation(guess)
+
+    def legal_codes(self) -> np.ndarray:
+        """Packed codes of the allowed words meeting hard mode, filtered once per guess"""
+        count = len(self.board.guesses)
+        if self._legal_codes is None or self._legal_codes[0] != count:
+            codes = allowed_codes()
+            if self.hard_mode is not None:
+                codes = codes[self.hard_mode.filter(codes)]
+            self._legal_codes = (count, codes)
+        return self._legal_codes[1]
+
+    def allows_prefix(self, prefix: str) -> bool:
+        """Whether a legal guess could still start with the letters typed so far"""
+        if self.hard_mode is None:
+            return True
+        if self.board.allowed is None:
+            # Any word may be guessed, so only the constraint itself matters
+            return self.hard_mode.allows_prefix(prefix)
+        codes = self.legal_codes()
+        shift = BITS_PER_LETTER * (WORD_LENGTH - len(prefix))
+        low = pack_word(prefix) << shift
+        return bool(np.searchsorted(codes, low) < np.searchsorted(codes, low + (1 << shift)))
+
+    def make_guess(self, guess: str, pattern: int | None = None) -> None:
+        if self.game_over and not self.won:
+            raise ValueError("Game is over")
+        if self.hard_mode is not None and self.is_allowed(guess):
+            reason = self.hard_mode.violation(guess)
+            if reason is not None:
+                raise ValueError(reason)
+        self.board.add_guess(guess, pattern)
+        if self.hard_mode is not None:
+            self.hard_mode.update(guess, self.board.guesses[-1].pattern)
         
         if self.board.won:
             self.game_over = True
@@ -33,6 +136,24 @@ class Game:
         elif len(self.board.guesses) >= self.max_attempts:
             self.game_over = True
             
+    @property
+    def boards(self) -> list[Board]:
+        """The game's one board, as a list like MultiGame's"""
+        return [self.board]
+
+    @property
+    def answers(self) -> list[str]:
+        return [self.board.answer]
+
+    @property
+    def attempts(self) -> int:
+        return len(self.board.guesses)
+
+    @property
+    def key_status(self) -> bytearray:
+        """Best known KEY_* status of each letter a-z (see models.board)"""
+        return self.board.key_status
+
     @property
     def answer(self) -> str:
         return self.board.answer
@@ -41,5 +162,29 @@ class Game:
     def answer(self, value: str) -> None:
         self.board.answer = value
             
+    def to_snapshot(self) -> bytes:
+        """Pack the game into a few bytes: the answer and guesses as packed words.
+
+        Raises ValueError if a word has letters outside a-z, which cannot be packed.
+        """
+        guesses = [pack_word(str(guess)) for guess in self.board.guesses]
+        flags = len(guesses) | (SNAPSHOT_OVER if self.game_over else 0)
+        if self.hard_mode is not None:
+            flags |= SNAPSHOT_HARD
+        header = SNAPSHOT_HEADER.pack(pack_word(self.answer), flags)
+        return header + struct.pack(f"<{len(guesses)}I", *guesses)
+
+    @classmethod
+    def from_snapshot(cls, data: bytes) -> "Game":
+        """Rebuild a game from to_snapshot, rescoring its guesses"""
+        answer, flags = SNAPSHOT_HEADER.unpack_from(data)
+        count = flags & ~(SNAPSHOT_OVER | SNAPSHOT_HARD)
+        guesses = struct.unpack_from(f"<{count}I", data, SNAPSHOT_HEADER.size)
+        game = cls(unpack_word(answer), hard_mode=bool(flags & SNAPSHOT_HARD))
+        for guess in guesses:
+            game.make_guess(unpack_word(guess))
+        game.game_over = bool(flags & SNAPSHOT_OVER)
+        return game
+
     def __str__(self) -> str:
         return str(self.board)
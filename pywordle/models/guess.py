@@ -1,23 +1,22 @@
 from models.letter import Letter
+from models.patterns import CORRECT, PRESENT, all_correct_code, pattern_states, score_word
 
 class Guess:
     """
-    A class that represents a guess in the game. With a check method to check if the guess is correct.
+    A class that represents a guess in the game. The feedback is stored as a pattern code
+    (see models.patterns) and expanded into one Letter per character.
     """
-    def __init__(self, word: str, answer: str):
+    def __init__(self, word: str, answer: str, pattern: int | None = None):
         self.letters = [Letter(char, False, False, False) for char in word]
-        self.check_guess(answer)
-        self.all_correct = all(letter.is_correct for letter in self.letters)
+        self.check_guess(answer, pattern)
+        self.all_correct = self.pattern == all_correct_code(len(word))
 
-    def check_guess(self, answer: str) -> None:
-        for i, letter in enumerate(self.letters):
-            if letter.char == answer[i]:
-                letter.is_correct = True
-            elif letter.char in answer:
-                letter.is_present = True
-            else:
-                letter.is_absent = True
+    def check_guess(self, answer: str, pattern: int | None = None) -> None:
+        self.pattern = score_word(str(self), answer) if pattern is None else pattern
+        for letter, state in zip(self.letters, pattern_states(self.pattern, len(self.letters))):
+            letter.is_correct = state == CORRECT
+            letter.is_present = state == PRESENT
+            letter.is_absent = not (letter.is_correct or letter.is_present)
 
     def __str__(self) -> str:
         return "".join([letter.char for letter in self.letters])
-
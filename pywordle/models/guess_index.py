@@ -0,0 +1,50 @@
+"""Constant time lookup of allowed five letter guesses.
+
+The index is a bitset with one bit for every possible packed five letter word
+(see models.lexicon), 2 ** 25 bits or 4 MiB whatever the dictionary size. A
+lookup packs the word and tests one bit, without allocating.
+"""
+
+from typing import Iterable
+
+import numpy as np
+
+from models.lexicon import BITS_PER_LETTER, Lexicon, pack_letters
+from models.patterns import WORD_LENGTH, encode_words
+
+
+class GuessIndex:
+    """Bitset over packed five letter words"""
+
+    def __init__(self, codes: np.ndarray):
+        codes = np.asarray(codes, dtype=np.uint32)
+        bits = np.zeros(1 << (BITS_PER_LETTER * WORD_LENGTH - 3), dtype=np.uint8)
+        np.bitwise_or.at(bits, codes >> 3, np.left_shift(1, codes & 7).astype(np.uint8))
+        self._bits = bits.tobytes()
+        self.size = len(np.unique(codes))
+
+    @classmethod
+    def from_words(cls, words: Iterable[str]) -> "GuessIndex":
+        return cls(pack_letters(encode_words(words)))
+
+    @classmethod
+    def from_lexicon(cls, lexicon: Lexicon) -> "GuessIndex":
+        return cls(lexicon.codes(WORD_LENGTH))
+
+    def __contains__(self, word: str) -> bool:
+        if len(word) != WORD_LENGTH:
+            return False
+        try:
+            b = word.lower().encode("ascii")
+        except UnicodeEncodeError:
+            return False
+        if not b.isalpha():
+            return False
+        # pack_word unrolled for five letters
+        code = (
+            (b[0] - 97) << 20 | (b[1] - 97) << 15 | (b[2] - 97) << 10 | (b[3] - 97) << 5 | (b[4] - 97)
+        )
+        return bool(self._bits[code >> 3] & (1 << (code & 7)))
+
+    def __len__(self) -> int:
+        return self.size
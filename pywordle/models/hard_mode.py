@@ -0,0 +1,112 @@
+"""Hard mode: every guess must use what earlier guesses revealed.
+
+The feedback so far is compiled into a few masks over packed words (see
+models.lexicon), however many guesses produced it:
+
+    fixed_mask / fixed_code  letters revealed correct, in place in a packed word
+    banned                   per position, a 26 bit set of letters revealed
+                             present but not there
+    min_counts               how many of each letter a guess must contain
+
+so checking a guess costs the same on the sixth turn as on the second, and
+a whole array of packed codes can be filtered with a handful of NumPy
+operations.
+"""
+
+import numpy as np
+
+from models.lexicon import BITS_PER_LETTER, LETTER_MASK, pack_word
+from models.patterns import ABSENT, CORRECT, PRESENT, WORD_LENGTH, pattern_states
+
+
+class HardMode:
+    """Constraint on the next guess from all feedback revealed so far"""
+
+    def __init__(self, length: int = WORD_LENGTH):
+        self.length = length
+        self.fixed_mask = 0
+        self.fixed_code = 0
+        self.banned = [0] * length
+        self.min_counts = bytearray(26)
+        # Letters with a non zero min count, so checks skip the rest
+        self.required: list[int] = []
+
+    def shift(self, position: int) -> int:
+        return BITS_PER_LETTER * (self.length - 1 - position)
+
+    def fixed_letter(self, position: int) -> int | None:
+        shift = self.shift(position)
+        if not (self.fixed_mask >> shift) & LETTER_MASK:
+            return None
+        return (self.fixed_code >> shift) & LETTER_MASK
+
+    def update(self, word: str, pattern: int) -> None:
+        """Fold in the feedback for a guess"""
+        counts = bytearray(26)
+        for position, (char, state) in enumerate(zip(word, pattern_states(pattern, len(word)))):
+            letter = ord(char) - 97
+            if state == CORRECT:
+                self.fixed_mask |= LETTER_MASK << self.shift(position)
+                self.fixed_code |= letter << self.shift(position)
+            elif state == PRESENT:
+                self.banned[position] |= 1 << letter
+            if state != ABSENT:
+                counts[letter] += 1
+        for letter, count in enumerate(counts):
+            if count > self.min_counts[letter]:
+                self.min_counts[letter] = count
+        self.required = [letter for letter in range(26) if self.min_counts[letter]]
+
+    def violation(self, word: str) -> str | None:
+        """Why a guess breaks hard mode, or None if it is fine"""
+        if pack_word(word) & self.fixed_mask != self.fixed_code:
+            for position, char in enumerate(word):
+                fixed = self.fixed_letter(position)
+                if fixed is not None and fixed != ord(char) - 97:
+                    return f"Letter {position + 1} must be {chr(97 + fixed).upper()}"
+        for position, char in enumerate(word):
+            if (self.banned[position] >> (ord(char) - 97)) & 1:
+                return f"Letter {position + 1} can't be {char.upper()}"
+        for letter in self.required:
+            char = chr(97 + letter)
+            if word.count(char) < self.min_counts[letter]:
+                if self.min_counts[letter] == 1:
+                    return f"Guess must contain {char.upper()}"
+                return f"Guess must contain {self.min_counts[letter]} {char.upper()}s"
+        return None
+
+    def allows(self, word: str) -> bool:
+        return self.violation(word) is None
+
+    def allows_prefix(self, prefix: str) -> bool:
+        """Whether some word starting with ``prefix`` could meet the constraint"""
+        have = bytearray(26)
+        free = 0
+        for position in range(self.length):
+            fixed = self.fixed_letter(position)
+            if position < len(prefix):
+                letter = ord(prefix[position]) - 97
+                if fixed is not None and fixed != letter:
+                    return False
+                if (self.banned[position] >> letter) & 1:
+                    return False
+                have[letter] += 1
+            elif fixed is not None:
+                have[fixed] += 1
+            else:
+                free += 1
+        missing = sum(max(0, self.min_counts[letter] - have[letter]) for letter in self.required)
+        return missing <= free
+
+    def filter(self, codes: np.ndarray) -> np.ndarray:
+        """Boolean mask of the packed codes meeting the constraint"""
+        codes = np.asarray(codes)
+        keep = (codes & codes.dtype.type(self.fixed_mask)) == self.fixed_code
+        letters = [(codes >> codes.dtype.type(self.shift(p))) & LETTER_MASK for p in range(self.length)]
+        for position, banned in enumerate(self.banned):
+            if banned:
+                keep &= ((np.uint32(banned) >> letters[position].astype(np.uint32)) & 1) == 0
+        for letter in self.required:
+            count = sum((position_letters == letter).astype(np.uint8) for position_letters in letters)
+            keep &= count >= self.min_counts[letter]
+        return keep
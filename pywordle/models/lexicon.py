@@ -0,0 +1,162 @@
+"""Dictionary loading and packed word storage.
+
+Words are stored packed at 5 bits per letter, first letter in the highest bits,
+so a five letter word fits in a uint32 and sorting the codes sorts the words
+alphabetically. A Lexicon keeps one sorted, deduplicated code array per word
+length instead of a Python str per word.
+"""
+
+import gzip
+from collections import defaultdict
+from pathlib import Path
+from typing import BinaryIO, Iterable
+
+import numpy as np
+
+from models.patterns import WORD_LENGTH
+
+BITS_PER_LETTER = 5
+LETTER_MASK = (1 << BITS_PER_LETTER) - 1
+MAX_PACKED_LENGTH = 12  # 60 bits, the most a uint64 holds
+READ_BLOCK_SIZE = 1 << 22
+
+
+def code_dtype(length: int) -> np.dtype:
+    """Smallest unsigned dtype holding a packed word of this length"""
+    if length > MAX_PACKED_LENGTH:
+        raise ValueError(f"Words longer than {MAX_PACKED_LENGTH} letters cannot be packed")
+    return np.dtype(np.uint32 if length * BITS_PER_LETTER <= 32 else np.uint64)
+
+
+def pack_word(word: str) -> int:
+    """Pack a lowercase ascii word into an integer"""
+    code = 0
+    for char in word:
+        letter = ord(char) - 97
+        if not 0 <= letter < 26:
+            raise ValueError(f"Cannot pack {word!r}, only a-z can be packed")
+        code = (code << BITS_PER_LETTER) | letter
+    return code
+
+
+def unpack_word(code: int, length: int = WORD_LENGTH) -> str:
+    """Unpack an integer produced by pack_word"""
+    chars = []
+    for _ in range(length):
+        chars.append(chr(97 + (code & LETTER_MASK)))
+        code >>= BITS_PER_LETTER
+    return "".join(reversed(chars))
+
+
+def pack_letters(letters: np.ndarray) -> np.ndarray:
+    """Pack an (n, length) array of letter indices into codes"""
+    length = letters.shape[1]
+    dtype = code_dtype(length)
+    codes = np.zeros(letters.shape[0], dtype=dtype)
+    for i in range(length):
+        codes = (codes << dtype.type(BITS_PER_LETTER)) | letters[:, i].astype(dtype)
+    return codes
+
+
+def unpack_letters(codes: np.ndarray, length: int = WORD_LENGTH) -> np.ndarray:
+    """Unpack codes into an (n, length) uint8 array of letter indices.
+
+    The result is the word encoding used by models.patterns.
+    """
+    codes = np.asarray(codes)
+    shifts = BITS_PER_LETTER * np.arange(length - 1, -1, -1, dtype=codes.dtype)
+    return ((codes[:, None] >> shifts) & LETTER_MASK).astype(np.uint8)
+
+
+def unpack_words(codes: np.ndarray, length: int = WORD_LENGTH) -> list[str]:
+    """Unpack codes into a list of str"""
+    letters = unpack_letters(codes, length) + ord("a")
+    data = letters.tobytes().decode("ascii")
+    return [data[i : i + length] for i in range(0, len(data), length)]
+
+
+def _pack_raw(words: list[bytes], length: int) -> np.ndarray:
+    """Pack same-length raw words, dropping any with a non a-z byte"""
+    letters = np.frombuffer(b"".join(words), dtype=np.uint8).reshape(len(words), length)
+    letters = letters - np.uint8(97)
+    letters = letters[(letters < 26).all(axis=1)]
+    return pack_letters(letters)
+
+
+class Lexicon:
+    """A dictionary of words bucketed by length and stored as packed codes"""
+
+    def __init__(self, buckets: dict[int, np.ndarray]):
+        self.buckets = {length: np.unique(codes) for length, codes in buckets.items()}
+
+    @classmethod
+    def from_words(cls, words: Iterable[str], lengths: Iterable[int] | None = None) -> "Lexicon":
+        """Build a lexicon from an iterable of str"""
+        return cls._from_blocks([" ".join(words).encode("ascii", "replace")], lengths)
+
+    @classmethod
+    def from_file(cls, path: str | Path, lengths: Iterable[int] | None = None) -> "Lexicon":
+        """Stream a one-word-per-line file, optionally gzip compressed.
+
+        Words are lowercased, anything that is not plain a-z is dropped and
+        duplicates are removed. Only the given lengths are kept, if any.
+        """
+        with open(path, "rb") as raw:
+            gzipped = raw.read(2) == b"\x1f\x8b"
+        opener = gzip.open if gzipped else open
+        with opener(path, "rb") as f:
+            return cls._from_blocks(_read_blocks(f), lengths)
+
+    @classmethod
+    def _from_blocks(cls, blocks: Iterable[bytes], lengths: Iterable[int] | None) -> "Lexicon":
+        wanted = set(lengths) if lengths is not None else set(range(1, MAX_PACKED_LENGTH + 1))
+        packed: dict[int, list[np.ndarray]] = defaultdict(list)
+        for block in blocks:
+            by_length: dict[int, list[bytes]] = defaultdict(list)
+            for word in block.lower().split():
+                by_length[len(word)].append(word)
+            for length, words in by_length.items():
+                if length in wanted:
+                    packed[length].append(_pack_raw(words, length))
+        return cls({length: np.concatenate(parts) for length, parts in packed.items()})
+
+    def codes(self, length: int = WORD_LENGTH) -> np.ndarray:
+        """Sorted packed codes of all words of a length"""
+        if length not in self.buckets:
+            return np.empty(0, dtype=code_dtype(length))
+        return self.buckets[length]
+
+    def words(self, length: int = WORD_LENGTH) -> list[str]:
+        """Sorted words of a length as str"""
+        return unpack_words(self.codes(length), length)
+
+    @property
+    def lengths(self) -> list[int]:
+        return sorted(length for length, codes in self.buckets.items() if len(codes))
+
+    @property
+    def nbytes(self) -> int:
+        return sum(codes.nbytes for codes in self.buckets.values())
+
+    def __contains__(self, word: str) -> bool:
+        if not (0 < len(word) <= MAX_PACKED_LENGTH and word.isascii() and word.isalpha()):
+            return False
+        codes = self.codes(len(word))
+        code = pack_word(word.lower())
+        i = np.searchsorted(codes, code)
+        return bool(i < len(codes) and codes[i] == code)
+
+    def __len__(self) -> int:
+        return sum(len(codes) for codes in self.buckets.values())
+
+
+def _read_blocks(f: BinaryIO) -> Iterable[bytes]:
+    """Read a file in large blocks that always end on a line boundary"""
+    tail = b""
+    while block := f.read(READ_BLOCK_SIZE):
+        block = tail + block
+        cut = block.rfind(b"\n") + 1
+        tail = block[cut:]
+        yield block[:cut]
+    if tail:
+        yield tail
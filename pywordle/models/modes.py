@@ -0,0 +1,25 @@
+"""Building a game for the options chosen on the command line"""
+
+from models.absurdle import AbsurdleGame
+from models.game import Game
+from models.multi_game import MultiGame
+
+# Names of the usual board counts, for stats and display
+BOARD_MODES = {1: "classic", 2: "dordle", 4: "quordle", 8: "octordle"}
+
+
+def new_game(boards: int = 1, hard_mode: bool = False, absurdle: bool = False) -> Game | MultiGame:
+    """A Game, AbsurdleGame or MultiGame for the chosen mode"""
+    if boards != 1:
+        if hard_mode or absurdle:
+            raise ValueError("Hard mode and Absurdle are only available with one board")
+        return MultiGame(boards=boards)
+    if absurdle:
+        return AbsurdleGame(hard_mode=hard_mode)
+    return Game(hard_mode=hard_mode)
+
+
+def mode_name(boards: int = 1, hard_mode: bool = False, absurdle: bool = False) -> str:
+    """Name of a mode, such as classic, quordle or absurdle-hard"""
+    name = "absurdle" if absurdle else BOARD_MODES.get(boards, f"{boards}-board")
+    return f"{name}-hard" if hard_mode else name
@@ -0,0 +1,85 @@
+"""Multi-board games (Dordle, Quordle, Octordle, ...).
+
+Every guess is played on all the boards not yet solved at once, sharing one
+guess limit. The guess is scored against every answer in a single batched
+call and each board is handed its pattern code, so no board scores on its
+own.
+"""
+
+import random
+
+from models.board import Board
+from models.game import MAX_GUESSES, WORD_LIST, get_candidate_index, get_guess_index
+from models.patterns import encode_words, score_against
+
+
+class MultiGame:
+    def __init__(
+        self,
+        answers: list[str] | None = None,
+        boards: int = 4,
+        max_attempts: int | None = None,
+        track_candidates: bool = True,
+    ):
+        if answers is None:
+            if boards <= len(WORD_LIST):
+                answers = random.sample(WORD_LIST, boards)
+            else:
+                answers = random.choices(WORD_LIST, k=boards)
+        if not answers:
+            raise ValueError("A game needs at least one board")
+        allowed = get_guess_index()
+        candidate_index = get_candidate_index() if track_candidates else None
+        self.boards = [Board(answer, allowed, candidate_index) for answer in answers]
+        self.answer_letters = encode_words(answers)
+        # One extra guess per extra board: 7 for Dordle, 9 for Quordle, ...
+        self.max_attempts = len(answers) + MAX_GUESSES - 1 if max_attempts is None else max_attempts
+        self.attempts = 0
+        self.game_over = False
+        self.won = False
+        # Best KEY_* status of each letter a-z over every board
+        self.key_status = bytearray(26)
+        # Indexes of the boards the last guess was played on
+        self.changed: list[int] = []
+        # Hard mode is only offered for single board games
+        self.hard_mode = None
+
+    @property
+    def answers(self) -> list[str]:
+        return [board.answer for board in self.boards]
+
+    def is_allowed(self, guess: str) -> bool:
+        return self.boards[0].is_allowed(guess)
+
+    def hard_mode_violation(self, guess: str) -> str | None:
+        return None
+
+    def make_guess(self, guess: str) -> list[int]:
+        """Play a guess on every unsolved board, returning their indexes"""
+        if self.game_over:
+            raise ValueError("Game is over")
+        if not self.is_allowed(guess):
+            raise ValueError("Not in word list")
+        patterns = score_against(guess, self.answer_letters)
+        self.changed = [i for i, board in enumerate(self.boards) if not board.won]
+        for i in self.changed:
+            self.boards[i].add_guess(guess, int(patterns[i]))
+        self.attempts += 1
+
+        # Only the guessed letters can have changed status
+        for char in set(guess):
+            index = ord(char) - 97
+            for i in self.changed:
+                status = self.boards[i].key_status[index]
+                if status > self.key_status[index]:
+                    self.key_status[index] = status
+
+        if all(board.won for board in self.boards):
+            self.game_over = True
+            self.won = True
+        elif self.attempts >= self.max_attempts:
+            self.game_over = True
+        return self.changed
+
+    def __str__(self) -> str:
+        return "\n\n".join(str(board) for board in self.boards)
@@ -0,0 +1,170 @@
+"""Persistent guess x answer pattern matrix.
+
+The matrix holds the pattern code (see models.patterns) of every guess against
+every answer. It is built once per pair of word lists, written to disk as a
+uint8 ``.npy`` file named after a hash of both lists and opened as a read-only
+memory map, so every process using the same lists shares the same pages.
+"""
+
+import hashlib
+import json
+import os
+from contextlib import contextmanager
+from functools import cached_property
+from pathlib import Path
+from typing import Iterator, Sequence
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from models.patterns import encode_words, score_batch
+
+CACHE_DIR_ENV = "PYWORDLE_CACHE_DIR"
+# Upper bound on guess x answer cells scored per chunk while building
+CHUNK_CELLS = 1 << 21
+
+_open_matrices: dict[Path, np.ndarray] = {}
+
+
+def default_cache_dir() -> Path:
+    """Directory holding cached matrices, overridable through PYWORDLE_CACHE_DIR"""
+    if CACHE_DIR_ENV in os.environ:
+        return Path(os.environ[CACHE_DIR_ENV])
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "pywordle"
+
+
+def word_lists_key(guesses: Sequence[str], answers: Sequence[str]) -> str:
+    """Hash identifying a pair of word lists, including their order"""
+    digest = hashlib.sha256()
+    digest.update("\n".join(guesses).encode())
+    digest.update(b"\0")
+    digest.update("\n".join(answers).encode())
+    return digest.hexdigest()[:32]
+
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive lock on ``path``, which the OS drops if the process dies"""
+    with open(path, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    pass  # LK_LOCK gives up after 10 seconds
+        yield  # Closing the file releases the lock
+
+
+def build_pattern_matrix(
+    guesses: Sequence[str],
+    answers: Sequence[str],
+    path: Path,
+    chunk_rows: int | None = None,
+) -> None:
+    """Build the matrix into ``path`` a chunk of guess rows at a time.
+
+    Rows are written straight into a memory-mapped ``.partial`` file, so the
+    full matrix never has to fit in memory. A ``.progress`` file records how
+    many rows are done, and an interrupted build resumes from there. The
+    finished file is moved into place atomically. Processes cold starting
+    together take turns on a ``.lock`` file, so only the first one builds and
+    the rest find the finished matrix.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with file_lock(path.with_name(path.name + ".lock")):
+        if not path.exists():
+            _build(guesses, answers, path, chunk_rows)
+
+
+def _build(guesses: Sequence[str], answers: Sequence[str], path: Path, chunk_rows: int | None) -> None:
+    partial = path.with_name(path.name + ".partial")
+    progress = path.with_name(path.name + ".progress")
+    shape = (len(guesses), len(answers))
+
+    done = 0
+    if partial.exists() and progress.exists():
+        state = json.loads(progress.read_text())
+        if tuple(state["shape"]) == shape:
+            done = state["rows"]
+    if done:
+        matrix = np.load(partial, mmap_mode="r+")
+    else:
+        matrix = np.lib.format.open_memmap(partial, mode="w+", dtype=np.uint8, shape=shape)
+
+    if chunk_rows is None:
+        chunk_rows = max(1, CHUNK_CELLS // max(1, len(answers)))
+    encoded_answers = encode_words(answers)
+    for start in range(done, len(guesses), chunk_rows):
+        stop = min(start + chunk_rows, len(guesses))
+        matrix[start:stop] = score_batch(encode_words(guesses[start:stop]), encoded_answers)
+        matrix.flush()
+        progress.write_text(json.dumps({"shape": shape, "rows": stop}))
+
+    del matrix
+    os.replace(partial, path)
+    progress.unlink(missing_ok=True)
+
+
+def load_pattern_matrix(
+    guesses: Sequence[str],
+    answers: Sequence[str],
+    cache_dir: Path | None = None,
+) -> np.ndarray:
+    """Open the cached matrix for these word lists, building it if needed"""
+    cache_dir = default_cache_dir() if cache_dir is None else Path(cache_dir)
+    path = cache_dir / f"patterns-{word_lists_key(guesses, answers)}.npy"
+    if path in _open_matrices:
+        return _open_matrices[path]
+    if not path.exists():
+        build_pattern_matrix(guesses, answers, path)
+    matrix = np.load(path, mmap_mode="r")
+    if matrix.shape != (len(guesses), len(answers)):
+        # A truncated or foreign file under our name, rebuild it
+        del matrix
+        path.unlink()
+        build_pattern_matrix(guesses, answers, path)
+        matrix = np.load(path, mmap_mode="r")
+    _open_matrices[path] = matrix
+    return matrix
+
+
+class PatternMatrix:
+    """A pattern matrix together with the word lists indexing its rows and columns"""
+
+    def __init__(
+        self,
+        guesses: Sequence[str],
+        answers: Sequence[str],
+        cache_dir: Path | None = None,
+    ):
+        self.guesses = list(guesses)
+        self.answers = list(answers)
+        self.cache_dir = cache_dir
+
+    @cached_property
+    def matrix(self) -> np.ndarray:
+        """The memory-mapped matrix, opened on first access"""
+        return load_pattern_matrix(self.guesses, self.answers, self.cache_dir)
+
+    @cached_property
+    def guess_rows(self) -> dict[str, int]:
+        return {word: i for i, word in enumerate(self.guesses)}
+
+    @cached_property
+    def answer_columns(self) -> dict[str, int]:
+        return {word: i for i, word in enumerate(self.answers)}
+
+    def pattern(self, guess: str, answer: str) -> int:
+        """Look up the pattern code of one guess against one answer"""
+        return int(self.matrix[self.guess_rows[guess], self.answer_columns[answer]])
@@ -0,0 +1,123 @@
+"""Feedback pattern engine.
+
+A feedback pattern is stored as a single base-3 integer: position ``i`` of the
+guess contributes ``state * 3 ** i`` where state is ABSENT, PRESENT or CORRECT.
+Words are encoded as arrays of letter indices (``a`` = 0 ... ``z`` = 25) so that
+one guess can be scored against thousands of answers in a single NumPy call.
+"""
+
+from functools import cache
+from typing import Iterable, Sequence
+
+import numpy as np
+
+ABSENT = 0
+PRESENT = 1
+CORRECT = 2
+
+WORD_LENGTH = 5
+NUM_PATTERNS = 3**WORD_LENGTH
+
+
+def all_correct_code(length: int = WORD_LENGTH) -> int:
+    """Pattern code of a fully correct guess of the given length"""
+    return 3**length - 1
+
+
+def score_word(guess: str, answer: str) -> int:
+    """Score a single guess against a single answer.
+
+    Letters matched in place are consumed first, then the remaining answer
+    letters are handed out left to right, so a repeated guess letter is only
+    marked present as many times as it is still available in the answer.
+    """
+    states = [ABSENT] * len(guess)
+    remaining: dict[str, int] = {}
+    for i, char in enumerate(guess):
+        if i < len(answer) and char == answer[i]:
+            states[i] = CORRECT
+    for i, char in enumerate(answer):
+        if i >= len(guess) or guess[i] != char:
+            remaining[char] = remaining.get(char, 0) + 1
+    for i, char in enumerate(guess):
+        if states[i] != CORRECT and remaining.get(char, 0) > 0:
+            states[i] = PRESENT
+            remaining[char] -= 1
+    return encode_pattern(states)
+
+
+def encode_pattern(states: Sequence[int]) -> int:
+    """Turn a sequence of per-letter states into a pattern code"""
+    code = 0
+    for state in reversed(states):
+        code = code * 3 + state
+    return code
+
+
+def decode_pattern(code: int, length: int = WORD_LENGTH) -> list[int]:
+    """Turn a pattern code back into a list of per-letter states"""
+    states = []
+    for _ in range(length):
+        code, state = divmod(code, 3)
+        states.append(state)
+    return states
+
+
+@cache
+def pattern_states(code: int, length: int = WORD_LENGTH) -> tuple[int, ...]:
+    """decode_pattern as a shared tuple, for callers decoding on every guess"""
+    return tuple(decode_pattern(code, length))
+
+
+def encode_words(words: Iterable[str], length: int = WORD_LENGTH) -> np.ndarray:
+    """Encode words as an (n, length) uint8 array of letter indices"""
+    words = list(words)
+    if not words:
+        return np.empty((0, length), dtype=np.uint8)
+    for word in words:
+        if len(word) != length:
+            raise ValueError(f"Word {word!r} is not {length} letters long")
+    try:
+        data = np.frombuffer("".join(words).lower().encode("ascii"), dtype=np.uint8)
+    except UnicodeEncodeError:
+        raise ValueError("Words can only contain letters a-z") from None
+    letters = (data.reshape(len(words), length) - ord("a")).astype(np.uint8)
+    if (letters >= 26).any():
+        raise ValueError("Words can only contain letters a-z")
+    return letters
+
+
+def score_batch(guesses: np.ndarray, answers: np.ndarray) -> np.ndarray:
+    """Score every encoded guess against every encoded answer.
+
+    Returns a (len(guesses), len(answers)) uint8 array of pattern codes. The
+    duplicate letter rules match :func:`score_word`.
+    """
+    guesses = np.asarray(guesses, dtype=np.uint8)
+    answers = np.asarray(answers, dtype=np.uint8)
+    length = guesses.shape[1]
+
+    g = guesses[:, None, :]
+    a = answers[None, :, :]
+    correct = g == a
+
+    codes = np.zeros((guesses.shape[0], answers.shape[0]), dtype=np.uint8)
+    present = []
+    for i in range(length):
+        letter = g[:, :, i : i + 1]
+        # Copies of this letter in the answer that are not already matched
+        available = ((a == letter) & ~correct).sum(axis=2)
+        # Copies already handed out to earlier guess positions
+        used = np.zeros_like(available)
+        for j in range(i):
+            used += (guesses[:, j] == guesses[:, i])[:, None] & present[j]
+        is_present = ~correct[:, :, i] & (available > used)
+        present.append(is_present)
+        state = correct[:, :, i] * np.uint8(CORRECT) + is_present * np.uint8(PRESENT)
+        codes += state * np.uint8(3**i)
+    return codes
+
+
+def score_against(guess: str, answers: np.ndarray) -> np.ndarray:
+    """Score one guess against an (n, length) array of encoded answers"""
+    return score_batch(encode_words([guess], len(guess)), answers)[0]
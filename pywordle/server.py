@@ -0,0 +1,183 @@
+"""Asyncio game server speaking JSON lines.
+
+Every request is one JSON object per line with an ``op`` of create, guess,
+state, resign or stats, plus ``session`` and ``word`` where needed. An optional
+``id`` is echoed back. Every response is one JSON object per line with
+``ok`` set, and either the session state or an ``error``.
+
+Requests on a connection are handled one at a time and the next line is only
+read once the response has been flushed, so a client that stops reading
+stops being served. A guess is scored inline on the event loop: scoring takes
+microseconds and holds the GIL, so handing it to a thread would only add a
+hand-off to every request.
+"""
+
+import argparse
+import asyncio
+import json
+import secrets
+import sys
+
+from models.game import Game
+from models.patterns import decode_pattern
+from sessions import SessionStore
+
+MAX_LINE = 4096
+OPS = ("create", "guess", "state", "resign", "stats")
+EXPIRE_INTERVAL = 5.0
+
+
+def session_state(session_id: str, game: Game) -> dict:
+    """JSON-ready view of a game, revealing the answer only once it is over"""
+    state = {
+        "session": session_id,
+        "guesses": [str(guess) for guess in game.board.guesses],
+        "patterns": [guess.pattern for guess in game.board.guesses],
+        "game_over": game.game_over,
+        "won": game.won,
+        "remaining_attempts": game.max_attempts - len(game.board.guesses),
+    }
+    if game.game_over:
+        state["answer"] = game.answer
+    return state
+
+
+class GameServer:
+    """Hosts many concurrent game sessions in one process"""
+
+    def __init__(self, sessions: SessionStore | None = None):
+        self.sessions = SessionStore() if sessions is None else sessions
+
+    def new_session(self) -> tuple[str, Game]:
+        session_id = secrets.token_hex(8)
+        game = Game()
+        self.sessions.put(session_id, game)
+        return session_id, game
+
+    def get_session(self, session_id: str) -> Game:
+        try:
+            return self.sessions.get(session_id)
+        except KeyError:
+            raise ValueError("Unknown session") from None
+
+    def end_session(self, session_id: str) -> None:
+        self.sessions.pop(session_id)
+
+    async def handle_request(self, request: dict) -> dict:
+        """Run one request and build its response"""
+        op = request.get("op")
+        if op not in OPS:
+            raise ValueError(f"Unknown op {op!r}")
+        if op == "create":
+            session_id, game = self.new_session()
+            return session_state(session_id, game)
+        if op == "stats":
+            return self.sessions.stats
+
+        session_id = request.get("session")
+        if not isinstance(session_id, str):
+            raise ValueError("Unknown session")
+        game = self.get_session(session_id)
+        if op == "state":
+            return session_state(session_id, game)
+        if op == "resign":
+            game.game_over = True
+            self.end_session(session_id)
+            return session_state(session_id, game)
+        # op == "guess"
+        word = str(request.get("word", "")).strip().lower()
+        if len(word) != 5 or not (word.isascii() and word.isalpha()):
+            raise ValueError("Guess must be 5 letters")
+        if not game.is_allowed(word):
+            raise ValueError("Not in word list")
+        game.make_guess(word)
+        state = session_state(session_id, game)
+        state["states"] = decode_pattern(game.board.guesses[-1].pattern)
+        if game.game_over:
+            self.end_session(session_id)
+        return state
+
+    async def handle_line(self, line: bytes) -> dict:
+        request = {}
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("Request must be a JSON object")
+            response = {"ok": True, **await self.handle_request(request)}
+        except ValueError as e:
+            response = {"ok": False, "error": str(e)}
+        except Exception:
+            # Whatever went wrong, the client still gets its one response line
+            response = {"ok": False, "error": "Internal error"}
+        if isinstance(request, dict) and "id" in request:
+            response["id"] = request["id"]
+        return response
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # Line longer than the reader limit
+                    writer.write(b'{"ok": false, "error": "Request too long"}\n')
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                response = await self.handle_line(line)
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8765, path: str | None = None) -> asyncio.Server:
+        """Start listening on TCP, or on a Unix socket if a path is given"""
+        if path is not None:
+            return await asyncio.start_unix_server(self.handle_connection, path, limit=MAX_LINE)
+        return await asyncio.start_server(self.handle_connection, host, port, limit=MAX_LINE)
+
+    async def expire_sessions(self, interval: float = EXPIRE_INTERVAL) -> None:
+        """Periodically evict idle sessions, until cancelled"""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                self.sessions.expire()
+            except Exception as e:
+                # Try again next time rather than never expiring anything again
+                print(f"Could not expire sessions: {e!r}", file=sys.stderr)
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="listen on this Unix socket path instead of TCP")
+    parser.add_argument("--max-hot", type=int, default=10_000, help="games kept in memory")
+    parser.add_argument("--hot-ttl", type=float, default=300.0, help="idle seconds before a game is snapshotted")
+    parser.add_argument("--cold-ttl", type=float, help="idle seconds before a snapshot is dropped")
+    parser.add_argument("--max-cold-bytes", type=int, help="memory budget for snapshots")
+
+
+async def serve_forever(args: argparse.Namespace) -> None:
+    sessions = SessionStore(args.max_hot, args.hot_ttl, args.cold_ttl, args.max_cold_bytes)
+    game_server = GameServer(sessions=sessions)
+    server = await game_server.serve(args.host, args.port, args.unix)
+    expiry = asyncio.create_task(game_server.expire_sessions())
+    where = args.unix or f"{args.host}:{args.port}"
+    print(f"Serving Wordle on {where}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        expiry.cancel()
+
+
+def main(args: argparse.Namespace) -> None:
+    """Entry point for ``python -m pywordle serve``"""
+    try:
+        asyncio.run(serve_forever(args))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,116 @@
+"""Session store keeping hot games in memory and cold ones as snapshots.
+
+Hot sessions are live Game objects in least recently used order. A session
+idle for longer than ``hot_ttl``, or pushed out when more than ``max_hot`` are
+hot, is evicted to its Game.to_snapshot bytes and rebuilt from them on its
+next use. Cold sessions idle for longer than ``cold_ttl``, or the oldest ones
+once cold snapshots take more than ``max_cold_bytes``, are dropped for good.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Callable
+
+from models.game import Game
+
+
+class SessionStore:
+    """LRU/TTL store of game sessions"""
+
+    def __init__(
+        self,
+        max_hot: int = 10_000,
+        hot_ttl: float | None = 300.0,
+        cold_ttl: float | None = None,
+        max_cold_bytes: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        # get() puts the game back as hot; with no room it would be snapshotted
+        # straight away and the caller's next move lost
+        if max_hot < 1:
+            raise ValueError("max_hot must be at least 1")
+        self.max_hot = max_hot
+        self.hot_ttl = hot_ttl
+        self.cold_ttl = cold_ttl
+        self.max_cold_bytes = max_cold_bytes
+        self.clock = clock
+        # Both ordered from least to most recently used
+        self.hot: OrderedDict[str, tuple[Game, float]] = OrderedDict()
+        self.cold: OrderedDict[str, tuple[bytes, float]] = OrderedDict()
+        self.cold_bytes = 0
+        self.hits = 0
+        self.rehydrations = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def put(self, session_id: str, game: Game) -> None:
+        self._drop_cold(session_id)
+        self.hot[session_id] = (game, self.clock())
+        self.hot.move_to_end(session_id)
+        while len(self.hot) > self.max_hot:
+            self._evict(next(iter(self.hot)))
+
+    def get(self, session_id: str) -> Game:
+        """Return a session's game, rebuilding it if it was evicted"""
+        if session_id in self.hot:
+            self.hits += 1
+            game, _ = self.hot[session_id]
+        elif session_id in self.cold:
+            self.rehydrations += 1
+            game = Game.from_snapshot(self.cold[session_id][0])
+        else:
+            raise KeyError(session_id)
+        self.put(session_id, game)
+        return game
+
+    def pop(self, session_id: str) -> None:
+        self.hot.pop(session_id, None)
+        self._drop_cold(session_id)
+
+    def expire(self) -> None:
+        """Evict idle hot sessions and drop idle or excess cold ones"""
+        now = self.clock()
+        if self.hot_ttl is not None:
+            while self.hot and now - next(iter(self.hot.values()))[1] > self.hot_ttl:
+                self._evict(next(iter(self.hot)))
+        if self.cold_ttl is not None:
+            while self.cold and now - next(iter(self.cold.values()))[1] > self.cold_ttl:
+                self._expire(next(iter(self.cold)))
+        if self.max_cold_bytes is not None:
+            while self.cold and self.cold_bytes > self.max_cold_bytes:
+                self._expire(next(iter(self.cold)))
+
+    def _evict(self, session_id: str) -> None:
+        game, last_used = self.hot[session_id]
+        # Snapshot first so a game that cannot be packed stays hot
+        snapshot = game.to_snapshot()
+        del self.hot[session_id]
+        self.cold[session_id] = (snapshot, last_used)
+        self.cold_bytes += len(snapshot)
+        self.evictions += 1
+
+    def _expire(self, session_id: str) -> None:
+        self._drop_cold(session_id)
+        self.expirations += 1
+
+    def _drop_cold(self, session_id: str) -> None:
+        if session_id in self.cold:
+            self.cold_bytes -= len(self.cold.pop(session_id)[0])
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self.hot or session_id in self.cold
+
+    def __len__(self) -> int:
+        return len(self.hot) + len(self.cold)
+
+    @property
+    def stats(self) -> dict:
+        return {
+            "hot": len(self.hot),
+            "cold": len(self.cold),
+            "cold_bytes": self.cold_bytes,
+            "hits": self.hits,
+            "rehydrations": self.rehydrations,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
@@ -0,0 +1,287 @@
+"""Headless batch simulation of strategies over the answer list.
+
+Games are played straight off the pattern matrix (see models.pattern_matrix):
+a game is an answer column, a strategy picks guess rows, and the candidates
+are narrowed by comparing matrix rows. No Game, Board or Guess objects are
+built, so a core plays tens of thousands of games a second with simple
+strategies.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Iterable, Iterator, Sequence
+
+import numpy as np
+
+from models.game import MAX_GUESSES, WORD_LIST, allowed_words
+from models.pattern_matrix import load_pattern_matrix
+from models.patterns import all_correct_code
+from solver import score_patterns
+
+ALL_CORRECT = all_correct_code()
+
+
+class SimulationContext:
+    """Word lists and pattern matrix shared by every simulated game"""
+
+    def __init__(self, guesses: Sequence[str], answers: Sequence[str], matrix: np.ndarray):
+        self.guesses = list(guesses)
+        self.answers = list(answers)
+        self.matrix = matrix
+        rows = {word: i for i, word in enumerate(self.guesses)}
+        missing = [word for word in self.answers if word not in rows]
+        if missing:
+            raise ValueError(f"Answers missing from the guess list: {missing[:5]}")
+        # Guess row of every answer column
+        self.answer_rows = np.array([rows[word] for word in self.answers], dtype=np.int64)
+        # For strategies to keep what depends only on the word lists, such as an opener
+        self.cache: dict = {}
+
+    @classmethod
+    def load(cls, guesses: Sequence[str], answers: Sequence[str]) -> "SimulationContext":
+        return cls(guesses, answers, load_pattern_matrix(guesses, answers))
+
+
+# A strategy picks the guess row to play given the candidate answer columns left
+Strategy = Callable[[SimulationContext, np.ndarray, int], int]
+
+
+class FirstCandidate:
+    """Always guess the first answer still possible"""
+
+    def __call__(self, context: SimulationContext, candidates: np.ndarray, turn: int) -> int:
+        return int(context.answer_rows[candidates[0]])
+
+
+class RandomCandidate:
+    """Guess a random answer still possible"""
+
+    def __init__(self, seed: int | None = None):
+        self.rng = np.random.default_rng(seed)
+
+    def __call__(self, context: SimulationContext, candidates: np.ndarray, turn: int) -> int:
+        return int(context.answer_rows[self.rng.choice(candidates)])
+
+
+def best_entropy_row(context: SimulationContext, candidates: np.ndarray) -> int:
+    """Guess row splitting the candidates into the most even feedback groups"""
+    if len(candidates) <= 2:
+        return int(context.answer_rows[candidates[0]])
+    entropy, _ = score_patterns(context.matrix[:, candidates])
+    # Prefer a guess that could win outright when entropies tie
+    entropy[context.answer_rows[candidates]] += 1e-9
+    return int(np.argmax(entropy))
+
+
+class MaxEntropy:
+    """Guess the word splitting the candidates into the most even feedback groups"""
+
+    def __call__(self, context: SimulationContext, candidates: np.ndarray, turn: int) -> int:
+        if turn > 0:
+            return best_entropy_row(context, candidates)
+        # Every game opens the same way, so work it out once per context
+        if "entropy_opener" not in context.cache:
+            context.cache["entropy_opener"] = best_entropy_row(context, candidates)
+        return context.cache["entropy_opener"]
+
+
+STRATEGIES: dict[str, Callable[[int | None], Strategy]] = {
+    "first": lambda seed: FirstCandidate(),
+    "random": lambda seed: RandomCandidate(seed),
+    "entropy": lambda seed: MaxEntropy(),
+}
+
+
+def make_strategy(name: str, seed: int | None = None) -> Strategy:
+    """Build a strategy by name, or from a ``module:factory`` path taking the seed"""
+    if name in STRATEGIES:
+        return STRATEGIES[name](seed)
+    module_name, _, attr = name.partition(":")
+    if not attr:
+        raise ValueError(f"Unknown strategy {name!r}, expected one of {sorted(STRATEGIES)} or module:factory")
+    return getattr(importlib.import_module(module_name), attr)(seed)
+
+
+@dataclass
+class GameResult:
+    answer: str
+    guesses: list[str]
+    solved: bool
+
+
+def play_game(
+    context: SimulationContext, column: int, strategy: Strategy, max_guesses: int = MAX_GUESSES
+) -> GameResult:
+    """Play one game against the answer in the given matrix column"""
+    candidates = np.arange(len(context.answers))
+    played = []
+    solved = False
+    for turn in range(max_guesses):
+        row = strategy(context, candidates, turn)
+        played.append(row)
+        code = context.matrix[row, column]
+        if code == ALL_CORRECT:
+            solved = True
+            break
+        candidates = candidates[context.matrix[row, candidates] == code]
+    return GameResult(context.answers[column], [context.guesses[row] for row in played], solved)
+
+
+@dataclass
+class SimulationSummary:
+    games: int = 0
+    solved: int = 0
+    distribution: Counter = field(default_factory=Counter)
+    elapsed: float = 0.0
+
+    def add(self, result: GameResult) -> None:
+        self.games += 1
+        if result.solved:
+            self.solved += 1
+            self.distribution[len(result.guesses)] += 1
+
+    @property
+    def failure_rate(self) -> float:
+        return 1 - self.solved / self.games if self.games else 0.0
+
+    @property
+    def games_per_second(self) -> float:
+        return self.games / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def mean_guesses(self) -> float:
+        if not self.solved:
+            return 0.0
+        return sum(n * count for n, count in self.distribution.items()) / self.solved
+
+    def to_dict(self) -> dict:
+        return {
+            "games": self.games,
+            "solved": self.solved,
+            "failure_rate": self.failure_rate,
+            "mean_guesses": self.mean_guesses,
+            "distribution": {str(n): self.distribution[n] for n in sorted(self.distribution)},
+            "elapsed": self.elapsed,
+            "games_per_second": self.games_per_second,
+        }
+
+
+_worker_state: tuple[SimulationContext, str, int] | None = None
+
+
+def _init_worker(guesses: list[str], answers: list[str], strategy: str, max_guesses: int) -> None:
+    global _worker_state
+    _worker_state = (SimulationContext.load(guesses, answers), strategy, max_guesses)
+
+
+def _play_chunk(job: tuple[np.ndarray, int]) -> list[GameResult]:
+    """Play a chunk of games with a strategy seeded for that chunk alone"""
+    columns, seed = job
+    context, strategy_name, max_guesses = _worker_state
+    strategy = make_strategy(strategy_name, seed)
+    return [play_game(context, int(column), strategy, max_guesses) for column in columns]
+
+
+def pick_columns(answers: Sequence[str], games: int | None, seed: int | None) -> np.ndarray:
+    """Every answer column in order, or ``games`` random ones"""
+    if games is None:
+        return np.arange(len(answers))
+    return np.random.default_rng(seed).integers(0, len(answers), games)
+
+
+def simulate(
+    strategy: str = "entropy",
+    games: int | None = None,
+    seed: int | None = None,
+    workers: int = 1,
+    guesses: Sequence[str] | None = None,
+    answers: Sequence[str] | None = None,
+    max_guesses: int = MAX_GUESSES,
+    chunk_size: int = 256,
+) -> Iterator[GameResult]:
+    """Play games with a strategy and yield their results in order.
+
+    With more than one worker the games are split into chunks and played in a
+    process pool. Every worker opens the same memory-mapped pattern matrix.
+    """
+    if max_guesses < 1:
+        raise ValueError(f"max_guesses must be at least 1, got {max_guesses}")
+    guesses = allowed_words() if guesses is None else list(guesses)
+    answers = WORD_LIST if answers is None else list(answers)
+    # Build the matrix once here rather than in every worker
+    load_pattern_matrix(guesses, answers)
+    columns = pick_columns(answers, games, seed)
+    init_args = (guesses, answers, strategy, max_guesses)
+    chunks = [columns[i : i + chunk_size] for i in range(0, len(columns), chunk_size)]
+    # Each chunk gets its own seed, so random strategies play independent
+    # streams and results do not depend on how chunks are spread over workers
+    seeds = [int(child.generate_state(1)[0]) for child in np.random.SeedSequence(seed).spawn(len(chunks))]
+    chunks = list(zip(chunks, seeds))
+
+    if workers <= 1:
+        _init_worker(*init_args)
+        for chunk in chunks:
+            yield from _play_chunk(chunk)
+        return
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=init_args) as executor:
+        for results in executor.map(_play_chunk, chunks):
+            yield from results
+
+
+def summarize(results: Iterable[GameResult], on_result: Callable[[GameResult], None] | None = None) -> SimulationSummary:
+    """Collect results into a summary, passing each one to ``on_result`` first"""
+    summary = SimulationSummary()
+    start = time.perf_counter()
+    for result in results:
+        if on_result is not None:
+            on_result(result)
+        summary.add(result)
+    summary.elapsed = time.perf_counter() - start
+    return summary
+
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--strategy", default="entropy", help="first, random, entropy or module:factory")
+    parser.add_argument("--games", type=int, help="number of random answers to play (default: every answer)")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--max-guesses", type=positive_int, default=MAX_GUESSES)
+    parser.add_argument("--output", help="write every game as a JSON line to this file, - for stdout")
+
+
+def main(args: argparse.Namespace) -> None:
+    """Entry point for ``python -m pywordle simulate``"""
+    output = None
+    if args.output == "-":
+        output = sys.stdout
+    elif args.output:
+        output = open(args.output, "w")
+    on_result = None
+    if output is not None:
+        on_result = lambda result: output.write(json.dumps(asdict(result)) + "\n")
+
+    try:
+        summary = summarize(
+            simulate(args.strategy, args.games, args.seed, args.workers, max_guesses=args.max_guesses),
+            on_result,
+        )
+    finally:
+        if output is not None and output is not sys.stdout:
+            output.close()
+
+    report = sys.stderr if output is sys.stdout else sys.stdout
+    print(json.dumps(summary.to_dict()), file=report)
@@ -0,0 +1,189 @@
+"""Best next guess suggestions ranked by expected information gain"""
+
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from threading import Event
+from typing import Sequence
+
+import numpy as np
+
+from models.board import Board
+from models.game import WORD_LIST, allowed_words, pattern_matrix
+from models.patterns import NUM_PATTERNS, encode_words, score_against, score_batch
+
+RANK_BY = ("entropy", "expected_remaining")
+# Below this many guess x candidate cells the pool costs more than it saves
+PARALLEL_MIN_CELLS = 1 << 22
+CHUNK_CELLS = 1 << 20
+
+
+@dataclass
+class Suggestion:
+    word: str
+    entropy: float
+    expected_remaining: float
+    is_candidate: bool
+
+
+def pattern_counts(patterns: np.ndarray) -> np.ndarray:
+    """Histogram each row of a (guesses, candidates) pattern block over all codes"""
+    rows = patterns.shape[0]
+    offsets = np.arange(rows, dtype=np.int64)[:, None] * NUM_PATTERNS + patterns
+    return np.bincount(offsets.ravel(), minlength=rows * NUM_PATTERNS).reshape(rows, NUM_PATTERNS)
+
+
+def score_patterns(patterns: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Entropy in bits and expected number of candidates left for each guess row"""
+    total = patterns.shape[1]
+    counts = pattern_counts(patterns).astype(np.float64)
+    probabilities = counts / total
+    with np.errstate(divide="ignore", invalid="ignore"):
+        entropy = -np.nansum(probabilities * np.log2(probabilities), axis=1)
+    expected = (counts * counts).sum(axis=1) / total
+    return entropy, expected
+
+
+def _score_chunk(guesses: np.ndarray, candidates: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    return score_patterns(score_batch(guesses, candidates))
+
+
+def _score_rows(rows: slice, columns: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Score allowed guess rows against answer columns of the shared pattern matrix"""
+    return score_patterns(pattern_matrix().matrix[rows][:, columns])
+
+
+def matrix_columns(candidates: Sequence[str]) -> np.ndarray | None:
+    """Columns of the candidates in the shared pattern matrix, None if one isn't an answer"""
+    columns = pattern_matrix().answer_columns
+    try:
+        return np.array([columns[word] for word in candidates], dtype=np.intp)
+    except KeyError:
+        return None
+
+
+def remaining_candidates(board: Board, answers: Sequence[str] = WORD_LIST) -> list[str]:
+    """Answers consistent with every guess on the board"""
+    if board.candidate_index is not None:
+        return board.remaining_words()
+    words = list(answers)
+    encoded = encode_words(words)
+    keep = np.ones(len(words), dtype=bool)
+    for guess in board.guesses:
+        keep &= score_against(str(guess), encoded) == guess.pattern
+    return [word for word, kept in zip(words, keep) if kept]
+
+
+def best_guesses(
+    board: Board,
+    k: int = 5,
+    guesses: Sequence[str] | None = None,
+    candidates: Sequence[str] | None = None,
+    rank_by: str = "entropy",
+    workers: int | None = None,
+    time_budget: float | None = None,
+    cancel: Event | None = None,
+) -> list[Suggestion]:
+    """Return the top k next guesses for a board.
+
+    Every guess is scored against the remaining candidates, split into chunks
+    spread over a process pool when the work is large enough. With the default
+    guesses and candidates drawn from the answers, patterns are read from the
+    memory-mapped matrix of models.game.pattern_matrix rather than scored
+    again (the matrix is built once, on first use). If the time
+    budget (seconds) runs out or ``cancel`` is set, the best guesses among the
+    chunks finished so far are returned; if none finished, a single chunk of
+    the candidates themselves is ranked instead, so there is always a guess.
+    """
+    if rank_by not in RANK_BY:
+        raise ValueError(f"rank_by must be one of {RANK_BY}")
+    if candidates is None:
+        candidates = remaining_candidates(board)
+    candidates = list(candidates)
+    if not candidates:
+        return []
+    if len(candidates) == 1:
+        return [Suggestion(candidates[0], 0.0, 1.0, True)]
+    columns = None
+    if guesses is None:
+        guesses = allowed_words()
+        columns = matrix_columns(candidates)
+    else:
+        guesses = list(guesses)
+
+    deadline = None if time_budget is None else time.monotonic() + time_budget
+    if columns is None:
+        guess_letters = encode_words(guesses)
+        candidate_letters = encode_words(candidates)
+
+        def job(chunk: slice) -> tuple:
+            return _score_chunk, guess_letters[chunk], candidate_letters
+
+    else:
+        # Opened (or built) here, before any pool worker goes looking for it
+        pattern_matrix().matrix
+
+        def job(chunk: slice) -> tuple:
+            return _score_rows, chunk, columns
+
+    workers = workers or os.cpu_count() or 1
+    cells = len(guesses) * len(candidates)
+    if workers > 1 and cells >= PARALLEL_MIN_CELLS:
+        chunk_rows = max(1, len(guesses) // (workers * 4))
+    else:
+        workers = 1
+        chunk_rows = max(1, CHUNK_CELLS // len(candidates))
+    chunks = [slice(start, start + chunk_rows) for start in range(0, len(guesses), chunk_rows)]
+
+    entropy = np.full(len(guesses), np.nan)
+    expected = np.full(len(guesses), np.nan)
+
+    def out_of_time() -> bool:
+        if cancel is not None and cancel.is_set():
+            return True
+        return deadline is not None and time.monotonic() >= deadline
+
+    if workers == 1:
+        for chunk in chunks:
+            if out_of_time():
+                break
+            function, *args = job(chunk)
+            entropy[chunk], expected[chunk] = function(*args)
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            pending = {executor.submit(*job(chunk)): chunk for chunk in chunks}
+            while pending and not out_of_time():
+                timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                if cancel is not None:
+                    timeout = 0.05 if timeout is None else min(timeout, 0.05)
+                done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    chunk = pending.pop(future)
+                    entropy[chunk], expected[chunk] = future.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    scored = np.flatnonzero(~np.isnan(entropy))
+    if not len(scored):
+        guesses = candidates[: max(1, CHUNK_CELLS // len(candidates))]
+        entropy, expected = _score_chunk(encode_words(guesses), encode_words(candidates))
+        scored = np.arange(len(guesses))
+    candidate_set = set(candidates)
+    is_candidate = np.array([guesses[i] in candidate_set for i in scored], dtype=bool)
+    if rank_by == "entropy":
+        primary = -entropy[scored]
+    else:
+        primary = expected[scored]
+    # Ties go to guesses that could be the answer, then word list order
+    order = np.lexsort((scored, ~is_candidate, primary))[:k]
+    return [
+        Suggestion(
+            guesses[scored[i]],
+            float(entropy[scored[i]]),
+            float(expected[scored[i]]),
+            bool(is_candidate[i]),
+        )
+        for i in order
+    ]
@@ -0,0 +1,136 @@
+"""Startup time benchmark for each way of starting the game.
+
+Every mode is started in a fresh interpreter under ``python -X importtime``,
+going as far as main.entry_point (everything is imported, nothing is run).
+The report gives the total import time, the slowest top level imports and
+whether any module the mode must not load (pygame for the text modes) was
+imported. Results are printed as JSON and checked against a stored baseline.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+# Mode -> command line arguments
+MODES = {
+    "cli": ["--cli"],
+    "batch": ["--batch"],
+    "gui": [],
+}
+# Modules a mode must never import
+FORBIDDEN = {
+    "cli": ["pygame"],
+    "batch": ["pygame"],
+}
+DEFAULT_BASELINE = Path(__file__).resolve().parents[1] / "benchmarks" / "startup.json"
+DEFAULT_TOLERANCE = 0.5
+# Absolute slack on top of the tolerance, as small startups are noisy
+SLACK_US = 20_000
+TOP_IMPORTS = 10
+PACKAGE_DIR = Path(__file__).resolve().parent
+
+
+def parse_importtime(stderr: str) -> dict[str, tuple[int, int]]:
+    """Map module name -> (self us, cumulative us) from -X importtime output.
+
+    Names of nested imports keep their indentation, so the cumulative times
+    of the unindented ones add up to the total import time.
+    """
+    imports = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        if not self_us.strip().isdigit():
+            continue  # the header line
+        # One space after the bar, then two more per level of nesting
+        imports[name[1:].rstrip()] = (int(self_us), int(cumulative_us))
+    return imports
+
+
+def measure(mode: str) -> dict:
+    """Import time of one fresh start in a mode"""
+    code = (
+        "import main; "
+        f"main.entry_point(main.parse_args({MODES[mode]!r}))"
+    )
+    env = {**os.environ, "PYGAME_HIDE_SUPPORT_PROMPT": "1"}
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PACKAGE_DIR,
+        env=env,
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imports = parse_importtime(completed.stderr)
+    top_level = {name: cumulative for name, (_, cumulative) in imports.items() if not name.startswith(" ")}
+    modules = {name.strip() for name in imports}
+    return {
+        "import_us": sum(top_level.values()),
+        "modules": len(modules),
+        "top": dict(sorted(top_level.items(), key=lambda item: -item[1])[:TOP_IMPORTS]),
+        "forbidden": sorted(
+            name for name in FORBIDDEN.get(mode, []) if name in modules
+        ),
+    }
+
+
+def run_benchmark(runs: int = 5, modes: list[str] | None = None) -> dict:
+    """Median of several fresh starts per mode"""
+    results = {}
+    for mode in modes or list(MODES):
+        samples = [measure(mode) for _ in range(runs)]
+        median = sorted(samples, key=lambda sample: sample["import_us"])[len(samples) // 2]
+        results[mode] = {
+            **median,
+            "import_us": statistics.median(sample["import_us"] for sample in samples),
+        }
+    return results
+
+
+def find_regressions(results: dict, baseline: dict, tolerance: float = DEFAULT_TOLERANCE) -> list[str]:
+    """Describe every way the results are worse than the baseline"""
+    regressions = []
+    for mode, result in results.items():
+        if result["forbidden"]:
+            regressions.append(f"{mode}: imports {', '.join(result['forbidden'])}")
+        if mode not in baseline:
+            continue
+        limit = baseline[mode]["import_us"] * (1 + tolerance) + SLACK_US
+        if result["import_us"] > limit:
+            regressions.append(
+                f"{mode}: {result['import_us'] / 1000:.0f}ms of imports, "
+                f"baseline {baseline[mode]['import_us'] / 1000:.0f}ms"
+            )
+    return regressions
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--runs", type=int, default=5, help="fresh starts per mode")
+    parser.add_argument("--mode", action="append", choices=list(MODES), help="mode to time (default: all)")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="allowed slowdown, 0.5 = 50%%")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the new baseline")
+
+
+def main(args: argparse.Namespace) -> None:
+    """Entry point for ``python -m pywordle bench-startup``"""
+    results = run_benchmark(args.runs, args.mode)
+    print(json.dumps(results, indent=2))
+    baseline = {}
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(results, indent=2) + "\n")
+    elif args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())
+    regressions = find_regressions(results, baseline, args.tolerance)
+    for regression in regressions:
+        print(f"Regression: {regression}", file=sys.stderr)
+    if regressions:
+        sys.exit(1)
@@ -0,0 +1,328 @@
+"""Persistent statistics of finished games.
+
+Games are stored in SQLite in WAL mode. Recording a game only queues its
+rows. A writer thread commits whatever has queued up in one transaction per
+batch, so the UI never waits on the disk.
+
+Alongside the games table, the aggregates are kept up to date as games come
+in:
+
+    totals        per mode: games played and won, the current and longest
+                  win streak
+    distribution  per mode: wins by number of guesses
+    answers       per answer: times played and solved and the guesses it
+                  took, for how hard each word is
+
+Every aggregate is updated relative to what is stored (played = played + 1,
+...), so several games sharing one file add up rather than overwrite each
+other. Each mode's totals are held in memory as of the last commit, plus the
+games still queued, so summary() never scans the games table.
+"""
+
+import os
+import queue
+import sqlite3
+import sys
+import threading
+import time
+
+# Where the game keeps its stats unless told otherwise
+DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".pywordle", "stats.sqlite3")
+# Most games committed in one transaction
+BATCH_SIZE = 256
+# Seconds a recorded game may wait for others to share its transaction
+FLUSH_INTERVAL = 1.0
+# Seconds to wait for another process holding the database before giving up
+BUSY_TIMEOUT = 10.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    finished REAL NOT NULL,
+    mode TEXT NOT NULL,
+    answers TEXT NOT NULL,
+    won INTEGER NOT NULL,
+    attempts INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS totals (
+    mode TEXT PRIMARY KEY,
+    played INTEGER NOT NULL,
+    wins INTEGER NOT NULL,
+    current_streak INTEGER NOT NULL,
+    max_streak INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS distribution (
+    mode TEXT NOT NULL,
+    attempts INTEGER NOT NULL,
+    wins INTEGER NOT NULL,
+    PRIMARY KEY (mode, attempts)
+);
+CREATE TABLE IF NOT EXISTS answers (
+    answer TEXT PRIMARY KEY,
+    played INTEGER NOT NULL,
+    solved INTEGER NOT NULL,
+    guesses INTEGER NOT NULL
+);
+"""
+
+# One finished game, relative to whatever is stored already. SET expressions
+# all see the row as it was, so the streaks use the old current streak.
+ADD_TOTALS = """
+INSERT INTO totals VALUES (?1, 1, ?2, ?2, ?2)
+ON CONFLICT(mode) DO UPDATE SET
+    played = played + 1,
+    wins = wins + ?2,
+    current_streak = CASE WHEN ?2 THEN current_streak + 1 ELSE 0 END,
+    max_streak = MAX(max_streak, CASE WHEN ?2 THEN current_streak + 1 ELSE 0 END)
+"""
+ADD_DISTRIBUTION = """
+INSERT INTO distribution VALUES (?, ?, 1)
+ON CONFLICT(mode, attempts) DO UPDATE SET wins = wins + 1
+"""
+ADD_ANSWER = """
+INSERT INTO answers VALUES (?, 1, ?, ?)
+ON CONFLICT(answer) DO UPDATE SET
+    played = played + 1,
+    solved = solved + excluded.solved,
+    guesses = guesses + excluded.guesses
+"""
+
+
+class Totals:
+    """Running totals for one mode"""
+
+    __slots__ = ("played", "wins", "current_streak", "max_streak", "distribution")
+
+    def __init__(
+        self,
+        played: int = 0,
+        wins: int = 0,
+        current_streak: int = 0,
+        max_streak: int = 0,
+        distribution: list[int] | None = None,
+    ):
+        self.played = played
+        self.wins = wins
+        self.current_streak = current_streak
+        self.max_streak = max_streak
+        # Wins by number of guesses: distribution[0] is wins in one
+        self.distribution = [] if distribution is None else distribution
+
+    def add(self, won: bool, attempts: int) -> None:
+        self.played += 1
+        if won:
+            self.wins += 1
+            self.current_streak += 1
+            self.max_streak = max(self.max_streak, self.current_streak)
+            if len(self.distribution) < attempts:
+                self.distribution.extend([0] * (attempts - len(self.distribution)))
+            self.distribution[attempts - 1] += 1
+        else:
+            self.current_streak = 0
+
+    def copy(self) -> "Totals":
+        return Totals(
+            self.played, self.wins, self.current_streak, self.max_streak, list(self.distribution)
+        )
+
+    def as_dict(self) -> dict:
+        return {
+            "played": self.played,
+            "wins": self.wins,
+            "win_rate": self.wins / self.played if self.played else 0.0,
+            "current_streak": self.current_streak,
+            "max_streak": self.max_streak,
+            "distribution": list(self.distribution),
+        }
+
+
+class StatsStore:
+    """Records finished games and serves their statistics"""
+
+    def __init__(
+        self,
+        path: str = DEFAULT_PATH,
+        batch_size: int = BATCH_SIZE,
+        flush_interval: float = FLUSH_INTERVAL,
+    ):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        # Used only on the thread that opened the store, for reads
+        self.connection = self.connect()
+        self.connection.executescript(SCHEMA)
+        # Totals as last committed, and (mode, won, attempts) of the games
+        # recorded since, oldest first; both shared with the writer
+        self.lock = threading.Lock()
+        self.totals = load_totals(self.connection)
+        self.unwritten: list[tuple[str, bool, int]] = []
+        self.pending: queue.SimpleQueue = queue.SimpleQueue()
+        # Batches the writer failed to commit
+        self.errors = 0
+        self.writer = threading.Thread(target=self.write, name="stats", daemon=True)
+        self.writer.start()
+
+    def connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT)
+        connection.execute("PRAGMA journal_mode=WAL")
+        # WAL stays consistent on a crash without syncing every commit
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def record(self, game, mode: str = "classic") -> None:
+        """Add a finished Game or MultiGame, written out in the background"""
+        if not game.game_over:
+            raise ValueError("Only finished games are recorded")
+        answers = [
+            (board.answer, int(board.won), len(board.guesses) if board.won else 0)
+            for board in game.boards
+        ]
+        row = (time.time(), mode, ",".join(game.answers), int(game.won), game.attempts)
+        with self.lock:
+            self.unwritten.append((mode, game.won, game.attempts))
+        self.pending.put((row, answers))
+
+    def summary(self, mode: str = "classic") -> dict:
+        """Played, won, streaks and guess distribution for a mode.
+
+        Games recorded by this store count straight away, those of other
+        processes sharing the file once this store next commits.
+        """
+        with self.lock:
+            totals = self.totals.get(mode, Totals()).copy()
+            for game_mode, won, attempts in self.unwritten:
+                if game_mode == mode:
+                    totals.add(won, attempts)
+        return totals.as_dict()
+
+    def answer_stats(self, answer: str) -> dict | None:
+        """How often an answer came up and was solved, as of the last write"""
+        row = self.connection.execute(
+            "SELECT played, solved, guesses FROM answers WHERE answer = ?", (answer,)
+        ).fetchone()
+        if row is None:
+            return None
+        played, solved, guesses = row
+        return {
+            "played": played,
+            "solved": solved,
+            "mean_guesses": guesses / solved if solved else None,
+        }
+
+    def hardest_answers(self, n: int = 10, min_played: int = 1) -> list[tuple[str, float, float]]:
+        """(answer, solve rate, mean guesses when solved), hardest first.
+
+        This ranks the answers table, which holds a row per word rather than
+        per game, so it costs the same however long the history is.
+        """
+        rows = self.connection.execute(
+            """
+            SELECT answer, CAST(solved AS REAL) / played,
+                   CASE WHEN solved THEN CAST(guesses AS REAL) / solved END
+            FROM answers WHERE played >= ?
+            ORDER BY 2, 3 DESC LIMIT ?
+            """,
+            (min_played, n),
+        )
+        return rows.fetchall()
+
+    def flush(self) -> None:
+        """Wait until every game recorded so far is committed"""
+        done = threading.Event()
+        self.pending.put(done)
+        # Checked now and then so a writer that died cannot hang the caller
+        while not done.wait(0.1):
+            if not self.writer.is_alive():
+                return
+
+    def close(self) -> None:
+        """Commit what is queued and stop the writer"""
+        self.pending.put(None)
+        self.writer.join()
+        self.connection.close()
+
+    def write(self) -> None:
+        connection = self.connect()
+        try:
+            running = True
+            while running:
+                batch = []
+                waiting: list[threading.Event] = []
+                item = self.pending.get()
+                deadline = time.monotonic() + self.flush_interval
+                # Gather what else arrives while the first game waits
+                while True:
+                    if item is None:
+                        running = False
+                        break
+                    if isinstance(item, threading.Event):
+                        waiting.append(item)
+                        break
+                    batch.append(item)
+                    timeout = deadline - time.monotonic()
+                    if len(batch) >= self.batch_size or timeout <= 0:
+                        break
+                    try:
+                        item = self.pending.get(timeout=timeout)
+                    except queue.Empty:
+                        break
+                try:
+                    if batch:
+                        totals = self.commit(connection, batch)
+                        with self.lock:
+                            self.totals.update(totals)
+                            del self.unwritten[: len(batch)]
+                except sqlite3.Error as e:
+                    # Such as another process keeping the database locked; the
+                    # batch is lost but the game carries on
+                    self.errors += 1
+                    with self.lock:
+                        del self.unwritten[: len(batch)]
+                    print(f"Could not save {len(batch)} games to {self.path}: {e}", file=sys.stderr)
+                finally:
+                    for done in waiting:
+                        done.set()
+        finally:
+            connection.close()
+
+    def commit(self, connection: sqlite3.Connection, batch: list) -> dict[str, "Totals"]:
+        """Write a batch, returning the totals of its modes as now stored"""
+        rows = [row for row, _ in batch]
+        with connection:
+            connection.executemany(
+                "INSERT INTO games (finished, mode, answers, won, attempts) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            connection.executemany(ADD_TOTALS, [(mode, won) for _, mode, _, won, _ in rows])
+            connection.executemany(
+                ADD_DISTRIBUTION, [(mode, attempts) for _, mode, _, won, attempts in rows if won]
+            )
+            connection.executemany(ADD_ANSWER, [answer for _, answers in batch for answer in answers])
+            # Read back in the same transaction, with any other process's games
+            return load_totals(connection, {mode for _, mode, _, _, _ in rows})
+
+
+def load_totals(connection: sqlite3.Connection, modes: set[str] | None = None) -> dict[str, Totals]:
+    """Stored totals of the given modes, or of every mode"""
+    totals = {
+        mode: Totals(played, wins, current, longest)
+        for mode, played, wins, current, longest in connection.execute("SELECT * FROM totals")
+        if modes is None or mode in modes
+    }
+    for mode, attempts, wins in connection.execute("SELECT * FROM distribution ORDER BY attempts"):
+        if mode in totals:
+            distribution = totals[mode].distribution
+            distribution.extend([0] * (attempts - len(distribution)))
+            distribution[attempts - 1] = wins
+    return totals
+
+
+def format_summary(summary: dict) -> str:
+    """One line of the headline numbers"""
+    return (
+        f"Played {summary['played']}  Won {summary['win_rate']:.0%}  "
+        f"Streak {summary['current_streak']}  Best {summary['max_streak']}"
+    )
@@ -0,0 +1,50 @@
+import pytest
+from pywordle.models.absurdle import AbsurdleGame
+from pywordle.models.modes import new_game
+from pywordle.models.patterns import score_word
+
+ANSWERS = ["hello", "jello", "cello", "world", "about"]
+
+
+@pytest.fixture
+def game():
+    """Fixture to create an Absurdle game over a small answer list"""
+    return AbsurdleGame(ANSWERS)
+
+
+def test_partition_keeps_largest_group(game):
+    """Test that the guess gets the feedback shared by the most answers"""
+    pattern, keep = game.partition("hello")
+    # jello and cello both score this pattern, hello alone would win
+    assert [ANSWERS[i] for i in keep] == ["jello", "cello"]
+    assert pattern == score_word("hello", "jello")
+
+
+def test_feedback_stays_consistent(game):
+    """Test that every answer left agrees with all feedback given so far"""
+    game.make_guess("hello")
+    game.make_guess("about")
+    assert game.remaining_answers() == ["jello", "cello"]
+    for guess in game.board.guesses:
+        for answer in game.remaining_answers():
+            assert guess.pattern == score_word(str(guess), answer)
+    assert game.answer in game.remaining_answers()
+    assert not game.won
+
+
+def test_cornered_answer_can_be_won(game):
+    """Test that the game is won once only the guessed word is left"""
+    for word in ["hello", "cello", "jello"]:
+        game.make_guess(word)
+    assert game.won
+    assert game.answer == "jello"
+
+
+def test_new_game_modes():
+    """Test building each kind of game"""
+    # new_game builds through the package's own imports, so compare names
+    assert type(new_game(absurdle=True)).__name__ == "AbsurdleGame"
+    assert new_game(absurdle=True, hard_mode=True).hard_mode is not None
+    assert len(new_game(boards=2).boards) == 2
+    with pytest.raises(ValueError):
+        new_game(boards=2, absurdle=True)
@@ -1,5 +1,7 @@
 import pytest
 from pywordle.models.board import Board
+from pywordle.models.candidates import CandidateIndex
+from pywordle.models.guess_index import GuessIndex
 
 
 @pytest.fixture
@@ -59,3 +61,49 @@ def test_string_representation(board, guesses, expected_str):
     for guess in guesses:
         board.add_guess(guess)
     assert str(board) == expected_str
+
+
+def test_allowed_guesses():
+    """Test that words outside the allowed index are rejected before scoring"""
+    board = Board("hello", allowed=GuessIndex.from_words(["hello", "world"]))
+    assert board.is_allowed("world")
+    with pytest.raises(ValueError, match="Not in word list"):
+        board.add_guess("helps")
+    assert len(board.guesses) == 0
+    board.add_guess("world")
+    assert len(board.guesses) == 1
+
+
+def test_candidate_narrowing():
+    """Test that the board tracks the answers still possible"""
+    board = Board("hello", candidate_index=CandidateIndex(["hello", "jello", "world", "those"]))
+    assert board.remaining == 4
+    board.add_guess("world")
+    assert board.remaining_words() == ["hello", "jello"]
+    board.add_guess("jello")
+    assert board.remaining_words() == ["hello"]
+
+
+def test_no_candidate_tracking(board):
+    """Test boards created without a candidate index"""
+    assert board.remaining is None
+    with pytest.raises(ValueError):
+        board.remaining_words()
+
+
+def test_key_status(board):
+    """Test that letter statuses only ever improve"""
+    from pywordle.models.board import KEY_ABSENT, KEY_CORRECT, KEY_PRESENT, KEY_UNKNOWN
+
+    def status(letter):
+        return board.key_status[ord(letter) - 97]
+
+    board.add_guess("world")
+    assert status("w") == KEY_ABSENT
+    assert status("o") == KEY_PRESENT
+    assert status("l") == KEY_CORRECT
+    assert status("z") == KEY_UNKNOWN
+    board.add_guess("lotto")  # l now present, o correct
+    assert status("l") == KEY_CORRECT
+    assert status("o") == KEY_CORRECT
+    assert status("t") == KEY_ABSENT
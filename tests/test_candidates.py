@@ -0,0 +1,40 @@
+import itertools
+import pytest
+from pywordle.models.candidates import CandidateIndex
+from pywordle.models.patterns import score_word
+
+WORDS = ["hello", "world", "speed", "abide", "geese", "those", "erase", "eerie", "llama", "allay"]
+
+
+@pytest.fixture
+def index():
+    """Fixture to create an index over a few words"""
+    return CandidateIndex(WORDS)
+
+
+def test_all_words(index):
+    """Test that the full bitset holds every word"""
+    assert index.words_in(index.all) == WORDS
+    assert index.all.bit_count() == len(WORDS)
+
+
+@pytest.mark.parametrize("guess,answer", list(itertools.product(WORDS, WORDS)))
+def test_narrow_matches_brute_force(index, guess, answer):
+    """Test that narrowing keeps exactly the words giving the same feedback"""
+    pattern = score_word(guess, answer)
+    expected = [word for word in WORDS if score_word(guess, word) == pattern]
+    assert index.words_in(index.narrow(index.all, guess, pattern)) == expected
+
+
+def test_narrow_repeated(index):
+    """Test narrowing over several guesses"""
+    candidates = index.all
+    for guess in ["geese", "llama"]:
+        candidates = index.narrow(candidates, guess, score_word(guess, "allay"))
+    assert index.words_in(candidates) == ["allay"]
+
+
+def test_narrow_wrong_length(index):
+    """Test that only five letter guesses narrow"""
+    with pytest.raises(ValueError):
+        index.narrow(index.all, "test", 0)
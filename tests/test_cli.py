@@ -3,6 +3,7 @@ import pytest
 from unittest.mock import patch, MagicMock
 from pywordle.cli import WordleCLI
 from pywordle.models.guess import Guess
+from pywordle.models.guess_index import GuessIndex
 
 @pytest.fixture
 def cli():
@@ -36,11 +37,14 @@ def test_get_valid_guess(cli, input_value, expected_output):
     "input_sequence,expected_output",
     [
         (["12345", "quit"], "Guess must contain only letters!\n"),
+        (["héllo", "quit"], "Guess must contain only letters!\n"),
         (["abc", "quit"], "Guess must be 5 letters long!\n",),
+        (["xyzzy", "quit"], "Not in word list!\n"),
     ],
 )
 def test_get_valid_guess_invalid_input(cli, input_sequence, expected_output, capsys):
     """Test getting invalid guesses from user"""
+    cli.game.board.allowed = GuessIndex.from_words(["hello"])
     with patch("builtins.input", side_effect=input_sequence):
         guess = cli.get_valid_guess()
         captured = capsys.readouterr()
@@ -109,3 +113,113 @@ def test_play_game(cli, input_sequence, expected_output, capsys):
 #         cli.play()
 #         # Verify the game continues after an error
 #         assert cli.attempts == 0
+
+
+def test_display_keyboard(cli, capsys):
+    """Test that the keyboard shows what the guesses revealed"""
+    cli.game.answer = "hello"
+    cli.game.make_guess("world")
+    cli.display_keyboard()
+    out = capsys.readouterr().out
+    assert "\033[92mL\033[0m" in out
+    assert "\033[93mO\033[0m" in out
+    assert "\033[90mW\033[0m" in out
+    assert " Q " not in out and out.startswith("Q ")
+
+
+def test_play_batch():
+    """Test playing scripted games from JSON lines"""
+    import io
+    import json
+    from pywordle.cli import play_batch
+
+    lines = [
+        '{"id": 1, "answer": "hello", "guesses": ["world", "hello"]}',
+        "",
+        '{"answer": "apple", "guesses": ["hello"], "reveal": true}',
+        '{"guesses": ["abc"]}',
+        "not json",
+        '{"answer": "HELLO", "guesses": ["hello"]}',
+        '{"answer": "abc", "guesses": ["hello"]}',
+        '{"answer": 12345, "guesses": ["hello"]}',
+        '{"answer": "hello", "guesses": ["h\u00e9llo"]}',
+    ]
+    output = io.StringIO()
+    assert play_batch(lines, output) == 8
+    results = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert results[0] == {"ok": True, "patterns": [57, 242], "won": True, "game_over": True, "id": 1}
+    assert results[1]["answer"] == "apple" and not results[1]["won"]
+    assert results[2] == {"ok": False, "error": "Invalid guess 'abc'"}
+    assert not results[3]["ok"]
+    assert results[4]["won"] and results[4]["patterns"] == [242]
+    assert results[5] == {"ok": False, "error": "Invalid answer 'abc'"}
+    assert results[6] == {"ok": False, "error": "Invalid answer '12345'"}
+    assert results[7] == {"ok": False, "error": "Invalid guess 'héllo'"}
+
+
+def test_play_batch_reveal_answer():
+    """Test that every result carries the answer when asked"""
+    import io
+    import json
+    from pywordle.cli import play_batch
+
+    output = io.StringIO()
+    with patch("random.choice", return_value="there"):
+        play_batch(['{"guesses": []}'], output, reveal_answer=True)
+    assert json.loads(output.getvalue())["answer"] == "there"
+
+
+def test_play_multi_board(capsys):
+    """Test that after a guess only the boards it was played on are shown"""
+    with patch("random.sample", return_value=["hello", "world"]):
+        cli = WordleCLI(boards=2)
+    with patch("builtins.input", side_effect=["world", "hello"]):
+        cli.play()
+    out = capsys.readouterr().out
+    assert " 2: solved!" in out
+    # The second guess only went to the first board
+    assert out.count(" 2: ") == 2
+    assert "Congratulations! You won in 2 attempts!" in out
+    assert "The words were: HELLO, WORLD" in out
+
+
+def test_get_valid_guess_hard_mode(capsys):
+    """Test that guesses breaking hard mode are asked for again"""
+    cli = WordleCLI(hard_mode=True)
+    cli.game.answer = "hello"
+    cli.game.make_guess("world")
+    with patch("builtins.input", side_effect=["lemon", "jello"]):
+        assert cli.get_valid_guess() == "jello"
+    assert "Letter 4 must be L!" in capsys.readouterr().out
+
+
+def test_play_absurdle(capsys):
+    """Test that an Absurdle game plays through the normal CLI"""
+    cli = WordleCLI(absurdle=True)
+    with patch("builtins.input", side_effect=["hello", "quit"]):
+        cli.play()
+    out = capsys.readouterr().out
+    assert re.search(r"\033\[9[0-9]mH\033\[0m", out)
+    assert f"The word was: {cli.game.answer.upper()}" in out
+
+
+def test_play_records_stats(tmp_path, capsys):
+    """Test that a finished game is recorded and the stats shown, a quit one not"""
+    from pywordle.stats import StatsStore
+
+    stats = StatsStore(str(tmp_path / "stats.sqlite3"))
+    try:
+        with patch("random.sample", return_value=["hello", "world"]):
+            cli = WordleCLI(boards=2, stats=stats)
+        with patch("builtins.input", side_effect=["world", "hello"]):
+            cli.play()
+        cli = WordleCLI(stats=stats)
+        with patch("builtins.input", side_effect=["quit"]):
+            cli.play()
+    finally:
+        stats.close()
+    out = capsys.readouterr().out
+    assert "Played 1  Won 100%  Streak 1  Best 1" in out
+    assert " 2: #################### 1" in out
+    assert stats.summary("dordle")["played"] == 1
+    assert stats.summary()["played"] == 0
@@ -0,0 +1,83 @@
+import pytest
+from pywordle import decision_tree
+from pywordle.models.board import Board
+
+ANSWERS = ["hello", "jello", "world", "those", "these", "other", "their", "about", "cello", "hells"]
+GUESSES = sorted(ANSWERS + ["throe", "lathe", "mecca"])
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Keep pattern matrices built by the tests out of the user cache"""
+    monkeypatch.setenv("PYWORDLE_CACHE_DIR", str(tmp_path / "cache"))
+
+
+@pytest.fixture
+def tree_path(tmp_path):
+    """Fixture to build a tree file for the test word lists"""
+    path = tmp_path / "tree.bin"
+    decision_tree.build_tree(path, GUESSES, ANSWERS)
+    return path
+
+
+@pytest.mark.parametrize("answer", ANSWERS)
+def test_tree_solves_every_answer(tree_path, answer):
+    """Test that following the tree always reaches the answer"""
+    tree = decision_tree.DecisionTree(tree_path)
+    board = Board(answer)
+    while not board.won:
+        assert len(board.guesses) < 6
+        board.add_guess(tree.next_guess(board))
+    assert tree.next_guess(board) is None
+
+
+def test_tree_off_path(tree_path):
+    """Test that a board that strayed from the tree gets no suggestion"""
+    tree = decision_tree.DecisionTree(tree_path)
+    board = Board("hello")
+    first = tree.next_guess(board)
+    board.add_guess("mecca" if first != "mecca" else "throe")
+    assert tree.next_guess(board) is None
+
+
+def test_tree_file_format(tree_path, tmp_path):
+    """Test the header check and that nothing is left behind"""
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["cache", "tree.bin"]
+    bad = tmp_path / "bad.bin"
+    bad.write_bytes(b"NOPE" + bytes(12))
+    with pytest.raises(ValueError):
+        decision_tree.DecisionTree(bad)
+
+
+def test_parallel_build_matches_serial(tree_path, tmp_path):
+    """Test that building in a process pool gives the same file"""
+    path = tmp_path / "parallel.bin"
+    decision_tree.build_tree(path, GUESSES, ANSWERS, workers=2)
+    assert path.read_bytes() == tree_path.read_bytes()
+
+
+def test_build_resumes_from_parts(tree_path, tmp_path, monkeypatch):
+    """Test that an interrupted build keeps its checkpoints and skips them"""
+    path = tmp_path / "resumed.bin"
+    build_part = decision_tree._build_part
+    built = []
+
+    def interrupted(candidates, part):
+        if built:
+            raise RuntimeError("interrupted")
+        built.append(part)
+        build_part(candidates, part)
+
+    monkeypatch.setattr(decision_tree, "_build_part", interrupted)
+    with pytest.raises(RuntimeError):
+        decision_tree.build_tree(path, GUESSES, ANSWERS)
+    assert built[0].exists()
+
+    rebuilt = []
+    monkeypatch.setattr(
+        decision_tree, "_build_part", lambda c, part: (rebuilt.append(part), build_part(c, part))
+    )
+    decision_tree.build_tree(path, GUESSES, ANSWERS)
+    assert rebuilt
+    assert built[0] not in rebuilt
+    assert path.read_bytes() == tree_path.read_bytes()
@@ -96,3 +96,88 @@ def test_word_list_validity(word):
     """Test that each word in the word list is valid"""
     assert len(word) == 5  # All words should be 5 letters
     assert word.isalpha()  # All words should be alphabetic
+
+
+@pytest.mark.parametrize(
+    "guesses",
+    [
+        [],
+        ["world", "helps"],
+        ["world"] * MAX_GUESSES,
+        ["world", "hello"],
+    ],
+)
+def test_snapshot_round_trip(guesses):
+    """Test that a game survives being packed into a snapshot"""
+    game = Game("hello")
+    for guess in guesses:
+        game.make_guess(guess)
+    data = game.to_snapshot()
+    assert len(data) == 5 + 4 * len(guesses)
+
+    restored = Game.from_snapshot(data)
+    assert restored.answer == "hello"
+    assert str(restored) == str(game)
+    assert restored.game_over == game.game_over
+    assert restored.won == game.won
+
+
+def test_game_without_candidates():
+    """Test that candidate tracking can be turned off"""
+    game = Game("hello", track_candidates=False)
+    game.make_guess("world")
+    assert game.board.candidates is None
+    assert game.board.remaining is None
+
+
+def test_hard_mode():
+    """Test that hard mode rejects guesses ignoring revealed letters"""
+    game = Game("hello", hard_mode=True)
+    game.make_guess("world")
+    with pytest.raises(ValueError, match="Letter 4 must be L"):
+        game.make_guess("lemon")
+    assert len(game.board.guesses) == 1
+    assert game.hard_mode_violation("jello") is None
+    game.make_guess("hello")
+    assert game.won
+
+
+def test_hard_mode_prefix_and_filter(monkeypatch, tmp_path):
+    """Test greying out prefixes against the filtered dictionary"""
+    from pywordle.models import game as game_module
+
+    dictionary = tmp_path / "words.txt"
+    dictionary.write_text("jello\ncello\nhells\nworld\nlolly\n")
+    monkeypatch.setenv("PYWORDLE_DICTIONARY", str(dictionary))
+    for cached in (game_module.get_lexicon, game_module.allowed_words, game_module.allowed_codes, game_module.get_guess_index):
+        cached.cache_clear()
+    try:
+        game = Game("hello", hard_mode=True)
+        assert game.allows_prefix("w")
+        game.make_guess("world")
+        # "jello", "cello" and "hello" keep L in place 4 and contain O
+        assert len(game.legal_codes()) == 3
+        assert game.allows_prefix("ce")
+        assert not game.allows_prefix("w")
+        assert not game.allows_prefix("lol")
+    finally:
+        for cached in (game_module.get_lexicon, game_module.allowed_words, game_module.allowed_codes, game_module.get_guess_index):
+            cached.cache_clear()
+
+
+def test_hard_mode_snapshot():
+    """Test that hard mode survives a snapshot round trip"""
+    game = Game("hello", hard_mode=True)
+    game.make_guess("world")
+    restored = Game.from_snapshot(game.to_snapshot())
+    assert restored.hard_mode is not None
+    assert restored.hard_mode_violation("lemon") == "Letter 4 must be L"
+    assert Game.from_snapshot(Game("hello").to_snapshot()).hard_mode is None
+
+
+def test_snapshot_rejects_non_ascii_guess():
+    """Test that a guess outside a-z fails the snapshot rather than coming back changed"""
+    game = Game("hello")
+    game.make_guess("héllo")
+    with pytest.raises(ValueError):
+        game.to_snapshot()
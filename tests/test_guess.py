@@ -29,6 +29,28 @@ from pywordle.models.guess import Guess
             ],
         ),
         ("quick", "happy", [(False, False, True)] * 5),  # All absent
+        (
+            "speed",
+            "abide",
+            [
+                (False, False, True),  # s
+                (False, False, True),  # p
+                (False, True, False),  # e, the only e in the answer
+                (False, False, True),  # e, already used up
+                (False, True, False),  # d
+            ],
+        ),
+        (
+            "geese",
+            "those",
+            [
+                (False, False, True),  # g
+                (False, False, True),  # e
+                (False, False, True),  # e, the only e is matched in place
+                (True, False, False),  # s
+                (True, False, False),  # e
+            ],
+        ),
     ],
 )
 def test_guess_states(guess_word, answer, expected_states):
@@ -0,0 +1,36 @@
+import pytest
+from pywordle.models.guess_index import GuessIndex
+from pywordle.models.lexicon import Lexicon
+
+
+@pytest.fixture
+def index():
+    """Fixture to create an index over a few words"""
+    return GuessIndex.from_words(["hello", "world", "zzzzz", "aaaaa"])
+
+
+@pytest.mark.parametrize(
+    "word,expected",
+    [
+        ("hello", True),
+        ("HELLO", True),
+        ("zzzzz", True),
+        ("aaaaa", True),
+        ("helps", False),
+        ("hell", False),
+        ("hellos", False),
+        ("he1lo", False),
+        ("héllo", False),
+    ],
+)
+def test_membership(index, word, expected):
+    """Test looking up words of all shapes"""
+    assert (word in index) == expected
+
+
+def test_from_lexicon():
+    """Test building the index from a lexicon"""
+    index = GuessIndex.from_lexicon(Lexicon.from_words(["apple", "banana", "apple"]))
+    assert len(index) == 1
+    assert "apple" in index
+    assert "banana" not in index
@@ -10,6 +10,9 @@ from pywordle.gui.constants import (
     CELL_MARGIN,
     BOARD_MARGIN,
     KEYBOARD_MARGIN,
+    GRAY,
+    GREEN,
+    YELLOW,
 )
 
 
@@ -159,3 +162,425 @@ def test_window_dimensions(gui):
         + 2 * BOARD_MARGIN
         + 40
     )
+
+
+@pytest.fixture
+def surface_renderer(game_state, event_manager):
+    """Fixture to create a renderer drawing onto an offscreen surface"""
+    pygame.init()
+    game_state.event_manager = event_manager
+    screen = pygame.Surface((800, 800))
+    renderer = Renderer(screen, game_state, 800)
+    yield renderer
+    pygame.quit()
+
+
+def test_renderer_dirty_rects(surface_renderer):
+    """Test that only changed areas are redrawn after the first frame"""
+    game_state = surface_renderer.game_state
+    with patch("pygame.display.flip") as flip, patch("pygame.display.update") as update:
+        surface_renderer.draw()
+        assert flip.call_count == 1
+
+        # Nothing changed, nothing pushed
+        surface_renderer.draw()
+        update.assert_not_called()
+
+        game_state.handle_letter("A")
+        surface_renderer.draw()
+        (rects,), _ = update.call_args
+        assert rects == [surface_renderer.layout.cell_rects[0][0]]
+
+        game_state.message = "Not in word list"
+        surface_renderer.draw()
+        (rects,), _ = update.call_args
+        assert len(rects) == 1 and rects[0].width == 800
+
+        surface_renderer.invalidate()
+        surface_renderer.draw()
+        assert flip.call_count == 2
+
+
+def test_tile_atlas(surface_renderer):
+    """Test that the atlas holds every tile and drawing only blits them"""
+    from pywordle.gui.atlas import TileAtlas
+
+    atlas = TileAtlas(surface_renderer.font)
+    assert atlas.tile("a", GREEN) is atlas.tile("A", GREEN)
+    assert atlas.tile(None, GRAY).get_size() == (CELL_SIZE, CELL_SIZE)
+    assert atlas.tile("ENTER", GRAY).get_width() == CELL_SIZE * 2 + CELL_MARGIN
+    assert len(atlas.tiles) == 4 * (27 + 2)
+
+    atlas.resize(30, 65)
+    assert atlas.tile("Q", YELLOW).get_size() == (30, 30)
+    assert atlas.tile("BACKSPACE", YELLOW).get_size() == (65, 30)
+
+    with patch("pygame.display.flip"), patch("pygame.display.update"):
+        surface_renderer.draw()
+        surface_renderer.game_state.handle_letter("B")
+        surface_renderer.font = MagicMock(wraps=surface_renderer.font)
+        surface_renderer.draw()
+        surface_renderer.font.render.assert_not_called()
+
+
+def test_time_until_update(game_state):
+    """Test the wake-up time for message expiry"""
+    assert not game_state.animating
+    assert game_state.time_until_update() is None
+    with patch("pygame.time.get_ticks", return_value=1000):
+        game_state.message = "Not in word list"
+        game_state.message_time = 1000
+        assert game_state.time_until_update() == 3001
+    with patch("pygame.time.get_ticks", return_value=5000):
+        assert game_state.time_until_update() == 0
+
+
+def test_wait_events(event_manager):
+    """Test blocking for input with and without a timeout"""
+    key = pygame.event.Event(pygame.KEYDOWN, {"key": ord("A"), "unicode": "a"})
+    with patch("pygame.event.wait", return_value=key) as wait, patch(
+        "pygame.event.get", return_value=[key]
+    ):
+        assert event_manager.wait_events(None) == [key, key]
+        wait.assert_called_with(0)
+        event_manager.wait_events(0)
+        wait.assert_called_with(1)
+
+    with patch("pygame.event.wait", return_value=pygame.event.Event(pygame.NOEVENT)):
+        assert event_manager.wait_events(500) == []
+
+    assert event_manager.handle_events([key])
+    assert event_manager.game_state.current_guess == "A"
+
+
+def test_layout_matches_gui(gui):
+    """Test that the GUI, event manager and renderer share one layout"""
+    assert gui.event_manager.layout is gui.layout
+    assert gui.renderer.layout is gui.layout
+    assert gui.layout.cell_rects[0][0].topleft == (BOARD_MARGIN, BOARD_MARGIN)
+
+
+def test_layout_key_at(event_manager):
+    """Test that hit-testing agrees with the key rects, margins included"""
+    layout = event_manager.layout
+    for key, rect in layout.key_rects.items():
+        assert layout.key_at(rect.center) == key
+        assert layout.key_at(rect.topleft) == key
+        assert layout.key_at((rect.right - 1, rect.bottom - 1)) == key
+        assert event_manager.handle_keyboard_click(rect.center) == key
+    q = layout.key_rects["Q"]
+    assert layout.key_at((q.right + 1, q.centery)) is None  # Gap between keys
+    assert layout.key_at((q.left - 1, q.centery)) is None
+    assert layout.key_at((q.centerx, q.bottom + 1)) is None
+    assert layout.key_at(layout.cell_rects[0][0].center) is None
+
+
+def test_layout_resize(event_manager):
+    """Test scaling the layout to a smaller window"""
+    layout = event_manager.layout
+    layout.resize(layout.natural_width // 2, layout.natural_height // 2)
+    assert layout.scale == pytest.approx(0.5, abs=0.01)
+    assert layout.cell_size == CELL_SIZE // 2
+    assert layout.message_rect.bottom == layout.natural_height // 2
+    assert layout.message_rect.collidelist(list(layout.key_rects.values())) == -1
+
+
+def test_message_clear_of_buttons(event_manager):
+    """Test that clearing the message never paints over the keys or buttons"""
+    layout = event_manager.layout
+    assert layout.message_rect.collidelist(list(layout.key_rects.values())) == -1
+    assert layout.message_rect.top >= layout.key_rects["ENTER"].bottom
+    for key, rect in layout.key_rects.items():
+        assert layout.key_at(rect.center) == key
+        assert rect.right <= layout.window_width
+
+
+def test_gui_resize(gui):
+    """Test that a resize event re-lays out and redraws everything"""
+    gui.renderer.screen = pygame.Surface((400, 400))
+    with patch("pygame.display.get_surface", return_value=gui.renderer.screen), patch(
+        "pygame.font.Font"
+    ):
+        gui.event_manager.handle_events([pygame.event.Event(pygame.VIDEORESIZE, {"w": 400, "h": 400})])
+    assert gui.window_width == 400
+    assert gui.layout.window_height == 400
+    assert gui.renderer.full_redraw
+
+
+def test_renderer_key_colors(surface_renderer):
+    """Test that keys take the colour of the best known letter status"""
+    game = surface_renderer.game_state.game
+    game.answer = "hello"
+    with patch("pygame.display.flip"), patch("pygame.display.update") as update:
+        surface_renderer.draw()
+        game.make_guess("world")
+        surface_renderer.draw()
+        (rects,), _ = update.call_args
+    layout = surface_renderer.layout
+    assert surface_renderer.drawn["L"] == GREEN
+    assert surface_renderer.drawn["O"] == YELLOW
+    for key in "WORLD":
+        assert layout.key_rects[key] in rects
+    assert layout.key_rects["Q"] not in rects
+
+
+def test_end_of_game_phases(game_state):
+    """Test playing -> revealing -> result -> new game without blocking"""
+    from pywordle.gui.game_state import PLAYING, REVEALING, RESULT, REVEAL_STEP
+
+    game_state.game.answer = "hello"
+    with patch("pygame.time.get_ticks", return_value=1000):
+        game_state.current_guess = "HELLO"
+        game_state.handle_enter()
+        assert game_state.phase == REVEALING
+        assert game_state.animating
+        assert game_state.revealed_tiles() == 0
+        game_state.handle_letter("A")
+        assert game_state.current_guess == ""
+    with patch("pygame.time.get_ticks", return_value=1000 + 2 * REVEAL_STEP):
+        assert game_state.revealed_tiles() == 2
+        game_state.update()
+        assert game_state.phase == REVEALING
+    with patch("pygame.time.get_ticks", return_value=1000 + 5 * REVEAL_STEP):
+        game_state.update()
+        assert game_state.phase == RESULT
+        assert not game_state.animating
+        assert game_state.message == "Congratulations! You won in 1 attempts!"
+        assert game_state.prompt == "Press ENTER to play again"
+    with patch("pygame.time.get_ticks", return_value=100000):
+        # The result stays up until the player moves on
+        game_state.update()
+        assert game_state.time_until_update() is None
+        assert game_state.message
+
+    old_game = game_state.game
+    game_state.handle_enter()
+    assert game_state.phase == PLAYING
+    assert game_state.game is not old_game
+    assert game_state.message == "" and game_state.prompt == ""
+
+
+def test_enter_skips_reveal(game_state):
+    """Test that ENTER during the reveal jumps straight to the result"""
+    from pywordle.gui.game_state import RESULT
+
+    game_state.game.answer = "hello"
+    for word in ["WORLD", "WORLD", "WORLD", "WORLD", "WORLD", "WORLD"]:
+        game_state.current_guess = word
+        game_state.handle_enter()
+    game_state.handle_enter()
+    assert game_state.phase == RESULT
+    assert game_state.message == "Game Over! The word was: HELLO"
+
+
+def test_render_benchmark(monkeypatch):
+    """Test that the headless benchmark times every phase of every frame"""
+    from pywordle.gui.benchmark import PHASES, find_regressions, run_benchmark
+
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    results = run_benchmark(rounds=1)
+    assert results["frames"] > 0 and results["fps"] > 0
+    assert set(results["phases"]) == set(PHASES)
+    assert results["phases"]["draw_board"]["mean_us"] > 0
+    assert "alloc_bytes_per_frame" in results
+    assert find_regressions(results, results) == []
+
+    slower = {**results, "fps": results["fps"] / 2}
+    slower["phases"] = {**results["phases"], "draw_board": {"mean_us": 1e6}}
+    regressions = find_regressions(slower, results)
+    assert len(regressions) == 2
+    assert regressions[0].startswith("draw_board")
+
+
+def test_layout_multi_board():
+    """Test that boards are laid out in a grid above the keyboard"""
+    from pywordle.gui.layout import Layout
+
+    layout = Layout(EventManager.create_keyboard(), boards=8, rows=13)
+    assert len(layout.board_cell_rects) == 8
+    assert layout.grid_columns == 4 and layout.grid_rows == 2
+    first, fifth = layout.board_cell_rects[0], layout.board_cell_rects[4]
+    assert len(first) == 13
+    assert fifth[0][0].left == first[0][0].left
+    assert fifth[0][0].top > first[-1][0].bottom
+    assert layout.keyboard_top > layout.board_cell_rects[-1][-1][0].bottom
+    assert not first[0][-1].colliderect(layout.board_cell_rects[1][0][0])
+
+
+def test_renderer_skips_unchanged_boards(surface_renderer):
+    """Test that only boards a guess was played on are redrawn"""
+    from pywordle.gui.layout import Layout
+    from pywordle.models.multi_game import MultiGame
+
+    game_state = surface_renderer.game_state
+    game_state.game = MultiGame(["hello", "world"])
+    layout = Layout(EventManager.create_keyboard(), boards=2, rows=game_state.game.max_attempts)
+    surface_renderer._layout = layout
+    surface_renderer.invalidate()
+    with patch("pygame.display.flip"), patch("pygame.display.update") as update:
+        game_state.game.make_guess("world")
+        surface_renderer.draw()
+        game_state.game.make_guess("hello")
+        surface_renderer.draw_cell = MagicMock(wraps=surface_renderer.draw_cell)
+        surface_renderer.draw()
+        (rects,), _ = update.call_args
+    board_rects = [rect for row in layout.board_cell_rects[1] for rect in row]
+    assert not any(rect in rects for rect in board_rects)
+    assert surface_renderer.draw_cell.call_count == 5 * len(layout.board_cell_rects[0])
+
+
+def test_renderer_greys_illegal_hard_mode_letters(surface_renderer):
+    """Test that typed letters no legal hard mode guess starts with are greyed"""
+    from pywordle.gui.constants import DARK_GRAY
+    from pywordle.models.game import Game
+
+    game_state = surface_renderer.game_state
+    game_state.game = Game("hello", hard_mode=True)
+    game_state.game.make_guess("world")
+    row = surface_renderer.layout.cell_rects[1]
+    with patch("pygame.display.flip"), patch("pygame.display.update"):
+        game_state.handle_letter("J")
+        surface_renderer.draw()
+        assert game_state.guess_legal
+        assert surface_renderer.drawn[row[0].topleft] == ("J", GRAY)
+        for letter in "ELX":
+            game_state.handle_letter(letter)
+        surface_renderer.draw()
+        assert not game_state.guess_legal
+        assert surface_renderer.drawn[row[0].topleft] == ("J", DARK_GRAY)
+
+
+def test_game_state_absurdle():
+    """Test that the GUI plays Absurdle through the same handlers"""
+    game_state = GameState(absurdle=True)
+    for letter in "HELLO":
+        game_state.handle_letter(letter)
+    game_state.handle_enter()
+    assert len(game_state.game.board.guesses) == 1
+    assert game_state.game.answer in game_state.game.remaining_answers()
+
+
+def test_hint_worker(monkeypatch, tmp_path):
+    """Test that hints are worked out off the main thread and posted as events"""
+    monkeypatch.setenv("PYWORDLE_CACHE_DIR", str(tmp_path))
+    from pywordle.gui.hints import HINT_EVENT, HintWorker
+    from pywordle.models.game import Game
+
+    posted = []
+    worker = HintWorker(suggest=True, post=posted.append)
+    game = Game("hello")
+    game.make_guess("world")
+    game.make_guess("jello")
+    generation = worker.request(game.board)
+    worker.close(finish=True)
+    remaining = game.board.remaining
+    assert [event.type for event in posted] == [HINT_EVENT] * len(posted)
+    assert all(event.generation == generation for event in posted)
+    assert posted[0].remaining == remaining and posted[0].suggestion is None
+    if remaining > 1:
+        assert posted[-1].suggestion is not None
+
+
+def test_hint_worker_hard_mode_suggests_legal_guesses():
+    """Test that in hard mode only guesses make_guess accepts are suggested"""
+    import solver
+    from pywordle.gui.hints import HintWorker
+    from pywordle.models.game import Game
+
+    game = Game("there", hard_mode=True)
+    game.make_guess("about")
+    assert game.board.remaining > 1
+    ranked = []
+    best_guesses = solver.best_guesses
+
+    def spy(*args, **kwargs):
+        ranked.append(kwargs["guesses"])
+        return best_guesses(*args, **kwargs)
+
+    posted = []
+    worker = HintWorker(suggest=True, post=posted.append)
+    with patch.object(solver, "best_guesses", spy):
+        worker.request(game.board, game.legal_codes())
+        worker.close(finish=True)
+    (guesses,) = ranked
+    assert all(game.hard_mode_violation(word) is None for word in guesses)
+    assert len(guesses) == len(game.legal_codes()) < 10
+    assert posted[-1].suggestion in guesses
+
+
+def test_hint_worker_cancels_older_requests(monkeypatch, tmp_path):
+    """Test that a newer request cancels the one before it"""
+    monkeypatch.setenv("PYWORDLE_CACHE_DIR", str(tmp_path))
+    from pywordle.gui.hints import HintWorker
+    from pywordle.models.game import Game
+
+    posted = []
+    worker = HintWorker(suggest=True, post=posted.append)
+    first = worker.cancel
+    worker.request(Game("hello").board)
+    assert not worker.cancel.is_set() and first.is_set()
+    older = worker.cancel
+    generation = worker.request(Game("world").board)
+    assert older.is_set()
+    worker.close(finish=True)
+    assert posted[-1].generation == generation
+    assert not any(event.suggestion for event in posted if event.generation != generation)
+
+
+def test_game_state_hints(surface_renderer):
+    """Test that hints are asked for after each guess and stale ones dropped"""
+    from pywordle.gui.hints import HINT_EVENT
+
+    game_state = surface_renderer.game_state
+    game_state.game.answer = "hello"
+    game_state.hints = MagicMock()
+    game_state.hints.request.side_effect = [1, 2]
+    game_state.request_hint()
+    for letter in "WORLD":
+        game_state.handle_letter(letter)
+    game_state.handle_enter()
+    assert game_state.hints.request.call_count == 2
+    assert game_state.hint_generation == 2
+
+    game_state.receive_hint(pygame.event.Event(HINT_EVENT, generation=1, remaining=99, suggestion=None))
+    assert game_state.hint == ""
+    game_state.receive_hint(pygame.event.Event(HINT_EVENT, generation=2, remaining=7, suggestion="crane"))
+    assert game_state.hint == "7 words remain - try CRANE"
+
+    with patch("pygame.display.flip"), patch("pygame.display.update") as update:
+        surface_renderer.draw()
+        surface_renderer.draw()
+        update.assert_not_called()
+        game_state.receive_hint(pygame.event.Event(HINT_EVENT, generation=2, remaining=1, suggestion=None))
+        surface_renderer.draw()
+        (rects,), _ = update.call_args
+    assert rects == [surface_renderer.layout.hint_rect]
+    assert game_state.hint == "1 word remains"
+
+
+def test_event_manager_routes_hints(event_manager):
+    """Test that posted hint events reach the game state"""
+    from pywordle.gui.hints import HINT_EVENT
+
+    event_manager.game_state.hint_generation = 3
+    event = pygame.event.Event(HINT_EVENT, generation=3, remaining=12, suggestion=None)
+    assert event_manager.handle_events([event])
+    assert event_manager.game_state.hint == "12 words remain"
+
+
+def test_game_state_records_stats(tmp_path):
+    """Test that a finished game is recorded and its stats shown as the hint"""
+    from pywordle.stats import StatsStore
+
+    stats = StatsStore(str(tmp_path / "stats.sqlite3"))
+    try:
+        game_state = GameState(stats=stats)
+        game_state.game.answer = "hello"
+        for letter in "HELLO":
+            game_state.handle_letter(letter)
+        game_state.handle_enter()
+        assert stats.summary()["played"] == 1
+        game_state.handle_enter()
+        assert game_state.hint == "Played 1  Won 100%  Streak 1  Best 1"
+    finally:
+        stats.close()
@@ -0,0 +1,77 @@
+import random
+import pytest
+import numpy as np
+from pywordle.models.hard_mode import HardMode
+from pywordle.models.lexicon import pack_letters
+from pywordle.models.patterns import encode_words, score_word
+
+
+@pytest.fixture
+def hard_mode():
+    """Fixture with the feedback for "world" and "hello" against "lorry" """
+    hard_mode = HardMode()
+    for word in ["world", "hello"]:
+        hard_mode.update(word, score_word(word, "lorry"))
+    return hard_mode
+
+
+@pytest.mark.parametrize(
+    "word,expected",
+    [
+        ("lorry", None),
+        ("lords", None),
+        ("worry", "Guess must contain L"),
+        ("flory", "Letter 2 must be O"),
+        ("loops", "Letter 3 must be R"),
+        ("borly", "Letter 4 can't be L"),
+        ("lorne", None),
+    ],
+)
+def test_violation(hard_mode, word, expected):
+    """Test each kind of broken constraint"""
+    assert hard_mode.violation(word) == expected
+
+
+def test_required_counts():
+    """Test that a letter revealed several times must be used as often"""
+    hard_mode = HardMode()
+    hard_mode.update("eerie", score_word("eerie", "geese"))
+    assert hard_mode.min_counts[ord("e") - 97] == 3
+    assert hard_mode.violation("geste") == "Guess must contain 3 Es"
+    assert hard_mode.violation("eeree") == "Letter 1 can't be E"
+    assert hard_mode.allows("geese")
+
+
+def test_allows_prefix(hard_mode):
+    """Test that prefixes are rejected as soon as no completion can be legal"""
+    assert hard_mode.allows_prefix("")
+    assert hard_mode.allows_prefix("lo")
+    assert hard_mode.allows_prefix("w")
+    assert not hard_mode.allows_prefix("lx")
+    assert not hard_mode.allows_prefix("borl")
+
+    hard_mode = HardMode()
+    hard_mode.update("abcde", score_word("abcde", "edcba"))
+    # Every letter is required, so no position is left for anything else
+    assert hard_mode.allows_prefix("e")
+    assert not hard_mode.allows_prefix("z")
+
+
+def test_filter_matches_allows(hard_mode):
+    """Test that the batch filter agrees with the per word check"""
+    rng = random.Random(0)
+    words = ["".join(rng.choice("lorydwhesnt") for _ in range(5)) for _ in range(2000)]
+    words += ["lorry", "lords", "lorne"]
+    codes = pack_letters(encode_words(words))
+    mask = hard_mode.filter(codes)
+    assert mask.dtype == bool
+    assert [bool(kept) for kept in mask] == [hard_mode.allows(word) for word in words]
+    assert mask[-3:].all()
+
+
+def test_empty_constraint_allows_everything():
+    """Test that nothing is required before the first guess"""
+    hard_mode = HardMode()
+    codes = pack_letters(encode_words(["hello", "world"]))
+    assert hard_mode.filter(codes).all()
+    assert hard_mode.allows("zzzzz")
@@ -0,0 +1,90 @@
+import atexit
+import json
+import os
+import signal
+import pytest
+from pywordle.instrumentation import Counter, Profiler, enable
+from pywordle.models.board import Board
+from pywordle.models.game import Game
+from pywordle.models.guess import Guess
+
+
+@pytest.fixture
+def profiler():
+    profiler = Profiler()
+    # The models are loaded both as pywordle.models and, by each other, as models
+    profiler.install()
+    profiler.install(prefix="pywordle.")
+    yield profiler
+    profiler.uninstall()
+
+
+def test_counter():
+    """Test calls, totals and power of two histogram buckets"""
+    counter = Counter()
+    for elapsed_ns in (1000, 1500, 3000):
+        counter.add(elapsed_ns, 2)
+    summary = counter.as_dict()
+    assert summary["calls"] == 3
+    assert summary["mean_us"] == pytest.approx(11 / 6)
+    assert summary["max_us"] == 3
+    assert summary["alloc_blocks"] == 6
+    assert summary["histogram"] == [[1.024, 1], [2.048, 1], [4.096, 1]]
+
+
+def test_install_and_uninstall(profiler):
+    """Test that the hot paths are counted while installed and restored after"""
+    make_guess = Game.__dict__["make_guess"]
+    assert make_guess.__wrapped__ is not None
+    game = Game("hello")
+    game.make_guess("world")
+    game.make_guess("hello")
+    functions = profiler.report()["functions"]
+    assert functions["Game.make_guess"]["calls"] == 2
+    assert functions["Board.add_guess"]["calls"] == 2
+    assert functions["Guess.check_guess"]["calls"] == 2
+    assert sum(count for _, count in functions["Game.make_guess"]["histogram"]) == 2
+
+    profiler.uninstall()
+    for cls, name in ((Game, "make_guess"), (Board, "add_guess"), (Guess, "check_guess")):
+        assert not hasattr(vars(cls)[name], "__wrapped__")
+    assert not profiler.patched
+
+
+def test_install_renderer_wildcard():
+    """Test that every draw method of the renderer is wrapped"""
+    from pywordle.gui.renderer import Renderer
+
+    profiler = Profiler()
+    profiler.install(prefix="pywordle.")
+    try:
+        wrapped = {name for cls, name, _ in profiler.patched if cls is Renderer}
+        assert {"draw", "draw_board", "draw_keyboard", "draw_message", "draw_hint"} <= wrapped
+    finally:
+        profiler.uninstall()
+
+
+def test_errors_are_still_counted(profiler):
+    game = Game("hello")
+    with pytest.raises(ValueError):
+        game.make_guess("abc")
+    assert profiler.report()["functions"]["Game.make_guess"]["calls"] == 1
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGUSR1"), reason="needs SIGUSR1")
+def test_enable_dumps_on_signal(tmp_path):
+    """Test that SIGUSR1 writes the counters without stopping"""
+    path = tmp_path / "profile.json"
+    previous = signal.getsignal(signal.SIGUSR1)
+    profiler = enable(str(path))
+    try:
+        profiler.install(prefix="pywordle.")
+        Game("hello").make_guess("world")
+        os.kill(os.getpid(), signal.SIGUSR1)
+        report = json.loads(path.read_text())
+        assert report["pid"] == os.getpid()
+        assert report["functions"]["Game.make_guess"]["calls"] == 1
+    finally:
+        profiler.uninstall()
+        atexit.unregister(profiler.dump)
+        signal.signal(signal.SIGUSR1, previous)
@@ -0,0 +1,75 @@
+import gzip
+import numpy as np
+import pytest
+from pywordle.models.lexicon import (
+    Lexicon,
+    pack_word,
+    unpack_letters,
+    unpack_word,
+    unpack_words,
+)
+from pywordle.models.patterns import encode_words
+
+WORD_FILE = "Hello\nworld\nhello\n  apple \ncan't\ncafé\nzebra\nit\nbanana\n"
+
+
+@pytest.mark.parametrize("word", ["a", "hello", "zzzzz", "abcdefghijkl"])
+def test_pack_round_trip(word):
+    """Test packing and unpacking single words"""
+    assert unpack_word(pack_word(word), len(word)) == word
+
+
+@pytest.mark.parametrize("word", ["héllo", "ßßßßß", "中中中中中", "Hello", "it's"])
+def test_pack_rejects_other_letters(word):
+    """Test that only a-z can be packed"""
+    with pytest.raises(ValueError):
+        pack_word(word)
+
+
+def test_pack_order_is_alphabetical():
+    """Test that packed codes sort like the words they encode"""
+    words = ["apple", "about", "zebra", "hello", "hells"]
+    assert sorted(words, key=pack_word) == sorted(words)
+
+
+def test_unpack_letters_matches_pattern_encoding():
+    """Test that packed words unpack to the pattern engine's encoding"""
+    words = ["hello", "world"]
+    codes = np.array([pack_word(word) for word in words], dtype=np.uint32)
+    assert (unpack_letters(codes) == encode_words(words)).all()
+    assert unpack_words(codes) == words
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_from_file(tmp_path, compress):
+    """Test loading, normalising and bucketing a word file"""
+    path = tmp_path / "words.txt"
+    data = WORD_FILE.encode("utf-8")
+    path.write_bytes(gzip.compress(data) if compress else data)
+
+    lexicon = Lexicon.from_file(path)
+    assert lexicon.words(5) == ["apple", "hello", "world", "zebra"]
+    assert lexicon.words(2) == ["it"]
+    assert lexicon.words(6) == ["banana"]
+    assert lexicon.codes(5).dtype == np.uint32
+    assert lexicon.codes(5).nbytes == 4 * 4
+    assert len(lexicon) == 6
+    assert "HELLO" in lexicon
+    assert "cafe" not in lexicon
+    assert "can't" not in lexicon
+
+
+def test_from_file_length_filter(tmp_path):
+    """Test keeping only some word lengths"""
+    path = tmp_path / "words.txt"
+    path.write_text(WORD_FILE)
+    lexicon = Lexicon.from_file(path, lengths=[5])
+    assert lexicon.lengths == [5]
+    assert "banana" not in lexicon
+
+
+def test_from_words():
+    """Test building a lexicon from str"""
+    lexicon = Lexicon.from_words(["world", "hello", "world"])
+    assert lexicon.words() == ["hello", "world"]
+    assert lexicon.words(7) == []
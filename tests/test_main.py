@@ -0,0 +1,68 @@
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+from pywordle.main import COMMANDS, parse_args
+from pywordle.startup import find_regressions, parse_importtime
+
+PACKAGE_DIR = Path(__file__).resolve().parents[1] / "pywordle"
+
+
+@pytest.mark.parametrize(
+    "argv,loaded,not_loaded",
+    [
+        (["--cli"], "cli", "pygame"),
+        (["--batch"], "cli", "pygame"),
+        ([], "gui.main", "simulate"),
+    ],
+)
+def test_entry_point_imports(argv, loaded, not_loaded):
+    """Test that each mode imports only what it runs"""
+    code = (
+        "import sys, main; "
+        f"main.entry_point(main.parse_args({argv!r})); "
+        f"print({loaded!r} in sys.modules, {not_loaded!r} in sys.modules)"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", code], cwd=PACKAGE_DIR, capture_output=True, text=True, check=True
+    )
+    assert completed.stdout.split()[-2:] == ["True", "False"]
+
+
+def test_parse_args_subcommand():
+    """Test that a subcommand still gets its own arguments"""
+    args = parse_args(["simulate", "--games", "3"])
+    assert args.command == "simulate"
+    assert args.games == 3
+    assert set(COMMANDS) >= {"simulate", "build-tree", "serve"}
+
+
+def test_parse_importtime():
+    """Test reading -X importtime output"""
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       100 |        100 |   _io\n"
+        "import time:        50 |        150 | io\n"
+        "import time:       200 |        200 | cli\n"
+    )
+    imports = parse_importtime(stderr)
+    assert imports == {"  _io": (100, 100), "io": (50, 150), "cli": (200, 200)}
+
+
+def test_startup_regressions():
+    """Test that slow or forbidden imports are reported"""
+    baseline = {"cli": {"import_us": 100_000}}
+    fast = {"cli": {"import_us": 110_000, "forbidden": []}}
+    assert find_regressions(fast, baseline) == []
+    slow = {"cli": {"import_us": 400_000, "forbidden": ["pygame"]}}
+    regressions = find_regressions(slow, baseline)
+    assert regressions == ["cli: imports pygame", "cli: 400ms of imports, baseline 100ms"]
+
+
+def test_profile_option(monkeypatch):
+    """Test that profiling is off by default and on by flag or environment"""
+    monkeypatch.delenv("PYWORDLE_PROFILE", raising=False)
+    assert parse_args([]).profile is None
+    assert parse_args(["--profile", "out.json"]).profile == "out.json"
+    monkeypatch.setenv("PYWORDLE_PROFILE", "env.json")
+    assert parse_args(["--cli"]).profile == "env.json"
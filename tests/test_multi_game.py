@@ -0,0 +1,74 @@
+import pytest
+from unittest.mock import patch
+from pywordle.models.board import KEY_ABSENT, KEY_CORRECT, KEY_PRESENT
+from pywordle.models.multi_game import MultiGame
+from pywordle.models.patterns import score_word
+
+
+@pytest.fixture
+def game():
+    """Fixture to create a Quordle game with known answers"""
+    return MultiGame(["hello", "world", "apple", "there"])
+
+
+def test_multi_game_initialization(game):
+    """Test that a multi-board game gets one board per answer"""
+    assert len(game.boards) == 4
+    assert game.answers == ["hello", "world", "apple", "there"]
+    assert game.max_attempts == 9
+    assert not game.game_over
+    assert MultiGame(boards=2).max_attempts == 7
+
+
+def test_multi_game_batched_scoring(game):
+    """Test that one guess is scored once for every board"""
+    with patch("pywordle.models.multi_game.score_against", wraps=__import__(
+        "pywordle.models.patterns", fromlist=["score_against"]
+    ).score_against) as score:
+        changed = game.make_guess("world")
+    assert score.call_count == 1
+    assert changed == [0, 1, 2, 3]
+    for board in game.boards:
+        assert board.guesses[-1].pattern == score_word("world", board.answer)
+    assert game.boards[1].won
+
+
+def test_multi_game_solved_boards_are_skipped(game):
+    """Test that later guesses only go to unsolved boards"""
+    game.make_guess("world")
+    assert game.make_guess("hello") == [0, 2, 3]
+    assert len(game.boards[1].guesses) == 1
+    assert game.attempts == 2
+
+
+def test_multi_game_win_and_loss(game):
+    """Test that the game is won when every board is solved, else lost at the limit"""
+    for word in ["hello", "world", "apple", "there"]:
+        game.make_guess(word)
+    assert game.won and game.game_over
+
+    lost = MultiGame(["hello", "world"], max_attempts=2)
+    lost.make_guess("apple")
+    lost.make_guess("hello")
+    assert lost.game_over and not lost.won
+    with pytest.raises(ValueError, match="Game is over"):
+        lost.make_guess("world")
+
+
+def test_multi_game_key_status(game):
+    """Test that a letter takes its best status over every board"""
+    game.make_guess("world")
+    status = lambda letter: game.key_status[ord(letter) - 97]
+    assert status("w") == KEY_CORRECT
+    assert status("l") == KEY_CORRECT
+    assert status("o") == KEY_CORRECT
+    game.make_guess("these")
+    assert status("s") == KEY_ABSENT
+    assert status("e") == KEY_CORRECT
+
+
+def test_multi_game_rejects_non_ascii_guess(game):
+    """Test that letters outside a-z are refused with a ValueError"""
+    with pytest.raises(ValueError, match="a-z"):
+        game.make_guess("héllo")
+    assert game.attempts == 0
@@ -0,0 +1,92 @@
+import json
+import threading
+import time
+import numpy as np
+import pytest
+from pywordle.models import pattern_matrix as pm
+from pywordle.models.patterns import score_word
+
+GUESSES = ["hello", "world", "speed", "abide", "geese"]
+ANSWERS = ["those", "erase", "hello"]
+
+
+@pytest.fixture(autouse=True)
+def clear_open_matrices():
+    """Make every test open its matrices from disk"""
+    pm._open_matrices.clear()
+    yield
+    pm._open_matrices.clear()
+
+
+def test_load_builds_and_caches(tmp_path):
+    """Test that the matrix is built once and then reused from disk"""
+    matrix = pm.load_pattern_matrix(GUESSES, ANSWERS, tmp_path)
+    assert isinstance(matrix, np.memmap)
+    assert matrix.dtype == np.uint8
+    for i, guess in enumerate(GUESSES):
+        for j, answer in enumerate(ANSWERS):
+            assert matrix[i, j] == score_word(guess, answer)
+    assert len(list(tmp_path.glob("*.npy"))) == 1
+    assert pm.load_pattern_matrix(GUESSES, ANSWERS, tmp_path) is matrix
+
+
+def test_word_list_change_rebuilds(tmp_path):
+    """Test that changing a word list creates a new matrix"""
+    pm.load_pattern_matrix(GUESSES, ANSWERS, tmp_path)
+    matrix = pm.load_pattern_matrix(GUESSES, ANSWERS[:2], tmp_path)
+    assert matrix.shape == (len(GUESSES), 2)
+    assert len(list(tmp_path.glob("*.npy"))) == 2
+    assert pm.word_lists_key(GUESSES, ANSWERS) != pm.word_lists_key(ANSWERS, GUESSES)
+
+
+def test_build_resumes_partial(tmp_path):
+    """Test that a build picks up rows recorded in the progress file"""
+    path = tmp_path / "matrix.npy"
+    partial = np.lib.format.open_memmap(
+        tmp_path / "matrix.npy.partial", mode="w+", dtype=np.uint8, shape=(5, 3)
+    )
+    partial[:2] = 99  # Rows that would not be rescored
+    partial.flush()
+    del partial
+    (tmp_path / "matrix.npy.progress").write_text(json.dumps({"shape": [5, 3], "rows": 2}))
+
+    pm.build_pattern_matrix(GUESSES, ANSWERS, path, chunk_rows=1)
+    matrix = np.load(path)
+    assert (matrix[:2] == 99).all()
+    assert matrix[4, 2] == score_word("geese", "hello")
+    assert not (tmp_path / "matrix.npy.partial").exists()
+    assert not (tmp_path / "matrix.npy.progress").exists()
+
+
+def test_concurrent_builds(tmp_path, monkeypatch):
+    """Test that builds racing on one path leave a single complete matrix"""
+    path = tmp_path / "matrix.npy"
+    builds = []
+    build = pm._build
+
+    def slow_build(*args):
+        builds.append(args)
+        time.sleep(0.05)  # Let the other threads reach the lock
+        build(*args)
+
+    monkeypatch.setattr(pm, "_build", slow_build)
+    barrier = threading.Barrier(4)
+
+    def start():
+        barrier.wait()
+        pm.build_pattern_matrix(GUESSES, ANSWERS, path, chunk_rows=1)
+
+    threads = [threading.Thread(target=start) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(builds) == 1
+    assert np.load(path)[4, 2] == score_word("geese", "hello")
+    assert not (tmp_path / "matrix.npy.partial").exists()
+
+
+def test_pattern_matrix_lookup(tmp_path):
+    """Test word based lookups"""
+    matrix = pm.PatternMatrix(GUESSES, ANSWERS, tmp_path)
+    assert matrix.pattern("speed", "erase") == score_word("speed", "erase")
@@ -0,0 +1,78 @@
+import itertools
+import pytest
+import numpy as np
+from pywordle.models.patterns import (
+    ABSENT,
+    CORRECT,
+    NUM_PATTERNS,
+    PRESENT,
+    all_correct_code,
+    decode_pattern,
+    encode_pattern,
+    encode_words,
+    score_against,
+    score_batch,
+    score_word,
+)
+
+WORDS = ["hello", "world", "speed", "abide", "geese", "those", "erase", "eerie", "llama", "allay"]
+
+
+@pytest.mark.parametrize(
+    "guess_word,answer,expected_states",
+    [
+        ("hello", "hello", [CORRECT] * 5),
+        ("world", "words", [CORRECT, CORRECT, CORRECT, ABSENT, PRESENT]),
+        ("speed", "abide", [ABSENT, ABSENT, PRESENT, ABSENT, PRESENT]),
+        ("geese", "those", [ABSENT, ABSENT, ABSENT, CORRECT, CORRECT]),
+        ("llama", "allay", [PRESENT, CORRECT, PRESENT, ABSENT, PRESENT]),
+        ("eerie", "erase", [CORRECT, ABSENT, PRESENT, ABSENT, CORRECT]),
+    ],
+)
+def test_score_word(guess_word, answer, expected_states):
+    """Test scoring including the duplicate letter rules"""
+    code = score_word(guess_word, answer)
+    assert decode_pattern(code) == expected_states
+    assert encode_pattern(expected_states) == code
+
+
+def test_pattern_code_range():
+    """Test that pattern codes cover 0 to 3 ** 5 - 1"""
+    assert encode_pattern([ABSENT] * 5) == 0
+    assert encode_pattern([CORRECT] * 5) == all_correct_code() == NUM_PATTERNS - 1
+
+
+def test_encode_words():
+    """Test encoding words as letter indices"""
+    encoded = encode_words(["abcde", "zzzzz"])
+    assert encoded.dtype == np.uint8
+    assert encoded.tolist() == [[0, 1, 2, 3, 4], [25] * 5]
+    with pytest.raises(ValueError):
+        encode_words(["abc"])
+    for word in ["héllo", "hell!"]:
+        with pytest.raises(ValueError, match="a-z"):
+            encode_words([word])
+
+
+def test_score_batch_matches_score_word():
+    """Test that the batched path agrees with the scalar path on every pair"""
+    encoded = encode_words(WORDS)
+    codes = score_batch(encoded, encoded)
+    assert codes.shape == (len(WORDS), len(WORDS))
+    for (i, guess), (j, answer) in itertools.product(enumerate(WORDS), enumerate(WORDS)):
+        assert codes[i, j] == score_word(guess, answer)
+
+
+def test_score_against():
+    """Test scoring one guess against many answers"""
+    codes = score_against("speed", encode_words(WORDS))
+    assert codes.tolist() == [score_word("speed", answer) for answer in WORDS]
+
+
+def test_pattern_states_cached():
+    """Test that the cached tuple form matches decode_pattern"""
+    from pywordle.models.patterns import pattern_states
+
+    for code in range(NUM_PATTERNS):
+        assert list(pattern_states(code)) == decode_pattern(code)
+    assert pattern_states(57) is pattern_states(57)
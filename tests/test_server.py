@@ -0,0 +1,137 @@
+import asyncio
+import json
+import pytest
+from unittest.mock import patch
+from pywordle.server import GameServer
+from pywordle.sessions import SessionStore
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+@pytest.fixture
+def server():
+    """Fixture to create a server whose games all have the answer hello"""
+    game_server = GameServer()
+    with patch("random.choice", return_value="hello"):
+        yield game_server
+
+
+def request(server, **fields):
+    return run(server.handle_line(json.dumps(fields).encode()))
+
+
+def test_create_and_guess(server):
+    """Test playing a session to a win"""
+    created = request(server, op="create", id=7)
+    assert created["ok"] and created["id"] == 7
+    assert created["remaining_attempts"] == 6
+    assert "answer" not in created
+
+    session = created["session"]
+    response = request(server, op="guess", session=session, word="world")
+    assert response["ok"]
+    assert response["guesses"] == ["world"]
+    assert response["states"] == [0, 1, 0, 2, 0]
+
+    response = request(server, op="guess", session=session, word="HELLO")
+    assert response["won"] and response["game_over"]
+    assert response["answer"] == "hello"
+    assert session not in server.sessions
+
+
+def test_state_and_resign(server):
+    """Test reading a session's state and resigning it"""
+    session = request(server, op="create")["session"]
+    assert request(server, op="state", session=session)["guesses"] == []
+    response = request(server, op="resign", session=session)
+    assert response["game_over"] and response["answer"] == "hello"
+    assert not request(server, op="state", session=session)["ok"]
+
+
+@pytest.mark.parametrize(
+    "fields,error",
+    [
+        ({"op": "guess", "session": "nope", "word": "hello"}, "Unknown session"),
+        ({"op": "fly"}, "Unknown op 'fly'"),
+        ({"op": "guess", "word": "abc"}, "Unknown session"),
+        ({"op": "guess", "session": {"a": 1}, "word": "hello"}, "Unknown session"),
+        ({"op": "state", "session": [1]}, "Unknown session"),
+    ],
+)
+def test_errors(server, fields, error):
+    """Test that bad requests get an error response"""
+    response = request(server, **fields)
+    assert not response["ok"]
+    assert response["error"] == error
+
+
+def test_bad_guess_and_bad_json(server):
+    """Test validation of guesses and request lines"""
+    session = request(server, op="create")["session"]
+    assert request(server, op="guess", session=session, word="abc")["error"] == "Guess must be 5 letters"
+    for word in ["héllo", "中中中中中"]:
+        assert request(server, op="guess", session=session, word=word)["error"] == "Guess must be 5 letters"
+    assert not run(server.handle_line(b"not json"))["ok"]
+    assert not run(server.handle_line(b"[1, 2]"))["ok"]
+
+
+def test_unexpected_errors_get_a_response(server):
+    """Test that an unexpected exception still answers the request"""
+    with patch.object(server, "handle_request", side_effect=RuntimeError("boom")):
+        response = request(server, op="create", id=3)
+    assert response == {"ok": False, "error": "Internal error", "id": 3}
+
+
+def test_over_tcp(server):
+    """Test many sessions over one TCP connection"""
+
+    async def scenario():
+        tcp = await server.serve("127.0.0.1", 0)
+        port = tcp.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        for _ in range(20):
+            writer.write(b'{"op": "create"}\n')
+        await writer.drain()
+        sessions = [json.loads(await reader.readline())["session"] for _ in range(20)]
+        for session in sessions:
+            writer.write(json.dumps({"op": "guess", "session": session, "word": "hello"}).encode() + b"\n")
+        await writer.drain()
+        results = [json.loads(await reader.readline()) for _ in sessions]
+        writer.close()
+        tcp.close()
+        await tcp.wait_closed()
+        return sessions, results
+
+    sessions, results = run(scenario())
+    assert len(set(sessions)) == 20
+    assert all(result["won"] for result in results)
+
+
+def test_evicted_session_keeps_playing():
+    """Test that a session snapshotted out of memory can still be played"""
+    game_server = GameServer(sessions=SessionStore(max_hot=1))
+    with patch("random.choice", return_value="hello"):
+        first = request(game_server, op="create")["session"]
+        request(game_server, op="guess", session=first, word="world")
+        request(game_server, op="create")
+        assert first in game_server.sessions.cold
+        response = request(game_server, op="guess", session=first, word="hello")
+    assert response["guesses"] == ["world", "hello"]
+    assert response["won"]
+    stats = request(game_server, op="stats")
+    assert stats["rehydrations"] == 1 and stats["evictions"] >= 1
+
+
+def test_expiry_survives_errors(server):
+    """Test that a failed expiry pass does not stop later ones"""
+
+    async def scenario():
+        task = asyncio.create_task(server.expire_sessions(interval=0))
+        while expire.call_count < 3:
+            await asyncio.sleep(0)
+        task.cancel()
+
+    with patch.object(server.sessions, "expire", side_effect=ValueError("bad snapshot")) as expire:
+        run(scenario())
@@ -0,0 +1,100 @@
+import pytest
+from pywordle.models.game import Game
+from pywordle.sessions import SessionStore
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def make_game(answer="hello", guesses=("world",)):
+    game = Game(answer)
+    for guess in guesses:
+        game.make_guess(guess)
+    return game
+
+
+def test_lru_eviction_and_rehydration(clock):
+    """Test that the least recently used game is snapshotted and rebuilt"""
+    store = SessionStore(max_hot=2, hot_ttl=None, clock=clock)
+    store.put("a", make_game())
+    store.put("b", make_game("world", ["hello"]))
+    store.get("a")
+    store.put("c", make_game())
+    assert list(store.hot) == ["a", "c"]
+    assert list(store.cold) == ["b"]
+    assert store.cold_bytes == len(store.cold["b"][0]) == 9
+
+    game = store.get("b")
+    assert game.answer == "world"
+    assert [str(guess) for guess in game.board.guesses] == ["hello"]
+    assert "b" in store.hot
+    assert store.stats["rehydrations"] == 1
+    assert store.stats["evictions"] == 2  # b, then a to make room for b
+
+
+def test_ttl(clock):
+    """Test that idle games go cold, then away"""
+    store = SessionStore(hot_ttl=10, cold_ttl=100, clock=clock)
+    store.put("a", make_game())
+    clock.now = 5
+    store.put("b", make_game())
+    clock.now = 12
+    store.expire()
+    assert list(store.hot) == ["b"] and list(store.cold) == ["a"]
+    clock.now = 200
+    store.expire()
+    assert len(store) == 0
+    assert store.stats["expirations"] == 2
+    with pytest.raises(KeyError):
+        store.get("a")
+
+
+def test_cold_byte_budget(clock):
+    """Test that the oldest snapshots are dropped beyond the byte budget"""
+    store = SessionStore(max_hot=1, hot_ttl=None, max_cold_bytes=20, clock=clock)
+    for session_id in "abcd":
+        store.put(session_id, make_game())
+    store.expire()
+    assert list(store.cold) == ["b", "c"]
+    assert store.cold_bytes == 18
+
+
+def test_max_hot_must_keep_a_game():
+    """Test that a store with no room for hot games is refused"""
+    with pytest.raises(ValueError):
+        SessionStore(max_hot=0)
+
+
+def test_pop(clock):
+    """Test removing sessions whether hot or cold"""
+    store = SessionStore(max_hot=1, clock=clock)
+    store.put("a", make_game())
+    store.put("b", make_game())
+    store.pop("a")
+    store.pop("b")
+    assert len(store) == 0
+    assert store.cold_bytes == 0
+
+
+def test_failed_eviction_keeps_session(clock):
+    """Test that a game which cannot be snapshotted stays hot and playable"""
+    store = SessionStore(max_hot=1, hot_ttl=None, clock=clock)
+    store.put("a", make_game(guesses=["héllo"]))
+    with pytest.raises(ValueError):
+        store.put("b", make_game())
+    assert "a" in store.hot
+    assert store.cold_bytes == store.evictions == 0
+    game = store.get("a")
+    assert [str(guess) for guess in game.board.guesses] == ["héllo"]
+    game.make_guess("hello")
+    assert game.won
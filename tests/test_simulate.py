@@ -0,0 +1,89 @@
+import pytest
+from pywordle import simulate
+from pywordle.models.game import MAX_GUESSES, WORD_LIST
+from pywordle.models.patterns import encode_words, score_batch
+
+GUESSES = sorted(WORD_LIST + ["throe", "lathe"])
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Keep pattern matrices built by the tests out of the user cache"""
+    monkeypatch.setenv("PYWORDLE_CACHE_DIR", str(tmp_path))
+
+
+@pytest.fixture
+def context():
+    """Fixture to create a context with an in-memory matrix"""
+    matrix = score_batch(encode_words(GUESSES), encode_words(WORD_LIST))
+    return simulate.SimulationContext(GUESSES, WORD_LIST, matrix)
+
+
+@pytest.mark.parametrize("strategy", ["first", "random", "entropy"])
+def test_play_every_answer(context, strategy):
+    """Test that the built in strategies solve every answer of the word list"""
+    for column, answer in enumerate(WORD_LIST):
+        result = simulate.play_game(context, column, simulate.make_strategy(strategy, seed=1))
+        assert result.answer == answer
+        assert result.solved
+        assert result.guesses[-1] == answer
+        assert len(result.guesses) <= MAX_GUESSES
+
+
+def test_unknown_strategy():
+    """Test that unknown strategy names are rejected"""
+    with pytest.raises(ValueError):
+        simulate.make_strategy("psychic")
+
+
+def test_max_guesses_must_be_positive(context):
+    """Test that a game needs at least one guess to be simulated"""
+    with pytest.raises(ValueError, match="max_guesses"):
+        next(simulate.simulate("first", games=1, max_guesses=0))
+    result = simulate.play_game(context, 0, simulate.make_strategy("first"), max_guesses=0)
+    assert result.guesses == [] and not result.solved
+
+
+def test_context_requires_answers_in_guesses():
+    """Test that every answer must be a possible guess"""
+    with pytest.raises(ValueError):
+        simulate.SimulationContext(["hello"], ["world"], None)
+
+
+def test_simulate_summary():
+    """Test playing the whole answer list and summarising it"""
+    summary = simulate.summarize(simulate.simulate("entropy", guesses=GUESSES))
+    assert summary.games == len(WORD_LIST)
+    assert summary.failure_rate == 0
+    assert sum(summary.distribution.values()) == summary.solved
+    assert summary.to_dict()["games"] == len(WORD_LIST)
+
+
+def test_simulate_seeded_games():
+    """Test that random games are reproducible from the seed"""
+    first = [r.answer for r in simulate.simulate("first", games=20, seed=3, guesses=GUESSES)]
+    second = [r.answer for r in simulate.simulate("first", games=20, seed=3, guesses=GUESSES)]
+    assert len(first) == 20
+    assert first == second
+
+
+def test_simulate_workers_match_serial():
+    """Test that a process pool gives the same results in the same order"""
+    serial = list(simulate.simulate("entropy", guesses=GUESSES, chunk_size=3))
+    parallel = list(simulate.simulate("entropy", guesses=GUESSES, workers=2, chunk_size=3))
+    assert parallel == serial
+
+
+def test_random_strategy_seeded_per_chunk(monkeypatch):
+    """Test that chunks get their own seeds and results ignore the worker count"""
+    run = dict(games=12, seed=5, guesses=GUESSES, chunk_size=4)
+    serial = [r.guesses for r in simulate.simulate("random", **run)]
+    parallel = [r.guesses for r in simulate.simulate("random", workers=3, **run)]
+    assert parallel == serial
+
+    seeds = []
+    make_strategy = simulate.make_strategy
+    monkeypatch.setattr(simulate, "make_strategy", lambda name, seed: seeds.append(seed) or make_strategy(name, seed))
+    again = [r.guesses for r in simulate.simulate("random", **run)]
+    assert again == serial
+    assert len(seeds) == 3 and len(set(seeds)) == 3
@@ -0,0 +1,105 @@
+import threading
+import pytest
+from unittest.mock import patch
+from pywordle import solver
+from pywordle.models.board import Board
+from pywordle.models.candidates import CandidateIndex
+
+ANSWERS = ["hello", "jello", "world", "those", "these", "other", "their", "about"]
+GUESSES = ANSWERS + ["throe", "lathe", "zzzzz"]
+
+
+@pytest.fixture
+def board():
+    """Fixture to create a board tracking a few candidate answers"""
+    return Board("hello", candidate_index=CandidateIndex(ANSWERS))
+
+
+def test_score_patterns():
+    """Test entropy and expected remaining on a hand-made block"""
+    import numpy as np
+
+    patterns = np.array([[0, 0, 0, 0], [0, 1, 2, 3], [0, 0, 1, 1]], dtype=np.uint8)
+    entropy, expected = solver.score_patterns(patterns)
+    assert entropy.tolist() == pytest.approx([0.0, 2.0, 1.0])
+    assert expected.tolist() == pytest.approx([4.0, 1.0, 2.0])
+
+
+def test_best_guesses_ranking(board):
+    """Test that suggestions are sorted by entropy and useless guesses come last"""
+    suggestions = solver.best_guesses(board, k=len(GUESSES), guesses=GUESSES, workers=1)
+    assert len(suggestions) == len(GUESSES)
+    entropies = [s.entropy for s in suggestions]
+    assert entropies == sorted(entropies, reverse=True)
+    assert suggestions[-1].word == "zzzzz"
+    assert suggestions[-1].entropy == 0
+
+
+def test_best_guesses_expected_remaining(board):
+    """Test ranking by expected remaining candidates"""
+    suggestions = solver.best_guesses(board, guesses=GUESSES, rank_by="expected_remaining", workers=1)
+    expected = [s.expected_remaining for s in suggestions]
+    assert expected == sorted(expected)
+    with pytest.raises(ValueError):
+        solver.best_guesses(board, rank_by="luck")
+
+
+def test_best_guesses_follow_board(board):
+    """Test that suggestions only consider answers left on the board"""
+    board.add_guess("world")
+    suggestions = solver.best_guesses(board, guesses=GUESSES, workers=1)
+    assert {s.word for s in suggestions if s.is_candidate} <= {"hello", "jello"}
+    board.add_guess("jello")
+    assert solver.best_guesses(board, guesses=GUESSES) == [solver.Suggestion("hello", 0.0, 1.0, True)]
+
+
+def test_remaining_candidates_without_index():
+    """Test filtering answers for a board without a candidate index"""
+    board = Board("hello")
+    board.add_guess("world")
+    assert solver.remaining_candidates(board, ANSWERS) == ["hello", "jello"]
+
+
+def test_best_guesses_parallel_matches_serial(board):
+    """Test that the process pool gives the same ranking"""
+    serial = solver.best_guesses(board, k=5, guesses=GUESSES, workers=1)
+    with patch.object(solver, "PARALLEL_MIN_CELLS", 1):
+        parallel = solver.best_guesses(board, k=5, guesses=GUESSES, workers=2)
+    assert parallel == serial
+
+
+def test_best_guesses_cancelled(board):
+    """Test that a search cancelled before scoring anything still ranks the candidates"""
+    cancel = threading.Event()
+    cancel.set()
+    suggestions = solver.best_guesses(board, k=len(GUESSES), guesses=GUESSES, workers=1, cancel=cancel)
+    assert {s.word for s in suggestions} == set(ANSWERS)
+    assert all(s.is_candidate for s in suggestions)
+
+
+def test_best_guesses_zero_budget(board):
+    """Test that a search out of time before any chunk finished still suggests a guess"""
+    board.add_guess("world")
+    assert solver.best_guesses(board, guesses=GUESSES, workers=1, time_budget=0) == [
+        solver.Suggestion("hello", 1.0, 1.0, True),
+        solver.Suggestion("jello", 1.0, 1.0, True),
+    ]
+    with patch.object(solver, "PARALLEL_MIN_CELLS", 1):
+        assert solver.best_guesses(board, guesses=GUESSES, workers=2, time_budget=0)
+
+
+def test_best_guesses_read_the_pattern_matrix(monkeypatch, tmp_path):
+    """Test that default guesses are ranked from the shared matrix, matching scoring"""
+    from pywordle.models.game import Game, WORD_LIST, allowed_words
+
+    monkeypatch.setenv("PYWORDLE_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(solver, "pattern_matrix", solver.pattern_matrix.__wrapped__)
+    game = Game(WORD_LIST[0])
+    candidates = WORD_LIST[:6]
+    with patch.object(solver, "_score_chunk", side_effect=AssertionError("scored again")):
+        from_matrix = solver.best_guesses(game.board, k=10, candidates=candidates, workers=1)
+    scored = solver.best_guesses(game.board, k=10, guesses=allowed_words(), candidates=candidates, workers=1)
+    assert from_matrix == scored
+    assert list(tmp_path.glob("patterns-*.npy"))
+    # Candidates outside the answers fall back to scoring
+    assert solver.matrix_columns(["zzzzz"]) is None
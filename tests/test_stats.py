@@ -0,0 +1,144 @@
+import sqlite3
+import pytest
+from pywordle.models.game import Game
+from pywordle.models.multi_game import MultiGame
+from pywordle.models.modes import mode_name
+from pywordle.stats import StatsStore, Totals, format_summary
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = StatsStore(str(tmp_path / "stats.sqlite3"), flush_interval=0.01)
+    yield store
+    store.close()
+
+
+def play(answer, guesses):
+    game = Game(answer)
+    for guess in guesses:
+        game.make_guess(guess)
+    return game
+
+
+def test_totals():
+    """Test streaks and the guess distribution"""
+    totals = Totals()
+    for won, attempts in [(True, 3), (True, 2), (False, 6), (True, 3)]:
+        totals.add(won, attempts)
+    summary = totals.as_dict()
+    assert summary["played"] == 4 and summary["wins"] == 3
+    assert summary["current_streak"] == 1 and summary["max_streak"] == 2
+    assert summary["distribution"] == [0, 1, 2]
+
+
+def test_record_and_reload(store):
+    """Test that totals are kept in memory and come back from disk"""
+    store.record(play("hello", ["world", "hello"]))
+    store.record(play("world", ["hello"] * 6))
+    store.record(play("hello", ["hello"]))
+    summary = store.summary()
+    assert summary["played"] == 3 and summary["current_streak"] == 1
+    assert summary["distribution"] == [1, 1]
+    assert store.summary("quordle")["played"] == 0
+    store.flush()
+
+    reopened = StatsStore(store.path)
+    try:
+        assert reopened.summary() == summary
+        assert reopened.answer_stats("hello") == {"played": 2, "solved": 2, "mean_guesses": 1.5}
+        assert reopened.answer_stats("world") == {"played": 1, "solved": 0, "mean_guesses": None}
+        assert reopened.answer_stats("crane") is None
+        assert reopened.hardest_answers(1) == [("world", 0.0, None)]
+    finally:
+        reopened.close()
+    journal_mode = sqlite3.connect(store.path).execute("PRAGMA journal_mode").fetchone()[0]
+    assert journal_mode == "wal"
+
+
+def test_games_committed_in_batches(tmp_path):
+    """Test that queued games share transactions and all reach the disk"""
+    store = StatsStore(str(tmp_path / "stats.sqlite3"), batch_size=4, flush_interval=10)
+    commits = []
+    commit = store.commit
+    store.commit = lambda connection, batch: commits.append(len(batch)) or commit(connection, batch)
+    for _ in range(10):
+        store.record(play("hello", ["hello"]))
+    store.close()
+    assert commits == [4, 4, 2]
+    connection = sqlite3.connect(store.path)
+    assert connection.execute("SELECT COUNT(*) FROM games").fetchone() == (10,)
+    assert connection.execute("SELECT played FROM totals").fetchone() == (10,)
+
+
+def test_record_multi_board(store):
+    """Test that every board of a multi-board game counts for its answer"""
+    game = MultiGame(["hello", "world"])
+    game.make_guess("world")
+    game.make_guess("hello")
+    store.record(game, mode_name(boards=2))
+    store.flush()
+    assert store.summary("dordle")["distribution"] == [0, 1]
+    assert store.answer_stats("world")["mean_guesses"] == 1
+    assert store.answer_stats("hello")["mean_guesses"] == 2
+
+
+def test_unfinished_games_are_refused(store):
+    with pytest.raises(ValueError):
+        store.record(Game("hello"))
+
+
+def test_format_summary():
+    summary = {"played": 4, "win_rate": 0.75, "current_streak": 1, "max_streak": 2}
+    assert format_summary(summary) == "Played 4  Won 75%  Streak 1  Best 2"
+
+
+def test_write_errors_do_not_stop_the_writer(store, capsys):
+    """Test that a failed commit is reported and later games still saved"""
+    commit = store.commit
+
+    def locked(connection, batch):
+        store.commit = commit
+        raise sqlite3.OperationalError("database is locked")
+
+    store.commit = locked
+    store.record(play("hello", ["hello"]))
+    store.flush()
+    assert store.errors == 1
+    assert "database is locked" in capsys.readouterr().err
+    store.record(play("hello", ["hello"]))
+    store.flush()
+    assert store.writer.is_alive()
+    assert store.answer_stats("hello")["played"] == 1
+
+
+def test_stores_sharing_a_file_add_up(tmp_path):
+    """Test that two stores on one file add to the totals rather than overwrite them"""
+    path = str(tmp_path / "stats.sqlite3")
+    first = StatsStore(path, flush_interval=0.01)
+    second = StatsStore(path, flush_interval=0.01)
+    try:
+        for store, game in [
+            (first, play("hello", ["hello"])),
+            (second, play("hello", ["world", "hello"])),
+            (first, play("world", ["hello"] * 6)),
+            (second, play("hello", ["hello"])),
+        ]:
+            store.record(game)
+            store.flush()
+        summary = second.summary()
+        assert summary["played"] == 4 and summary["wins"] == 3
+        assert summary["current_streak"] == 1 and summary["max_streak"] == 2
+        assert summary["distribution"] == [2, 1]
+        # The first store catches up on its next commit
+        assert first.summary()["played"] == 3
+        first.record(play("hello", ["hello"]))
+        assert first.summary()["played"] == 4
+        first.flush()
+        assert first.summary()["played"] == 5
+        assert first.summary()["current_streak"] == 2
+    finally:
+        first.close()
+        second.close()
+    connection = sqlite3.connect(path)
+    assert connection.execute("SELECT COUNT(*) FROM games").fetchone() == (5,)
+    assert connection.execute("SELECT played FROM totals").fetchone() == (5,)